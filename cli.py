@@ -1,8 +1,11 @@
 # client.py - Interactive Client with Time Logging
 import asyncio
+import sys
+import threading
 import time
 import logging
-from datetime import datetime
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
 from conduit import Client, ClientDescriptor, data
 
 # Configure time-based logging
@@ -15,15 +18,89 @@ logger = logging.getLogger("CLIENT")
 
 def timestamp():
     """Get current timestamp string."""
-    return datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    t = time.time()
+    return f"{time.strftime('%H:%M:%S', time.localtime(t))}.{int(t * 1000) % 1000:03d}"
+
+# Buffered console output: handlers append here and a background task
+# flushes every 10ms, so bursts of messages cost one write() syscall
+_out = sys.stdout.buffer
+_out_buf = bytearray()
+OUTPUT_FLUSH_SIZE = 4096
+OUTPUT_FLUSH_INTERVAL = 0.01
+
+def write_out(text: str) -> None:
+    """Queue text for the console, flushing once the buffer is large."""
+    _out_buf.extend(text.encode("utf-8"))
+    if len(_out_buf) >= OUTPUT_FLUSH_SIZE:
+        flush_out()
+
+def flush_out() -> None:
+    """Write any buffered console output."""
+    if _out_buf:
+        _out.write(_out_buf)
+        _out.flush()
+        _out_buf.clear()
+
+async def _output_flusher():
+    """Periodically flush buffered console output."""
+    while True:
+        await asyncio.sleep(OUTPUT_FLUSH_INTERVAL)
+        flush_out()
 
 def log(msg: str):
     """Log with timestamp."""
-    print(f"[{timestamp()}] {msg}")
+    write_out(f"[{timestamp()}] {msg}\n")
+
+# === Server RPC Response Models ===
+
+class TimeInfo(BaseModel):
+    timestamp: float
+    formatted: str
+    iso: str
+
+class MethodList(BaseModel):
+    methods: List[Dict[str, Any]]
+    count: int
+
+class ClientInfo(BaseModel):
+    id: str
+    connected_at: Optional[float] = None
+
+class ClientList(BaseModel):
+    count: int
+    clients: List[ClientInfo]
+
+class HelpInfo(BaseModel):
+    rpc_methods: Dict[str, str]
+    message_types: Dict[str, str]
+    usage: str = ""
+
+
+# Maps calc operators to the server's op names in a single translate() pass
+CALC_OPERATORS = str.maketrans({"+": " add ", "-": " sub ", "*": " mul ", "/": " div "})
+CALC_RPCS = frozenset(("add", "sub", "mul", "div"))  # Served as their own RPCs by ser.py
+
+HELP_TEXT = """
+Local Commands:
+  echo <text>      - Echo text
+  reverse <text>   - Reverse text
+  calc <expr>      - Calculate (e.g. 10 + 5)
+  time             - Server time
+  ping             - Latency test
+  chat <msg>       - Send chat
+  broadcast <msg>  - Broadcast to all
+  clients          - List clients
+  info             - List RPC methods
+  help             - This help
+  quit             - Exit
+"""
 
 # Global username (set at start)
 username = "User"
 
+# Set on disconnect so the input loop stops without polling
+disconnected = asyncio.Event()
+
 client = Client(ClientDescriptor(
     server_host="127.0.0.1",
     server_port=9000,
@@ -40,7 +117,7 @@ async def on_chat(msg):
     sender = msg.get("from", "Unknown")
     message = msg.get("message", "")
     server_time = msg.get("timestamp", "")
-    print(f"\r[{timestamp()}] [CHAT] {sender}: {message} (server: {server_time})\n> ", end="", flush=True)
+    write_out(f"\r[{timestamp()}] [CHAT] {sender}: {message} (server: {server_time})\n> ")
 
 @client.on("chat_response")
 async def on_chat_response(msg):
@@ -48,15 +125,15 @@ async def on_chat_response(msg):
 
 @client.on("user_joined")
 async def on_user_joined(msg):
-    print(f"\r[{timestamp()}] [+] User {msg.get('id')} joined\n> ", end="", flush=True)
+    write_out(f"\r[{timestamp()}] [+] User {msg.get('id')} joined\n> ")
 
 @client.on("user_left")
 async def on_user_left(msg):
-    print(f"\r[{timestamp()}] [-] User {msg.get('id')} left\n> ", end="", flush=True)
+    write_out(f"\r[{timestamp()}] [-] User {msg.get('id')} left\n> ")
 
 @client.on("server_status")
 async def on_server_status(msg):
-    print(f"\r[{timestamp()}] [SERVER] {msg.get('clients')} clients online\n> ", end="", flush=True)
+    write_out(f"\r[{timestamp()}] [SERVER] {msg.get('clients')} clients online\n> ")
 
 
 # === Lifecycle ===
@@ -70,157 +147,186 @@ async def on_connect(cli):
 @client.on_disconnect
 async def on_disconnect(cli):
     log("Disconnected from server")
+    disconnected.set()
 
 @client.on_reconnect  
 async def on_reconnect(cli):
     log("Reconnected!")
 
 
-# === Command Handler ===
+# === Command Handlers ===
+
+def elapsed_ms(t0: int) -> float:
+    """Milliseconds elapsed since a perf_counter_ns() reading."""
+    return (time.perf_counter_ns() - t0) * 1e-6
+
+
+async def _cmd_echo(arg: str, t0: int) -> None:
+    if not arg:
+        log("Usage: echo <text>")
+        return
+    result = await client.rpc.call("echo", args=data(message=arg))
+    log(f"Echo: {result} ({elapsed_ms(t0):.2f}ms)")
+
+
+async def _cmd_reverse(arg: str, t0: int) -> None:
+    if not arg:
+        log("Usage: reverse <text>")
+        return
+    result = await client.rpc.call("reverse", args=data(text=arg))
+    log(f"Reversed: {result} ({elapsed_ms(t0):.2f}ms)")
+
+
+async def _cmd_calc(arg: str, t0: int) -> None:
+    p = arg.translate(CALC_OPERATORS).split()
+    if len(p) < 3:
+        log("Usage: calc 10 + 20")
+        return
+    a, op, b = float(p[0]), p[1], float(p[2])
+    if op in CALC_RPCS:
+        result = await client.rpc.call(op, args=data(a=a, b=b))
+    else:
+        result = await client.rpc.call("calculate", args=data(a=a, b=b, op=op))
+    log(f"Result: {result} ({elapsed_ms(t0):.2f}ms)")
+
+
+async def _cmd_time(arg: str, t0: int) -> None:
+    result = await client.rpc.call("get_time", response_type=TimeInfo)
+    log(f"Server time: {result.formatted} ({elapsed_ms(t0):.2f}ms)")
+
+
+async def _cmd_ping(arg: str, t0: int) -> None:
+    await client.send("ping", {"client_time": time.time()})
+    log(f"Ping sent ({elapsed_ms(t0):.2f}ms)")
+
+
+async def _cmd_chat(arg: str, t0: int) -> None:
+    if not arg:
+        log("Usage: chat <message>")
+        return
+    await client.send("chat", {"username": username, "message": arg})
+    log(f"Message sent ({elapsed_ms(t0):.2f}ms)")
+
+
+async def _cmd_info(arg: str, t0: int) -> None:
+    result = await client.rpc.call("listall", response_type=MethodList)
+    log(f"RPC methods: {[m['name'] for m in result.methods]} ({elapsed_ms(t0):.2f}ms)")
+
+
+async def _cmd_broadcast(arg: str, t0: int) -> None:
+    if not arg:
+        log("Usage: broadcast <message>")
+        return
+    result = await client.rpc.call("send_to_all", args=data(message=arg, sender=username))
+    log(f"Broadcast: {result} ({elapsed_ms(t0):.2f}ms)")
+
+
+async def _cmd_clients(arg: str, t0: int) -> None:
+    result = await client.rpc.call("get_clients", response_type=ClientList)
+    log(f"Connected: {result.count} clients ({elapsed_ms(t0):.2f}ms)")
+    for c in result.clients:
+        log(f"  - {c.id}")
+
+
+async def _cmd_help(arg: str, t0: int) -> None:
+    result = await client.rpc.call("help", response_type=HelpInfo)
+    elapsed = elapsed_ms(t0)
+    
+    log("\n=== Server RPC Methods ===")
+    for name, desc in result.rpc_methods.items():
+        log(f"  {name}: {desc}")
+    log("\n=== Message Types ===")
+    for name, desc in result.message_types.items():
+        log(f"  {name}: {desc}")
+    log(f"\n({elapsed:.2f}ms)")
+    
+    log(HELP_TEXT)
+
+
+COMMANDS = {
+    "echo": _cmd_echo,
+    "reverse": _cmd_reverse,
+    "calc": _cmd_calc,
+    "time": _cmd_time,
+    "ping": _cmd_ping,
+    "chat": _cmd_chat,
+    "info": _cmd_info,
+    "broadcast": _cmd_broadcast,
+    "clients": _cmd_clients,
+    "help": _cmd_help,
+}
+
+QUIT_COMMANDS = frozenset(("quit", "exit", "q"))
+
 
 async def handle_command(line: str) -> bool:
     line = line.strip()
     if not line:
         return True
     
-    parts = line.split(" ", 1)
-    cmd = parts[0].lower()
-    arg = parts[1] if len(parts) > 1 else ""
+    cmd, _, arg = line.partition(" ")
+    cmd = cmd.lower()
     
-    start_time = time.time()
+    handler = COMMANDS.get(cmd)
+    if handler is None:
+        if cmd in QUIT_COMMANDS:
+            return False
+        log(f"Unknown command: {cmd}. Type 'help' for commands.")
+        return True
+    
+    t0 = time.perf_counter_ns()
     
     try:
-        if cmd == "echo":
-            if not arg:
-                log("Usage: echo <text>")
-            else:
-                result = await client.rpc.call("echo", args=data(message=arg))
-                elapsed = (time.time() - start_time) * 1000
-                log(f"Echo: {result} ({elapsed:.2f}ms)")
-            
-        elif cmd == "reverse":
-            if not arg:
-                log("Usage: reverse <text>")
-            else:
-                result = await client.rpc.call("reverse", args=data(text=arg))
-                elapsed = (time.time() - start_time) * 1000
-                log(f"Reversed: {result} ({elapsed:.2f}ms)")
-            
-        elif cmd == "calc":
-            nums = arg.replace("+", " add ").replace("-", " sub ").replace("*", " mul ").replace("/", " div ")
-            p = nums.split()
-            if len(p) >= 3:
-                result = await client.rpc.call("calculate", args=data(a=float(p[0]), b=float(p[2]), op=p[1]))
-                elapsed = (time.time() - start_time) * 1000
-                log(f"Result: {result} ({elapsed:.2f}ms)")
-            else:
-                log("Usage: calc 10 + 20")
-                
-        elif cmd == "time":
-            result = await client.rpc.call("get_time")
-            elapsed = (time.time() - start_time) * 1000
-            if isinstance(result, dict) and "formatted" in result:
-                log(f"Server time: {result['formatted']} ({elapsed:.2f}ms)")
-            else:
-                log(f"Server time: {result} ({elapsed:.2f}ms)")
-            
-        elif cmd == "ping":
-            send_time = time.time()
-            await client.send("ping", {"client_time": send_time})
-            elapsed = (time.time() - start_time) * 1000
-            log(f"Ping sent ({elapsed:.2f}ms)")
-            
-        elif cmd == "chat":
-            if not arg:
-                log("Usage: chat <message>")
-            else:
-                await client.send("chat", {"username": username, "message": arg})
-                elapsed = (time.time() - start_time) * 1000
-                log(f"Message sent ({elapsed:.2f}ms)")
-            
-        elif cmd == "info":
-            result = await client.rpc.call("listall")
-            elapsed = (time.time() - start_time) * 1000
-            if isinstance(result, list):
-                log(f"RPC methods: {[m['name'] for m in result]} ({elapsed:.2f}ms)")
-            else:
-                log(f"RPC methods: {result} ({elapsed:.2f}ms)")
-            
-        elif cmd == "broadcast":
-            if not arg:
-                log("Usage: broadcast <message>")
-            else:
-                result = await client.rpc.call("send_to_all", args=data(message=arg, sender=username))
-                elapsed = (time.time() - start_time) * 1000
-                log(f"Broadcast: {result} ({elapsed:.2f}ms)")
-        
-        elif cmd == "clients":
-            result = await client.rpc.call("get_clients")
-            elapsed = (time.time() - start_time) * 1000
-            if isinstance(result, dict):
-                log(f"Connected: {result.get('count', 0)} clients ({elapsed:.2f}ms)")
-                for c in result.get("clients", []):
-                    log(f"  - {c.get('id')}")
-            else:
-                log(f"Clients: {result} ({elapsed:.2f}ms)")
-            
-        elif cmd == "help":
-            result = await client.rpc.call("help")
-            elapsed = (time.time() - start_time) * 1000
-            
-            if isinstance(result, dict):
-                log("\n=== Server RPC Methods ===")
-                for name, desc in result.get("rpc_methods", {}).items():
-                    log(f"  {name}: {desc}")
-                log("\n=== Message Types ===")
-                for name, desc in result.get("message_types", {}).items():
-                    log(f"  {name}: {desc}")
-                log(f"\n({elapsed:.2f}ms)")
-            else:
-                log(f"Help: {result}")
-            
-            log("""
-Local Commands:
-  echo <text>      - Echo text
-  reverse <text>   - Reverse text
-  calc <expr>      - Calculate (e.g. 10 + 5)
-  time             - Server time
-  ping             - Latency test
-  chat <msg>       - Send chat
-  broadcast <msg>  - Broadcast to all
-  clients          - List clients
-  info             - List RPC methods
-  help             - This help
-  quit             - Exit
-""")
-            
-        elif cmd in ("quit", "exit", "q"):
-            return False
-            
-        else:
-            log(f"Unknown command: {cmd}. Type 'help' for commands.")
-            
+        await handler(arg, t0)
     except Exception as e:
-        elapsed = (time.time() - start_time) * 1000
-        log(f"Error: {e} ({elapsed:.2f}ms)")
+        log(f"Error: {e} ({elapsed_ms(t0):.2f}ms)")
     
     return True
 
 
+def _read_stdin(loop: asyncio.AbstractEventLoop, queue: asyncio.Queue) -> None:
+    """Read stdin lines in a single thread and hand them to the event loop."""
+    while True:
+        line = sys.stdin.readline()
+        if not line:
+            # EOF
+            loop.call_soon_threadsafe(queue.put_nowait, None)
+            return
+        loop.call_soon_threadsafe(queue.put_nowait, line)
+
+
 async def input_loop():
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
+    lines: asyncio.Queue = asyncio.Queue()
+    
+    # One long-lived reader thread instead of an executor hop per line
+    threading.Thread(target=_read_stdin, args=(loop, lines), daemon=True).start()
+    
+    disconnect_wait = asyncio.create_task(disconnected.wait())
     
     while client.is_connected:
         try:
-            line = await loop.run_in_executor(None, lambda: input("> "))
+            write_out("> ")
+            flush_out()
+            next_line = asyncio.create_task(lines.get())
+            await asyncio.wait(
+                (next_line, disconnect_wait),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not next_line.done():
+                next_line.cancel()
+                break
+            line = next_line.result()
+            if line is None:
+                break
             if not await handle_command(line):
                 break
-        except EOFError:
-            break
         except Exception as e:
             if client.is_connected:
                 log(f"Input error: {e}")
             break
+    
+    disconnect_wait.cancel()
 
 
 async def main():
@@ -228,22 +334,28 @@ async def main():
     
     # Ask for username
     username = input("Enter your username: ").strip() or "User"
-    log(f"Welcome, {username}!")
-    
-    log("Connecting to server...")
-    connected = await client.connect()
-    if not connected:
-        log("Connection failed!")
-        return
-    
-    log("Type 'help' for available commands.")
+    flusher = asyncio.create_task(_output_flusher())
     
     try:
-        await input_loop()
-    except KeyboardInterrupt:
-        log("Shutting down...")
+        log(f"Welcome, {username}!")
+        
+        log("Connecting to server...")
+        connected = await client.connect()
+        if not connected:
+            log("Connection failed!")
+            return
+        
+        log("Type 'help' for available commands.")
+        
+        try:
+            await input_loop()
+        except KeyboardInterrupt:
+            log("Shutting down...")
+        finally:
+            await client.disconnect()
     finally:
-        await client.disconnect()
+        flusher.cancel()
+        flush_out()
 
 
 if __name__ == "__main__":
@@ -4,7 +4,55 @@ Properly designed with ClientDescriptor configuration
 """
 
 import asyncio
-from conduit import Client, ClientDescriptor
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import tempfile
+from pydantic import BaseModel
+from conduit import Client, ClientDescriptor, data
+
+
+# Optional: uvloop's libuv event loop speeds up socket I/O when installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# Example output goes through a queue and is written to stdout by a
+# background thread, so handlers never block the event loop on print()
+log = logging.getLogger("example_client")
+
+
+def start_log_listener() -> logging.handlers.QueueListener:
+    """Route this example's log output to stdout via a QueueListener thread."""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
+# Typed RPC responses (validated by client.rpc.call(..., response_type=...))
+class ServerInfo(BaseModel):
+    name: str
+    version: str
+    uptime: float
+    active_connections: int
+
+
+class EchoResult(BaseModel):
+    echo: str
+
+
+class CalcResult(BaseModel):
+    result: float
 
 
 async def main():
@@ -60,15 +108,15 @@ async def main():
     @client.on("welcome")
     async def handle_welcome(data):
         """Handle welcome message from server"""
-        print(f"✓ {data['message']}")
-        print(f"  Server: {data['server']}")
-        print(f"  Your ID: {data['your_id']}")
+        log.info(f"✓ {data['message']}")
+        log.info(f"  Server: {data['server']}")
+        log.info(f"  Your ID: {data['your_id']}")
     
     
     @client.on("hello")
     async def handle_hello(data):
         """Handle hello responses"""
-        print(f"[Server] {data}")
+        log.info(f"[Server] {data}")
     
     
     @client.on("chat")
@@ -76,13 +124,13 @@ async def main():
         """Handle chat messages"""
         from_user = data.get("from", "Unknown")
         message = data.get("message")
-        print(f"[{from_user}] {message}")
+        log.info(f"[{from_user}] {message}")
     
     
     @client.on("file_ack")
     async def handle_file_ack(data):
         """Handle file upload acknowledgment"""
-        print(f"✓ File uploaded: {data['filename']} ({data['size']} bytes)")
+        log.info(f"✓ File uploaded: {data['filename']} ({data['size']} bytes)")
     
     
     @client.on("broadcast")
@@ -90,7 +138,7 @@ async def main():
         """Handle broadcast messages"""
         from_id = data.get("from")
         message = data.get("message")
-        print(f"[Broadcast from {from_id}] {message}")
+        log.info(f"[Broadcast from {from_id}] {message}")
     
     
     # ========================================================================
@@ -98,170 +146,176 @@ async def main():
     # ========================================================================
     
     @client.on_connect
-    async def on_connected():
+    async def on_connected(client):
         """Called when successfully connected to server"""
-        print("✓ Connected to server!")
+        log.info("✓ Connected to server!")
     
     
     @client.on_disconnect
-    async def on_disconnected(reason):
+    async def on_disconnected(client):
         """Called when disconnected from server"""
-        print(f"✗ Disconnected: {reason}")
+        log.info("✗ Disconnected")
     
     
     @client.on_reconnect
-    async def on_reconnecting(attempt):
-        """Called when attempting to reconnect"""
-        print(f"⟳ Reconnecting... (Attempt {attempt}/{config.reconnect_attempts})")
-    
-    
-    @client.on_error
-    async def on_error(error):
-        """Called when an error occurs"""
-        print(f"✗ Error: {error}")
+    async def on_reconnected(client):
+        """Called after the client reconnects"""
+        log.info("⟳ Reconnected")
     
     
     # ========================================================================
     # Connect to Server
     # ========================================================================
     
-    print("=" * 60)
-    print(f"{config.name} v{config.version}")
-    print(f"Connecting to {config.server_host}:{config.server_port}")
-    print("=" * 60)
+    log.info("=" * 60)
+    log.info(f"{config.name} v{config.version}")
+    log.info(f"Connecting to {config.server_host}:{config.server_port}")
+    log.info("=" * 60)
     
     try:
-        # Connect to server
+        # Connect to server (register for the welcome first so it can't be missed)
+        welcome = client.expect("welcome")
         await client.connect()
         
-        # Wait a bit for welcome message
-        await asyncio.sleep(0.5)
+        # Wait for the welcome message
+        await asyncio.wait_for(welcome, timeout=2.0)
         
         
         # ====================================================================
         # Example 1: Simple messaging
         # ====================================================================
-        print("\n[Example 1] Simple Messaging")
-        print("-" * 60)
+        log.info("\n[Example 1] Simple Messaging")
+        log.info("-" * 60)
         
-        await client.send("hello", "Hi server!")
-        await asyncio.sleep(0.3)
+        # Each call returns as soon as the server's reply arrives
+        await client.send_and_wait("hello", "Hi server!", ack_event="hello", timeout=2.0)
         
-        await client.send("chat", {
+        await client.send_and_wait("chat", {
             "username": "Alice",
             "message": "Hello from the client!"
-        })
-        await asyncio.sleep(0.3)
+        }, ack_event="chat", timeout=2.0)
         
         
         # ====================================================================
         # Example 2: RPC Calls
         # ====================================================================
-        print("\n[Example 2] RPC Calls")
-        print("-" * 60)
-        # uhhh for response handling also use data structures like JSON and give the data parsed not that the user has to manually parse
-        # Get server info
-        server_info = await client.call("get_server_info")
-        print(f"Server Info:")
-        print(f"  Name: {server_info['name']}")
-        print(f"  Version: {server_info['version']}")
-        print(f"  Uptime: {server_info['uptime']:.2f}s")
-        print(f"  Connections: {server_info['active_connections']}")
+        log.info("\n[Example 2] RPC Calls")
+        log.info("-" * 60)
+        # Get server info (parsed straight into a typed model)
+        server_info = await client.rpc.call("get_server_info", response_type=ServerInfo)
+        log.info(f"Server Info:")
+        log.info(f"  Name: {server_info.name}")
+        log.info(f"  Version: {server_info.version}")
+        log.info(f"  Uptime: {server_info.uptime:.2f}s")
+        log.info(f"  Connections: {server_info.active_connections}")
         
         # Echo test
-        echo_result = await client.call("echo", message="Test message")
-        print(f"Echo: {echo_result['echo']}")
+        echo_result = await client.rpc.call(
+            "echo", args=data(message="Test message"), response_type=EchoResult
+        )
+        log.info(f"Echo: {echo_result.echo}")
         
         # Calculation
-        calc_result = await client.call("calculate", operation="add", a=15, b=27)
-        print(f"15 + 27 = {calc_result['result']}")
+        calc_result = await client.rpc.call(
+            "add", args=data(a=15, b=27), response_type=CalcResult
+        )
+        log.info(f"15 + 27 = {calc_result.result:g}")
         
-        calc_result = await client.call("calculate", operation="multiply", a=6, b=7)
-        print(f"6 × 7 = {calc_result['result']}")
+        calc_result = await client.rpc.call(
+            "multiply", args=data(a=6, b=7), response_type=CalcResult
+        )
+        log.info(f"6 × 7 = {calc_result.result:g}")
         
         
         # ====================================================================
         # Example 3: File Transfer
         # ====================================================================
-        print("\n[Example 3] File Transfer")
-        print("-" * 60)
+        log.info("\n[Example 3] File Transfer")
+        log.info("-" * 60)
         
         # Create test file
         test_data = b"Hello from Conduit!\nThis is a test file.\n" * 100
-        test_filename = "test_file.txt"
+        test_path = os.path.join(tempfile.mkdtemp(), "test_file.txt")
+        with open(test_path, "wb") as f:
+            f.write(test_data)
         
-        print(f"Sending file: {test_filename} ({len(test_data)} bytes)")
+        log.info(f"Sending file: {os.path.basename(test_path)} ({len(test_data)} bytes)")
         
-        await client.send("file", {
-            "filename": test_filename,
-            "content": test_data
-        })
+        # Streamed as 1KB "file_chunk" messages instead of one large frame
+        file_ack = client.expect("file_ack")
+        await client.send_file(test_path, chunk_size=1024)
         
-        await asyncio.sleep(0.5)
+        await asyncio.wait_for(file_ack, timeout=5.0)
         
         
         # ====================================================================
         # Example 4: Streaming Messages
         # ====================================================================
-        print("\n[Example 4] Streaming Messages")
-        print("-" * 60)
+        log.info("\n[Example 4] Streaming Messages")
+        log.info("-" * 60)
         
         for i in range(5):
-            await client.send("hello", f"Stream message {i+1}")
-            await asyncio.sleep(0.2)
+            await client.send_and_wait("hello", f"Stream message {i+1}", ack_event="hello", timeout=2.0)
         
         
         # ====================================================================
         # Example 5: Broadcasting
         # ====================================================================
-        print("\n[Example 5] Broadcasting")
-        print("-" * 60)
+        log.info("\n[Example 5] Broadcasting")
+        log.info("-" * 60)
         # for sending commands to the server use rpc = RPC()
         # commands = rpc.call("listall")
         # print(commands) 
         # now lets say it has the echo command then the LOC ( line of code  ) will be# 
         # print(rpc.call("echo", args=data(message="Hello from the client!", other args ...)))
         # THE DATA COMMAND will convert it into a proper data structure and then send it to the server//
+        # The server excludes the sender, so there is no reply to wait for
         await client.send("broadcast", {
             "message": "Hello to all connected clients!"
         })
-        
-        await asyncio.sleep(0.5)
+        await client.flush(timeout=2.0)
         
         
         # ====================================================================
         # Example 6: Connection Health
         # ====================================================================
-        print("\n[Example 6] Connection Health")
-        print("-" * 60)
+        log.info("\n[Example 6] Connection Health")
+        log.info("-" * 60)
         
         health = client.get_health()
-        print(f"Connection Health:")
-        print(f"  RTT: {health.rtt_ms:.2f}ms")
-        print(f"  Bytes sent: {health.bytes_sent}")
-        print(f"  Bytes received: {health.bytes_received}")
-        print(f"  Messages sent: {health.messages_sent}")
-        print(f"  Messages received: {health.messages_received}")
-        print(f"  Last heartbeat: {health.last_heartbeat}")
+        log.info(f"Connection Health:")
+        log.info(f"  RTT: {health.latency_ms:.2f}ms")
+        log.info(f"  Bytes sent: {health.bytes_sent}")
+        log.info(f"  Bytes received: {health.bytes_received}")
+        log.info(f"  Messages sent: {health.messages_sent}")
+        log.info(f"  Messages received: {health.messages_received}")
+        log.info(f"  Last heartbeat: {health.last_heartbeat_received}")
         
         
         # Keep connection alive for a bit
-        print("\n[Keeping connection alive for 5 seconds...]")
+        log.info("\n[Keeping connection alive for 5 seconds...]")
         await asyncio.sleep(5)
         
         
     except ConnectionError as e:
-        print(f"\n✗ Connection error: {e}")
+        log.info(f"\n✗ Connection error: {e}")
     except TimeoutError:
-        print(f"\n✗ Operation timed out")
+        log.info(f"\n✗ Operation timed out")
     except Exception as e:
-        print(f"\n✗ Unexpected error: {e}")
+        log.info(f"\n✗ Unexpected error: {e}")
     finally:
         # Always disconnect cleanly
-        print("\nDisconnecting...")
+        log.info("\nDisconnecting...")
         await client.disconnect()
-        print("✓ Disconnected cleanly")
+        log.info("✓ Disconnected cleanly")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    listener = start_log_listener()
+    try:
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
+    finally:
+        listener.stop()
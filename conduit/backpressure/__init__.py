@@ -5,5 +5,6 @@ Flow control for preventing buffer overflow.
 """
 
 from .flow_control import FlowController, BackpressureState
+from .adaptive import AdaptiveDepth
 
-__all__ = ["FlowController", "BackpressureState"]
+__all__ = ["FlowController", "BackpressureState", "AdaptiveDepth"]
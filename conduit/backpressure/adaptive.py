@@ -0,0 +1,79 @@
+"""
+Adaptive Queue Depth
+
+AIMD limit on how many frames may wait in a connection's send queue.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveDepth:
+    """
+    Additive-increase / multiplicative-decrease send queue limit.
+    
+    The write loop reports how long each socket write took to drain. While
+    the smoothed latency stays under the target the limit grows by one per
+    write; once it goes over, the limit shrinks by ``decrease`` so a slow
+    peer stops accumulating a deep backlog.
+    """
+    
+    __slots__ = ("max_depth", "min_depth", "target_latency", "decrease", "alpha", "_depth", "_latency")
+    
+    def __init__(
+        self,
+        max_depth: int,
+        min_depth: int = 16,
+        target_latency: float = 0.002,
+        decrease: float = 0.8,
+        alpha: float = 0.2,
+    ):
+        """
+        Initialize limit.
+        
+        Args:
+            max_depth: Upper bound (the send queue size); also the start value
+            min_depth: Lower bound
+            target_latency: Drain latency in seconds above which the limit shrinks
+            decrease: Factor the limit is multiplied by on a breach
+            alpha: Weight of the newest sample in the latency average
+        """
+        self.max_depth = max_depth
+        self.min_depth = min(min_depth, max_depth)
+        self.target_latency = target_latency
+        self.decrease = decrease
+        self.alpha = alpha
+        self._depth = max_depth
+        self._latency = 0.0
+    
+    def record(self, latency: float) -> int:
+        """
+        Record a write's drain latency and adjust the limit.
+        
+        Args:
+            latency: Seconds the write took to drain
+            
+        Returns:
+            New limit
+        """
+        self._latency += self.alpha * (latency - self._latency)
+        if self._latency < self.target_latency:
+            if self._depth < self.max_depth:
+                self._depth += 1
+        else:
+            depth = max(self.min_depth, int(self._depth * self.decrease))
+            if depth != self._depth:
+                logger.debug(f"Send queue limit {self._depth} -> {depth} (latency {self._latency * 1000:.2f}ms)")
+                self._depth = depth
+        return self._depth
+    
+    @property
+    def depth(self) -> int:
+        """Current limit."""
+        return self._depth
+    
+    @property
+    def latency(self) -> float:
+        """Smoothed drain latency in seconds."""
+        return self._latency
@@ -6,19 +6,32 @@ The main client class for connecting to Conduit servers.
 
 import asyncio
 import hashlib
+import os
+import random
+import ssl
 import time
+from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Awaitable, Union
 import logging
 
 from .data.descriptors import ClientDescriptor
+from .data.connection import ConnectionHealth, ConnectionState as HealthState
 from .transport import TCPSocket, ConnectionStateMachine, ConnectionState, TLSConfig, create_client_ssl_context
 from .protocol import ProtocolEncoder, ProtocolDecoder, MessageType, DecodedMessage
 from .connection import Connection
-from .messages import MessageRouter, Message
+from .messages import MessageRouter
 from .rpc import RPC, data
 
 logger = logging.getLogger(__name__)
 
+# OS-entropy RNG so clients on one host (or forked workers) don't reconnect in lockstep
+_jitter_rng = random.SystemRandom()
+
+
+def _to_datetime(timestamp: Optional[float]) -> Optional[datetime]:
+    """Convert an optional epoch timestamp to a datetime."""
+    return datetime.fromtimestamp(timestamp) if timestamp is not None else None
+
 
 # Callback types
 LifecycleHook = Callable[['Client'], Awaitable[None]]
@@ -57,13 +70,22 @@ class Client:
         """
         self._config = config
         
+        # Sent in every auth request; hashed once rather than per (re)connect
+        self._password_hash = hashlib.sha256(config.password.encode('utf-8')).hexdigest()
+        
+        # TLS context; built on first connect and reused across reconnects
+        self._ssl_context: Optional[ssl.SSLContext] = config.ssl_context
+        
         # State
         self._state = ConnectionStateMachine()
         self._socket: Optional[TCPSocket] = None
         self._connection: Optional[Connection] = None
         
         # Protocol
-        self._encoder = ProtocolEncoder(enable_compression=config.enable_compression)
+        self._encoder = ProtocolEncoder(
+            enable_compression=config.enable_compression,
+            compression_algorithm=config.compression_algorithm,
+        )
         self._decoder = ProtocolDecoder()
         
         # Message routing
@@ -75,6 +97,9 @@ class Client:
         # Pending RPC responses
         self._pending_rpcs: Dict[int, asyncio.Future] = {}
         
+        # Futures waiting for the next message of a type (see expect())
+        self._event_waiters: Dict[str, List[asyncio.Future]] = {}
+        
         # Session info
         self._session_token: Optional[str] = None
         self._server_info: Dict[str, Any] = {}
@@ -159,17 +184,22 @@ class Client:
             # Create TLS context if SSL enabled
             ssl_context = None
             if self._config.ssl_enabled:
-                tls_config = TLSConfig(
-                    enabled=True,
-                    cert_file=self._config.ssl_cert_file,
-                    key_file=self._config.ssl_key_file,
-                    ca_file=self._config.ssl_ca_file,
-                    verify=self._config.ssl_verify,
-                )
-                ssl_context = create_client_ssl_context(tls_config)
+                if self._ssl_context is None:
+                    tls_config = TLSConfig(
+                        enabled=True,
+                        cert_file=self._config.ssl_cert_file,
+                        key_file=self._config.ssl_key_file,
+                        ca_file=self._config.ssl_ca_file,
+                        verify=self._config.ssl_verify,
+                    )
+                    self._ssl_context = create_client_ssl_context(tls_config)
+                ssl_context = self._ssl_context
                 logger.info("TLS enabled for client connection")
             
             # Connect TCP socket
+            socket_buffer_size = self._config.socket_buffer_size
+            if socket_buffer_size is None:
+                socket_buffer_size = self._config.max_message_size
             self._socket = await TCPSocket.connect(
                 host=self._config.server_host,
                 port=self._config.server_port,
@@ -177,6 +207,7 @@ class Client:
                 use_ipv6=self._config.use_ipv6,
                 buffer_size=self._config.buffer_size,
                 ssl_context=ssl_context,
+                socket_buffer_size=socket_buffer_size,
             )
             
             self._state.start_authenticating()
@@ -195,7 +226,9 @@ class Client:
             self._connection = Connection(
                 socket=self._socket,
                 encoder=self._encoder,
-                decoder=ProtocolDecoder(),
+                # Reuse the auth decoder: it may already hold messages the
+                # server sent right after AUTH_SUCCESS (e.g. a welcome)
+                decoder=self._decoder,
                 send_queue_size=self._config.send_queue_size,
                 receive_queue_size=self._config.receive_queue_size,
                 heartbeat_interval=self._config.heartbeat_interval,
@@ -241,18 +274,17 @@ class Client:
     async def _authenticate(self) -> bool:
         """Perform authentication handshake."""
         # Send auth request
-        password_hash = hashlib.sha256(
-            self._config.password.encode('utf-8')
-        ).hexdigest()
-        
         auth_msg = self._encoder.encode_auth_request(
-            password_hash=password_hash,
+            password_hash=self._password_hash,
             client_info={
                 "name": self._config.name,
                 "version": self._config.version,
             }
         )
         
+        # Drop anything left over from a previous connection
+        self._decoder.clear()
+        
         await self._socket.write(auth_msg)
         
         # Wait for response
@@ -328,7 +360,7 @@ class Client:
             self._reconnect_task = asyncio.create_task(self._reconnect_loop())
     
     async def _reconnect_loop(self) -> None:
-        """Reconnection loop with exponential backoff."""
+        """Reconnection loop with exponential backoff and optional full jitter."""
         delay = self._config.reconnect_delay
         
         while self._should_reconnect:
@@ -341,7 +373,10 @@ class Client:
             logger.info(f"Reconnection attempt {self._reconnect_attempts}...")
             
             # Wait before reconnecting
-            await asyncio.sleep(delay)
+            if self._config.reconnect_jitter:
+                await asyncio.sleep(_jitter_rng.uniform(0, delay))
+            else:
+                await asyncio.sleep(delay)
             
             # Attempt connection
             if await self._do_connect():
@@ -384,13 +419,88 @@ class Client:
             msg_type_str = message.get_message_type_str()
             data = message.get_data()
             
-            msg = Message(type=msg_type_str, data=data)
-            await self._message_router.route(
-                message=msg,
+            # Resolve anyone awaiting this message type
+            waiters = self._event_waiters.pop(msg_type_str, None)
+            if waiters:
+                for future in waiters:
+                    if not future.done():
+                        future.set_result(data)
+                if not self._message_router.has_handler(msg_type_str):
+                    return
+            
+            await self._message_router.route_dict(
+                message_type=msg_type_str,
+                data=data,
                 context=self,
                 authenticated=True,
             )
     
+    def expect(self, message_type: str) -> asyncio.Future:
+        """
+        Get a future resolved with the data of the next message of a type.
+        
+        Registers immediately, so call it before sending whatever triggers
+        the message. Registered handlers still run as usual.
+        
+        Args:
+            message_type: Message type to wait for
+            
+        Returns:
+            Future resolving to the message data
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._event_waiters.setdefault(message_type, []).append(future)
+        future.add_done_callback(lambda f: self._discard_waiter(message_type, f))
+        return future
+    
+    def _discard_waiter(self, message_type: str, future: asyncio.Future) -> None:
+        """Drop a finished (e.g. timed out) waiter."""
+        waiters = self._event_waiters.get(message_type)
+        if waiters and future in waiters:
+            waiters.remove(future)
+            if not waiters:
+                del self._event_waiters[message_type]
+    
+    async def wait_for_event(self, message_type: str, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for the next message of a type.
+        
+        Args:
+            message_type: Message type to wait for
+            timeout: Optional timeout in seconds
+            
+        Returns:
+            The message data
+        """
+        return await asyncio.wait_for(self.expect(message_type), timeout=timeout)
+    
+    async def send_and_wait(
+        self,
+        message_type: str,
+        data: Any,
+        ack_event: str,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Send a message and wait for the reply message type.
+        
+        Args:
+            message_type: Message type to send
+            data: Message data
+            ack_event: Message type of the expected reply
+            timeout: Optional timeout in seconds
+            
+        Returns:
+            The reply's data
+        """
+        reply = self.expect(ack_event)
+        try:
+            await self.send(message_type, data)
+        except BaseException:
+            reply.cancel()
+            raise
+        return await asyncio.wait_for(reply, timeout=timeout)
+    
     # === Sending ===
     
     async def send(self, message_type: str, data: Any) -> None:
@@ -406,6 +516,64 @@ class Client:
         
         await self._connection.send_message(message_type, data)
     
+    async def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until all messages sent so far have been written to the socket.
+        
+        send() only queues a message; use this when you need to know it is out.
+        
+        Args:
+            timeout: Optional timeout in seconds
+        """
+        if not self._connection:
+            raise ConnectionError("Not connected")
+        
+        await self._connection.flush(timeout)
+    
+    async def send_file(
+        self,
+        path: str,
+        chunk_size: int = 64 * 1024,
+        message_type: str = "file_chunk",
+    ) -> int:
+        """
+        Stream a file to the server as a sequence of chunk messages.
+        
+        Each message carries ``{"filename", "seq", "data", "last"}``, so the
+        file is never held in memory whole and no frame exceeds chunk_size.
+        
+        Args:
+            path: Path of the file to send
+            chunk_size: Bytes per chunk message
+            message_type: Message type used for the chunks
+            
+        Returns:
+            Total bytes sent
+        """
+        filename = os.path.basename(path)
+        total = 0
+        seq = 0
+        
+        with open(path, "rb") as f:
+            chunk = f.read(chunk_size)
+            while True:
+                # Read ahead one chunk so the final message can be marked
+                next_chunk = f.read(chunk_size) if chunk else b""
+                last = not next_chunk
+                
+                await self.send(message_type, {
+                    "filename": filename,
+                    "seq": seq,
+                    "data": chunk,
+                    "last": last,
+                })
+                total += len(chunk)
+                seq += 1
+                
+                if last:
+                    return total
+                chunk = next_chunk
+    
     async def _send_rpc_request(self, method: str, params: dict) -> int:
         """
         Internal method to send RPC request.
@@ -479,3 +647,36 @@ class Client:
             "reconnect_attempts": self._reconnect_attempts,
             "server_info": self._server_info,
         }
+    
+    def get_health(self) -> ConnectionHealth:
+        """
+        Get a snapshot of connection health.
+        
+        Returns:
+            Frozen ConnectionHealth with counters, latency and heartbeat times
+        """
+        health = ConnectionHealth(
+            state=HealthState(self._state.state.name.lower()),
+            connected=self._state.is_connected,
+            authenticated=self.is_authenticated,
+            reconnect_count=self._reconnect_attempts,
+        )
+        conn = self._connection
+        if conn is None:
+            return health
+        
+        stats = conn.stats
+        heartbeat = conn.heartbeat.stats
+        return health.model_copy(update={
+            "connected_at": datetime.fromtimestamp(stats.connected_at),
+            "last_heartbeat_sent": _to_datetime(heartbeat.last_ping_sent),
+            "last_heartbeat_received": _to_datetime(heartbeat.last_pong_received),
+            "latency_ms": heartbeat.current_latency_ms,
+            "avg_latency_ms": heartbeat.avg_latency_ms,
+            "messages_sent": stats.messages_sent,
+            "messages_received": stats.messages_received,
+            "bytes_sent": stats.bytes_sent,
+            "bytes_received": stats.bytes_received,
+            "errors": stats.errors,
+            "is_paused": conn.is_paused,
+        })
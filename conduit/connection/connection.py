@@ -7,7 +7,7 @@ Represents a single connection with all associated components.
 import asyncio
 import time
 import uuid
-from typing import Any, Optional, Dict, Callable, Awaitable
+from typing import Any, Optional, Callable, Awaitable
 from dataclasses import dataclass, field
 import logging
 
@@ -16,12 +16,16 @@ from ..transport.auth import Session
 from ..protocol import ProtocolEncoder, ProtocolDecoder, DecodedMessage, MessageType
 from ..messages import MessageQueue
 from ..heartbeat import HeartbeatMonitor
-from ..backpressure import FlowController
+from ..backpressure import FlowController, AdaptiveDepth
+from .pending import PendingRPCTable
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on bytes coalesced into one write by the write loop
+MAX_WRITE_BATCH_BYTES = 1024 * 1024
 
-@dataclass
+
+@dataclass(slots=True)
 class ConnectionStats:
     """Connection statistics."""
     
@@ -50,6 +54,7 @@ class Connection:
         heartbeat_interval: float = 30.0,
         heartbeat_timeout: float = 90.0,
         enable_backpressure: bool = True,
+        adaptive_send_queue: bool = False,
     ):
         """
         Initialize connection.
@@ -63,6 +68,7 @@ class Connection:
             heartbeat_interval: Heartbeat interval
             heartbeat_timeout: Heartbeat timeout
             enable_backpressure: Enable flow control
+            adaptive_send_queue: Tune the send queue limit from write latency (AIMD)
         """
         self._socket = socket
         self._encoder = encoder or ProtocolEncoder()
@@ -85,6 +91,9 @@ class Connection:
         
         # Flow control
         self._flow_controller = FlowController(enabled=enable_backpressure)
+        self._send_depth: Optional[AdaptiveDepth] = (
+            AdaptiveDepth(send_queue_size) if adaptive_send_queue else None
+        )
         
         # Stats
         self._stats = ConnectionStats()
@@ -93,8 +102,11 @@ class Connection:
         self._read_task: Optional[asyncio.Task] = None
         self._write_task: Optional[asyncio.Task] = None
         
-        # Pending RPC responses
-        self._pending_rpcs: Dict[int, asyncio.Future] = {}
+        # Set by the write loop after each batch reaches the socket
+        self._written = asyncio.Event()
+        
+        # Pending RPC responses, sized for a full send queue of requests
+        self._pending_rpcs = PendingRPCTable(send_queue_size)
         
         # Callbacks
         self._on_message: Optional[Callable] = None
@@ -135,6 +147,16 @@ class Connection:
         """Get connection stats."""
         return self._stats
     
+    @property
+    def heartbeat(self) -> HeartbeatMonitor:
+        """Get heartbeat monitor."""
+        return self._heartbeat
+    
+    @property
+    def is_paused(self) -> bool:
+        """Check if sending is paused by backpressure."""
+        return self._flow_controller.is_paused
+    
     def set_session(self, session: Session) -> None:
         """Set session after authentication."""
         self._session = session
@@ -216,9 +238,63 @@ class Connection:
             message_type: Message type string
             data: Message data
         """
-        encoded = self._encoder.encode_message(message_type, data)
+        encoded = await self._encoder.encode_message_async(message_type, data)
         await self._queue_send(encoded)
     
+    async def send_frame(self, frame: bytes) -> None:
+        """
+        Send an already-encoded frame.
+        
+        Lets a broadcast encode a message once and queue the same bytes on
+        every connection.
+        
+        Args:
+            frame: Complete frame from a ProtocolEncoder
+        """
+        await self._queue_send(frame)
+    
+    def send_frame_nowait(self, frame: bytes) -> bool:
+        """
+        Queue an already-encoded frame without waiting.
+        
+        For broadcasts: rather than wait on one slow peer, the frame is
+        dropped when backpressure has paused sending or the send queue is
+        full (or past its adaptive limit, if enabled).
+        
+        Args:
+            frame: Complete frame from a ProtocolEncoder
+            
+        Returns:
+            True if queued, False if dropped
+        """
+        if self._flow_controller.is_paused:
+            return False
+        if self._send_depth is not None and self._send_queue.size >= self._send_depth.depth:
+            return False
+        return self._send_queue.put_nowait(frame)
+    
+    async def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until everything queued so far has been written to the socket.
+        
+        Args:
+            timeout: Optional timeout in seconds
+            
+        Raises:
+            ConnectionError: If the write loop stops before the data is written
+            asyncio.TimeoutError: If the timeout expires
+        """
+        target = self._send_queue.total_enqueued
+        
+        async def wait_written() -> None:
+            while self._stats.messages_sent < target:
+                if self._write_task is None or self._write_task.done():
+                    raise ConnectionError("Connection closed before flush completed")
+                self._written.clear()
+                await self._written.wait()
+        
+        await asyncio.wait_for(wait_written(), timeout=timeout)
+    
     async def send_rpc_request(self, method: str, params: dict) -> int:
         """
         Send an RPC request.
@@ -233,8 +309,8 @@ class Connection:
         encoded, corr_id = self._encoder.encode_rpc_request(method, params)
         
         # Create future for response
-        future = asyncio.get_event_loop().create_future()
-        self._pending_rpcs[corr_id] = future
+        future = asyncio.get_running_loop().create_future()
+        self._pending_rpcs.add(corr_id, future)
         
         await self._queue_send(encoded)
         return corr_id
@@ -256,7 +332,7 @@ class Connection:
         try:
             return await future
         finally:
-            self._pending_rpcs.pop(correlation_id, None)
+            self._pending_rpcs.pop(correlation_id)
     
     async def send_rpc_response(self, result: Any, correlation_id: int) -> None:
         """Send RPC response."""
@@ -278,23 +354,36 @@ class Connection:
     
     async def _read_loop(self) -> None:
         """Read loop - reads from socket and processes messages."""
+        # Bound once; these are hit for every read
+        read = self._socket.read
+        decoder = self._decoder
+        stats = self._stats
+        handle_message = self._handle_message
         try:
+            # The decoder may already hold messages read during the handshake
+            messages = await decoder.decode_all_async()
+            stats.messages_received += len(messages)
+            for message in messages:
+                await handle_message(message)
+            
             while self._state.can_receive:
                 # Read data
-                data = await self._socket.read()
+                data = await read()
                 
                 if not data:
                     logger.debug("Connection closed by remote")
                     break
                 
-                self._stats.bytes_received += len(data)
+                stats.bytes_received += len(data)
                 
                 # Feed to decoder
-                self._decoder.feed(data)
+                decoder.feed(data)
                 
                 # Process all complete messages
-                for message in self._decoder.decode_all():
-                    await self._handle_message(message)
+                messages = await decoder.decode_all_async()
+                stats.messages_received += len(messages)
+                for message in messages:
+                    await handle_message(message)
                 
                 # Check backpressure
                 await self._flow_controller.check_and_update(
@@ -314,33 +403,54 @@ class Connection:
                     pass
     
     async def _write_loop(self) -> None:
-        """Write loop - sends queued messages."""
+        """Write loop - sends queued messages, coalescing any backlog."""
+        queue = self._send_queue
+        write_many = self._socket.write_many
+        stats = self._stats
+        send_depth = self._send_depth
         try:
-            while self._state.can_send or not self._send_queue.is_empty:
+            while self._state.can_send or not queue.is_empty:
                 # Get message from queue
-                data = await self._send_queue.get(timeout=1.0)
+                data = await queue.get(timeout=1.0)
                 
                 if data is None:
                     continue
                 
+                # Take whatever else is already queued into the same write
+                batch = [data]
+                batch_bytes = len(data)
+                while batch_bytes < MAX_WRITE_BATCH_BYTES:
+                    data = queue.get_nowait()
+                    if data is None:
+                        break
+                    batch.append(data)
+                    batch_bytes += len(data)
+                
                 try:
-                    await self._socket.write(data)
-                    self._stats.bytes_sent += len(data)
-                    self._stats.messages_sent += 1
+                    if send_depth is None:
+                        await write_many(batch)
+                    else:
+                        started = time.perf_counter()
+                        await write_many(batch)
+                        send_depth.record(time.perf_counter() - started)
+                    stats.bytes_sent += batch_bytes
+                    stats.messages_sent += len(batch)
+                    self._written.set()
                 except Exception as e:
                     logger.error(f"Write error: {e}")
-                    self._stats.errors += 1
+                    stats.errors += 1
                     break
                     
         except asyncio.CancelledError:
             pass
         except Exception as e:
             logger.error(f"Write loop error: {e}")
+        finally:
+            # Wake any flush() waiters so they can see the loop has stopped
+            self._written.set()
     
     async def _handle_message(self, message: DecodedMessage) -> None:
         """Handle a decoded message."""
-        self._stats.messages_received += 1
-        
         msg_type = message.message_type
         
         # Handle control messages
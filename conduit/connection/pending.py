@@ -0,0 +1,62 @@
+"""
+Pending RPC Table
+
+Tracks futures for in-flight RPC requests by correlation ID.
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+
+
+class PendingRPCTable:
+    """
+    Fixed-size slot table of pending RPC futures.
+    
+    A request lands in slot ``correlation_id & mask``; the full ID is stored
+    alongside so a late response for an old request can never resolve a newer
+    one sharing the slot. If the slot is still busy the future goes to an
+    overflow dict instead, so correctness never depends on the table size.
+    """
+    
+    __slots__ = ("_mask", "_ids", "_futures", "_overflow")
+    
+    def __init__(self, size: int = 1024):
+        """
+        Initialize table.
+        
+        Args:
+            size: Number of slots (rounded up to a power of two)
+        """
+        size = 1 << max(size - 1, 1).bit_length()
+        self._mask = size - 1
+        self._ids: List[int] = [0] * size
+        self._futures: List[Optional[asyncio.Future]] = [None] * size
+        self._overflow: Dict[int, asyncio.Future] = {}
+    
+    def add(self, correlation_id: int, future: asyncio.Future) -> None:
+        """Track a future for a correlation ID."""
+        slot = correlation_id & self._mask
+        if self._futures[slot] is None:
+            self._ids[slot] = correlation_id
+            self._futures[slot] = future
+        else:
+            self._overflow[correlation_id] = future
+    
+    def get(self, correlation_id: int) -> Optional[asyncio.Future]:
+        """Get the future for a correlation ID, or None."""
+        slot = correlation_id & self._mask
+        if self._ids[slot] == correlation_id and self._futures[slot] is not None:
+            return self._futures[slot]
+        return self._overflow.get(correlation_id)
+    
+    def pop(self, correlation_id: int) -> Optional[asyncio.Future]:
+        """Stop tracking a correlation ID and return its future, or None."""
+        slot = correlation_id & self._mask
+        if self._ids[slot] == correlation_id and self._futures[slot] is not None:
+            future = self._futures[slot]
+            self._futures[slot] = None
+            return future
+        return self._overflow.pop(correlation_id, None)
+    
+    def __len__(self) -> int:
+        return sum(f is not None for f in self._futures) + len(self._overflow)
@@ -5,10 +5,11 @@ Manages multiple client connections on the server side.
 """
 
 import asyncio
-from typing import Dict, List, Optional, Set, Callable, Any
+from typing import Collection, Dict, List, Optional, Callable, Any
 import logging
 
 from .connection import Connection
+from ..protocol import ProtocolEncoder
 
 logger = logging.getLogger(__name__)
 
@@ -20,14 +21,16 @@ class ConnectionPool:
     Manages multiple connections, provides broadcast, and cleanup.
     """
     
-    def __init__(self, max_connections: int = 100):
+    def __init__(self, max_connections: int = 100, encoder: Optional[ProtocolEncoder] = None):
         """
         Initialize connection pool.
         
         Args:
             max_connections: Maximum number of connections
+            encoder: Encoder for broadcast frames
         """
         self._max_connections = max_connections
+        self._encoder = encoder or ProtocolEncoder()
         self._connections: Dict[str, Connection] = {}
         self._lock = asyncio.Lock()
         
@@ -121,11 +124,14 @@ class ConnectionPool:
         self,
         message_type: str,
         data: Any,
-        exclude: Optional[Set[str]] = None
+        exclude: Optional[Collection[str]] = None
     ) -> int:
         """
         Broadcast a message to all connections.
         
+        The message is encoded once and the same frame is queued on every
+        connection.
+        
         Args:
             message_type: Message type
             data: Message data
@@ -134,41 +140,49 @@ class ConnectionPool:
         Returns:
             Number of connections message was sent to
         """
-        exclude = exclude or set()
-        count = 0
-        
-        tasks = []
-        for conn_id, conn in self._connections.items():
-            if conn_id not in exclude and conn.is_authenticated:
-                tasks.append(self._send_to_connection(conn, message_type, data))
+        frame = await self._encoder.encode_message_async(message_type, data)
+        return self.broadcast_frame(frame, exclude)
+    
+    def broadcast_frame(
+        self,
+        frame: bytes,
+        exclude: Optional[Collection[str]] = None
+    ) -> int:
+        """
+        Queue an encoded frame on all authenticated connections.
         
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            count = sum(1 for r in results if r is True)
+        Never waits: a connection whose send queue is full or paused by
+        backpressure is skipped, so one slow client cannot hold up the rest.
         
+        Args:
+            frame: Complete frame from a ProtocolEncoder
+            exclude: Set of connection IDs to exclude
+            
+        Returns:
+            Number of connections the frame was queued on
+        """
+        count = 0
+        for conn_id, conn in self._connections.items():
+            if exclude and conn_id in exclude:
+                continue
+            if not conn.is_authenticated:
+                continue
+            if conn.send_frame_nowait(frame):
+                count += 1
+            else:
+                logger.warning(f"Dropped broadcast to {conn_id}: send queue full or paused")
         return count
     
-    async def _send_to_connection(
-        self,
-        connection: Connection,
-        message_type: str,
-        data: Any
-    ) -> bool:
-        """Send to a single connection."""
-        try:
-            await connection.send_message(message_type, data)
-            return True
-        except Exception as e:
-            logger.error(f"Failed to send to {connection.id}: {e}")
-            return False
-    
     async def close_all(self) -> None:
         """Close all connections."""
         async with self._lock:
-            tasks = [conn.stop() for conn in self._connections.values()]
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+            connections = list(self._connections.values())
             self._connections.clear()
+        
+        # Stop outside the lock: each connection's disconnect handler calls
+        # remove(), which would otherwise wait on the lock held here forever
+        if connections:
+            await asyncio.gather(*(conn.stop() for conn in connections), return_exceptions=True)
     
     @property
     def count(self) -> int:
@@ -87,6 +87,7 @@ class ConnectionHealth(BaseModel):
     
     model_config = {
         "extra": "allow",
+        "frozen": True,
     }
     
     def is_healthy(self) -> bool:
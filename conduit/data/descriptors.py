@@ -5,7 +5,8 @@ Configuration objects for Server and Client instances.
 All configuration is validated using Pydantic.
 """
 
-from typing import Optional
+import ssl
+from typing import Literal, Optional
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -25,6 +26,10 @@ class ServerDescriptor(BaseModel):
     host: str = Field(default="0.0.0.0", description="Host address to bind to")
     port: int = Field(default=8080, ge=1, le=65535, description="Port to listen on")
     ipv6: bool = Field(default=False, description="Enable IPv6 support")
+    reuse_port: bool = Field(
+        default=False,
+        description="Set SO_REUSEPORT so several processes can listen on the same port (Linux/BSD)"
+    )
     
     # Authentication
     password: str = Field(..., min_length=1, description="Password for client authentication")
@@ -81,12 +86,20 @@ class ServerDescriptor(BaseModel):
         default=True,
         description="Enable flow control"
     )
+    adaptive_send_queue: bool = Field(
+        default=False,
+        description="Shrink a client's send queue limit while its writes drain slowly (AIMD)"
+    )
     
     # Advanced options
     enable_compression: bool = Field(
         default=False,
         description="Enable compression for large messages"
     )
+    compression_algorithm: Literal["zlib", "zstd"] = Field(
+        default="zlib",
+        description="Codec for compressed messages (zstd requires the zstandard package)"
+    )
     
     # TLS/SSL Configuration
     ssl_enabled: bool = Field(
@@ -109,6 +122,11 @@ class ServerDescriptor(BaseModel):
         default=False,
         description="Require client certificate verification"
     )
+    ssl_context: Optional[ssl.SSLContext] = Field(
+        default=None,
+        exclude=True,
+        description="Prebuilt SSL context to share between servers; used instead of the ssl_* files"
+    )
     
     # Rate Limiting (optional)
     rate_limit_enabled: bool = Field(
@@ -142,6 +160,7 @@ class ServerDescriptor(BaseModel):
     
     model_config = {
         "extra": "forbid",  # Disallow extra fields
+        "arbitrary_types_allowed": True,  # ssl_context
     }
 
 
@@ -198,6 +217,10 @@ class ClientDescriptor(BaseModel):
         ge=1.0,
         description="Multiplier for exponential backoff"
     )
+    reconnect_jitter: bool = Field(
+        default=True,
+        description="Sleep a random time up to the backoff delay (full jitter)"
+    )
     
     # Message configuration
     max_message_size: int = Field(
@@ -210,6 +233,14 @@ class ClientDescriptor(BaseModel):
         ge=1024,
         description="Socket buffer size in bytes"
     )
+    socket_buffer_size: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description=(
+            "Kernel SO_SNDBUF/SO_RCVBUF size in bytes "
+            "(None = max_message_size, 0 = OS default)"
+        )
+    )
     
     # Timeouts
     rpc_timeout: float = Field(
@@ -252,6 +283,10 @@ class ClientDescriptor(BaseModel):
         default=False,
         description="Enable compression for large messages"
     )
+    compression_algorithm: Literal["zlib", "zstd"] = Field(
+        default="zlib",
+        description="Codec for compressed messages (zstd requires the zstandard package)"
+    )
     
     # TLS/SSL Configuration
     ssl_enabled: bool = Field(
@@ -274,6 +309,11 @@ class ClientDescriptor(BaseModel):
         default=None,
         description="Path to client private key for mutual TLS"
     )
+    ssl_context: Optional[ssl.SSLContext] = Field(
+        default=None,
+        exclude=True,
+        description="Prebuilt SSL context to share between clients; used instead of the ssl_* settings"
+    )
     
     protocol_version: str = Field(
         default="1.0",
@@ -300,4 +340,5 @@ class ClientDescriptor(BaseModel):
     
     model_config = {
         "extra": "forbid",  # Disallow extra fields
+        "arbitrary_types_allowed": True,  # ssl_context
     }
@@ -19,7 +19,7 @@ HeartbeatSendCallback = Callable[[], Awaitable[None]]
 HeartbeatTimeoutCallback = Callable[[], Awaitable[None]]
 
 
-@dataclass
+@dataclass(slots=True)
 class HeartbeatStats:
     """Heartbeat statistics."""
     
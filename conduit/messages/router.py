@@ -5,6 +5,7 @@ Routes messages to registered handlers based on message type.
 """
 
 import asyncio
+import inspect
 from typing import Any, Callable, Dict, List, Optional, Awaitable
 from dataclasses import dataclass, field
 import logging
@@ -26,6 +27,11 @@ class RegisteredHandler:
     handler: MessageHandler
     requires_auth: bool = True
     priority: int = 0
+    is_async: bool = field(init=False)
+    
+    def __post_init__(self):
+        # Resolved once here so routing doesn't inspect the handler per message
+        self.is_async = inspect.iscoroutinefunction(self.handler)
 
 
 class MessageRouter:
@@ -44,6 +50,7 @@ class MessageRouter:
         """Initialize router."""
         self._handlers: Dict[str, List[RegisteredHandler]] = {}
         self._default_handler: Optional[MessageHandler] = None
+        self._default_handlers: List[RegisteredHandler] = []
         self._error_handler: Optional[Callable] = None
     
     def on(
@@ -122,6 +129,11 @@ class MessageRouter:
             handler: Default handler function
         """
         self._default_handler = handler
+        self._default_handlers = [RegisteredHandler(
+            message_type="*",
+            handler=handler,
+            requires_auth=False,
+        )]
     
     def set_error_handler(self, handler: Callable) -> None:
         """
@@ -149,17 +161,43 @@ class MessageRouter:
         Returns:
             Response from handler, or None
         """
-        message_type = message.type
+        return await self._dispatch(message.type, message.data, context, authenticated, message)
+    
+    async def route_dict(
+        self,
+        message_type: str,
+        data: Any,
+        context: Any,
+        authenticated: bool = False
+    ) -> Optional[Any]:
+        """
+        Route a message from type and data.
         
-        handlers = self._handlers.get(message_type, [])
+        Convenience method when you don't have a Message object. Used on the
+        receive path, since no Message is built unless a handler fails.
         
-        # Use default handler if no specific handlers
-        if not handlers and self._default_handler:
-            handlers = [RegisteredHandler(
-                message_type=message_type,
-                handler=self._default_handler,
-                requires_auth=False,
-            )]
+        Args:
+            message_type: Type of message
+            data: Message data
+            context: Context object
+            authenticated: Whether authenticated
+            
+        Returns:
+            Handler response
+        """
+        return await self._dispatch(message_type, data, context, authenticated)
+    
+    async def _dispatch(
+        self,
+        message_type: str,
+        data: Any,
+        context: Any,
+        authenticated: bool,
+        message: Optional[Message] = None,
+    ) -> Optional[Any]:
+        """Call the handlers for a message type in priority order."""
+        # Fall back to the default handler if no specific handlers
+        handlers = self._handlers.get(message_type) or self._default_handlers
         
         if not handlers:
             logger.warning(f"No handler for message type: {message_type}")
@@ -174,12 +212,13 @@ class MessageRouter:
                 continue
             
             try:
-                # Call handler
-                response = registered.handler(context, message.data)
-                
-                # Await if coroutine
-                if asyncio.iscoroutine(response):
-                    response = await response
+                # Call handler, awaiting if it is (or returns) a coroutine
+                if registered.is_async:
+                    response = await registered.handler(context, data)
+                else:
+                    response = registered.handler(context, data)
+                    if asyncio.iscoroutine(response):
+                        response = await response
                 
                 result = response
                 
@@ -189,6 +228,8 @@ class MessageRouter:
                 logger.error(f"Error in handler for {message_type}: {e}")
                 
                 if self._error_handler:
+                    if message is None:
+                        message = Message(type=message_type, data=data)
                     try:
                         self._error_handler(e, message, context)
                     except Exception:
@@ -196,30 +237,6 @@ class MessageRouter:
         
         return result
     
-    async def route_dict(
-        self,
-        message_type: str,
-        data: Any,
-        context: Any,
-        authenticated: bool = False
-    ) -> Optional[Any]:
-        """
-        Route a message from type and data.
-        
-        Convenience method when you don't have a Message object.
-        
-        Args:
-            message_type: Type of message
-            data: Message data
-            context: Context object
-            authenticated: Whether authenticated
-            
-        Returns:
-            Handler response
-        """
-        message = Message(type=message_type, data=data)
-        return await self.route(message, context, authenticated)
-    
     def has_handler(self, message_type: str) -> bool:
         """Check if a handler exists for message type."""
         return message_type in self._handlers and len(self._handlers[message_type]) > 0
@@ -232,3 +249,4 @@ class MessageRouter:
         """Clear all handlers."""
         self._handlers.clear()
         self._default_handler = None
+        self._default_handlers = []
@@ -123,11 +123,10 @@ class ClientPool:
     
     async def disconnect_all(self) -> None:
         """Disconnect all clients."""
-        for client in self._clients:
-            try:
-                await client.disconnect()
-            except Exception:
-                pass
+        await asyncio.gather(
+            *(client.disconnect() for client in self._clients),
+            return_exceptions=True,
+        )
         
         self._clients.clear()
         self._stats.active_connections = 0
@@ -210,17 +209,16 @@ class ClientPool:
         """
         from conduit import data
         
-        results = []
-        
-        for client in self._clients:
-            if client.is_connected:
-                try:
-                    result = await client.rpc.call(method, args=data(**params))
-                    results.append(result)
-                except Exception as e:
-                    results.append({"error": str(e)})
+        async def call(client) -> Any:
+            try:
+                return await client.rpc.call(method, args=data(**params))
+            except Exception as e:
+                return {"error": str(e)}
         
-        return results
+        # Calls run concurrently; results keep client order
+        return list(await asyncio.gather(
+            *(call(client) for client in self._clients if client.is_connected)
+        ))
     
     async def send(self, message_type: str, data_dict: dict) -> int:
         """
@@ -243,15 +241,15 @@ class ClientPool:
         Returns:
             Number of clients message was sent to
         """
-        sent = 0
-        for client in self._clients:
-            if client.is_connected:
-                try:
-                    await client.send(message_type, data_dict)
-                    sent += 1
-                except Exception:
-                    pass
-        return sent
+        results = await asyncio.gather(
+            *(
+                client.send(message_type, data_dict)
+                for client in self._clients
+                if client.is_connected
+            ),
+            return_exceptions=True,
+        )
+        return sum(1 for r in results if not isinstance(r, BaseException))
     
     def on(self, message_type: str) -> Callable:
         """
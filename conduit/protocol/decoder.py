@@ -4,15 +4,23 @@ Conduit Protocol Decoder
 Decodes binary messages from the wire format.
 """
 
+import asyncio
+import zlib
 from typing import Any, Optional, Tuple
 import msgpack
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 from .format import (
     MessageHeader,
     MessageType,
     MessageFlags,
     HEADER_SIZE,
     MAX_PAYLOAD_SIZE,
+    OFFLOAD_THRESHOLD,
 )
 
 
@@ -21,6 +29,24 @@ class DecodeError(Exception):
     pass
 
 
+def _decompress(raw_payload: bytes, flags: MessageFlags) -> bytes:
+    """Decompress a COMPRESSED payload with the codec named by its flags."""
+    if flags & MessageFlags.ZSTD:
+        if zstandard is None:
+            raise DecodeError("Received zstd payload but 'zstandard' is not installed")
+        return zstandard.ZstdDecompressor().decompress(raw_payload)
+    return zlib.decompress(raw_payload)
+
+
+def _unpack(header: MessageHeader, raw_payload: bytes) -> 'DecodedMessage':
+    """Deserialize an uncompressed payload into a DecodedMessage."""
+    if raw_payload:
+        payload = msgpack.unpackb(raw_payload, raw=False)
+    else:
+        payload = None
+    return DecodedMessage(header, payload, raw_payload)
+
+
 class IncompleteMessageError(Exception):
     """Message is incomplete, need more data."""
     
@@ -131,44 +157,54 @@ class ProtocolDecoder:
         Returns:
             DecodedMessage if a complete message is available, None otherwise
         """
-        # Need at least a header
-        if len(self._buffer) < HEADER_SIZE:
+        frame = self._take_frame()
+        if frame is None:
             return None
         
+        header, raw_payload = frame
         try:
-            # Parse header
-            header = MessageHeader.from_bytes(bytes(self._buffer[:HEADER_SIZE]))
-            header.validate()
-            
-            # Calculate total message size
-            total_size = HEADER_SIZE + header.content_length
-            
-            # Check if we have the complete message
-            if len(self._buffer) < total_size:
-                return None
-            
-            # Extract payload
-            raw_payload = bytes(self._buffer[HEADER_SIZE:total_size])
-            
-            # Remove message from buffer
-            del self._buffer[:total_size]
-            
             # Decompress if needed
             if header.flags & MessageFlags.COMPRESSED:
-                import zlib
-                raw_payload = zlib.decompress(raw_payload)
+                raw_payload = _decompress(raw_payload, header.flags)
             
-            # Deserialize payload
-            if raw_payload:
-                payload = msgpack.unpackb(raw_payload, raw=False)
-            else:
-                payload = None
-            
-            return DecodedMessage(header, payload, raw_payload)
+            return _unpack(header, raw_payload)
             
         except Exception as e:
             raise DecodeError(f"Failed to decode message: {e}") from e
     
+    def _take_frame(self) -> Optional[Tuple[MessageHeader, bytes]]:
+        """
+        Remove one complete frame from the buffer.
+        
+        Returns:
+            Tuple of (header, raw payload) if a complete frame is buffered, None otherwise
+        """
+        # Need at least a header
+        if len(self._buffer) < HEADER_SIZE:
+            return None
+        
+        try:
+            # Parse header
+            header = MessageHeader.from_bytes(self._buffer)
+            header.validate()
+        except Exception as e:
+            raise DecodeError(f"Failed to decode message: {e}") from e
+        
+        # Calculate total message size
+        total_size = HEADER_SIZE + header.content_length
+        
+        # Check if we have the complete message
+        if len(self._buffer) < total_size:
+            return None
+        
+        # Copy the payload out through a view (one copy, not slice + copy),
+        # releasing the view before the buffer is resized
+        with memoryview(self._buffer) as view:
+            raw_payload = bytes(view[HEADER_SIZE:total_size])
+        del self._buffer[:total_size]
+        
+        return header, raw_payload
+    
     def decode_all(self) -> list[DecodedMessage]:
         """
         Decode all complete messages from buffer.
@@ -184,6 +220,39 @@ class ProtocolDecoder:
             messages.append(msg)
         return messages
     
+    async def decode_all_async(self) -> list[DecodedMessage]:
+        """
+        Decode all complete messages, decompressing large payloads in a worker thread.
+        
+        zlib and zstd release the GIL, so compressed payloads over
+        OFFLOAD_THRESHOLD are inflated off the event loop. Message order is
+        preserved.
+        
+        Returns:
+            List of decoded messages
+        """
+        messages = []
+        while True:
+            frame = self._take_frame()
+            if frame is None:
+                break
+            
+            header, raw_payload = frame
+            try:
+                if header.flags & MessageFlags.COMPRESSED:
+                    if len(raw_payload) >= OFFLOAD_THRESHOLD:
+                        raw_payload = await asyncio.get_running_loop().run_in_executor(
+                            None, _decompress, raw_payload, header.flags
+                        )
+                    else:
+                        raw_payload = _decompress(raw_payload, header.flags)
+                
+                messages.append(_unpack(header, raw_payload))
+                
+            except Exception as e:
+                raise DecodeError(f"Failed to decode message: {e}") from e
+        return messages
+    
     @staticmethod
     def decode_single(data: bytes) -> DecodedMessage:
         """
@@ -214,15 +283,9 @@ class ProtocolDecoder:
             raw_payload = data[HEADER_SIZE:total_size]
             
             if header.flags & MessageFlags.COMPRESSED:
-                import zlib
-                raw_payload = zlib.decompress(raw_payload)
-            
-            if raw_payload:
-                payload = msgpack.unpackb(raw_payload, raw=False)
-            else:
-                payload = None
+                raw_payload = _decompress(raw_payload, header.flags)
             
-            return DecodedMessage(header, payload, raw_payload)
+            return _unpack(header, raw_payload)
             
         except (IncompleteMessageError, DecodeError):
             raise
@@ -248,6 +311,6 @@ class ProtocolDecoder:
             return None
         
         try:
-            return MessageHeader.from_bytes(bytes(self._buffer[:HEADER_SIZE]))
+            return MessageHeader.from_bytes(self._buffer)
         except Exception:
             return None
@@ -4,31 +4,82 @@ Conduit Protocol Encoder
 Encodes messages into binary format for transmission.
 """
 
+import asyncio
+import struct
 import time
-from typing import Any, Optional
+import zlib
+from typing import Any, Optional, Tuple
 import msgpack
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 from .format import (
     MessageHeader,
     MessageType,
     MessageFlags,
+    MAGIC,
     HEADER_SIZE,
     MAX_PAYLOAD_SIZE,
+    OFFLOAD_THRESHOLD,
+    PROTOCOL_VERSION,
 )
 
+# Payloads smaller than about one Ethernet MTU are never worth compressing
+COMPRESSION_THRESHOLD = 1500
+
+_HEADER_STRUCT = struct.Struct(MessageHeader.STRUCT_FORMAT)
+
+
+def _compress(payload_bytes: bytes, zstd=None) -> Tuple[bytes, MessageFlags]:
+    """Compress with the given ZstdCompressor, or zlib if None; returns the codec flag too."""
+    if zstd is not None:
+        return zstd.compress(payload_bytes), MessageFlags.ZSTD
+    return zlib.compress(payload_bytes, level=6), MessageFlags.NONE
+
+
+def _control_frame(message_type: MessageType) -> bytes:
+    """Build a payload-less control frame once; its timestamp is left at 0."""
+    return _HEADER_STRUCT.pack(
+        MAGIC, PROTOCOL_VERSION, message_type, MessageFlags.NONE, 0, 0, 0, 0
+    )
+
+
+# Fixed-content control frames are prebuilt so heartbeats never hit the encoder
+_HEARTBEAT_PING_FRAME = _control_frame(MessageType.HEARTBEAT_PING)
+_HEARTBEAT_PONG_FRAME = _control_frame(MessageType.HEARTBEAT_PONG)
+_PAUSE_FRAME = _control_frame(MessageType.PAUSE)
+_RESUME_FRAME = _control_frame(MessageType.RESUME)
+_CLOSE_ACK_FRAME = _control_frame(MessageType.CLOSE_ACK)
+
 
 class ProtocolEncoder:
     """Encodes messages into binary protocol format."""
     
-    def __init__(self, enable_compression: bool = False):
+    def __init__(self, enable_compression: bool = False, compression_algorithm: str = "zlib"):
         """
         Initialize encoder.
         
         Args:
             enable_compression: Whether to compress large payloads
+            compression_algorithm: "zlib" or "zstd" (requires the zstandard package)
         """
         self.enable_compression = enable_compression
+        self._zstd = None
+        if compression_algorithm == "zstd":
+            if zstandard is None:
+                raise ImportError("zstd compression requires the 'zstandard' package")
+            self._zstd = zstandard.ZstdCompressor(level=1)
+        elif compression_algorithm != "zlib":
+            raise ValueError(f"Unknown compression algorithm: {compression_algorithm}")
         self._correlation_counter = 0
+        # Reused for every payload instead of building a Packer per packb();
+        # autoreset=False keeps its output buffer allocated between messages
+        self._packer = msgpack.Packer(use_bin_type=True, autoreset=False)
+        # Frame is assembled in place: header slot followed by the payload
+        self._frame = bytearray(HEADER_SIZE)
     
     def _next_correlation_id(self) -> int:
         """Generate next correlation ID."""
@@ -54,38 +105,127 @@ class ProtocolEncoder:
         Returns:
             Complete binary message (header + payload)
         """
-        # Serialize payload
+        return self._finish(message_type, self._pack(payload), correlation_id, flags)
+    
+    async def encode_async(
+        self,
+        message_type: MessageType,
+        payload: Any = None,
+        correlation_id: Optional[int] = None,
+        flags: MessageFlags = MessageFlags.NONE,
+    ) -> bytes:
+        """
+        Encode a message, compressing large payloads in a worker thread.
+        
+        zlib and zstd release the GIL while they run, so payloads over
+        OFFLOAD_THRESHOLD are compressed off the event loop. Serialization
+        itself stays inline: msgpack holds the GIL, so a thread would not
+        free the loop. Output is identical to encode().
+        
+        Args:
+            message_type: Type of message
+            payload: Message payload (will be serialized with msgpack)
+            correlation_id: Optional correlation ID (auto-generated if None for RPC)
+            flags: Message flags
+            
+        Returns:
+            Complete binary message (header + payload)
+        """
+        if not self.enable_compression:
+            return self.encode(message_type, payload, correlation_id, flags)
+        
+        content_length = self._pack(payload)
+        if content_length < OFFLOAD_THRESHOLD:
+            return self._finish(message_type, content_length, correlation_id, flags)
+        
+        if correlation_id is None and message_type == MessageType.RPC_REQUEST:
+            correlation_id = self._next_correlation_id()
+        
+        # Copy out of the shared frame buffer; other messages may be
+        # encoded while the worker runs. ZstdCompressor is not thread-safe,
+        # so the worker gets its own.
+        payload_bytes = bytes(self._frame[HEADER_SIZE:])
+        zstd = zstandard.ZstdCompressor(level=1) if self._zstd is not None else None
+        compressed, codec_flag = await asyncio.get_running_loop().run_in_executor(
+            None, _compress, payload_bytes, zstd
+        )
+        if len(compressed) < content_length:
+            payload_bytes = compressed
+            flags |= MessageFlags.COMPRESSED | codec_flag
+        
+        header = _HEADER_STRUCT.pack(
+            MAGIC,
+            PROTOCOL_VERSION,
+            message_type,
+            flags,
+            0,
+            len(payload_bytes),
+            correlation_id or 0,
+            int(time.time() * 1000),
+        )
+        return header + payload_bytes
+    
+    def _pack(self, payload: Any) -> int:
+        """
+        Serialize a payload into the frame buffer after the header slot.
+        
+        Returns:
+            Payload length in bytes
+        """
+        frame = self._frame
+        del frame[HEADER_SIZE:]
         if payload is not None:
-            payload_bytes = msgpack.packb(payload, use_bin_type=True)
-        else:
-            payload_bytes = b''
+            packer = self._packer
+            try:
+                packer.pack(payload)
+                with packer.getbuffer() as packed:
+                    frame += packed
+            finally:
+                packer.reset()
+        content_length = len(frame) - HEADER_SIZE
         
         # Check payload size
-        if len(payload_bytes) > MAX_PAYLOAD_SIZE:
-            raise ValueError(f"Payload too large: {len(payload_bytes)} > {MAX_PAYLOAD_SIZE}")
+        if content_length > MAX_PAYLOAD_SIZE:
+            raise ValueError(f"Payload too large: {content_length} > {MAX_PAYLOAD_SIZE}")
         
+        return content_length
+    
+    def _finish(
+        self,
+        message_type: MessageType,
+        content_length: int,
+        correlation_id: Optional[int],
+        flags: MessageFlags,
+    ) -> bytes:
+        """Compress the packed payload if worthwhile and write the header in front of it."""
         # Compress if enabled and beneficial
-        if self.enable_compression and len(payload_bytes) > 1024:
-            import zlib
-            compressed = zlib.compress(payload_bytes, level=6)
-            if len(compressed) < len(payload_bytes):
-                payload_bytes = compressed
-                flags |= MessageFlags.COMPRESSED
+        if self.enable_compression and content_length >= COMPRESSION_THRESHOLD:
+            compressed, codec_flag = _compress(bytes(self._frame[HEADER_SIZE:]), self._zstd)
+            if len(compressed) < content_length:
+                del self._frame[HEADER_SIZE:]
+                self._frame += compressed
+                content_length = len(compressed)
+                flags |= MessageFlags.COMPRESSED | codec_flag
         
         # Auto-generate correlation ID for RPC requests
         if correlation_id is None and message_type == MessageType.RPC_REQUEST:
             correlation_id = self._next_correlation_id()
         
-        # Create header
-        header = MessageHeader.create(
-            message_type=message_type,
-            content_length=len(payload_bytes),
-            correlation_id=correlation_id or 0,
-            flags=flags,
+        # Write header into its slot
+        _HEADER_STRUCT.pack_into(
+            self._frame,
+            0,
+            MAGIC,
+            PROTOCOL_VERSION,
+            message_type,
+            flags,
+            0,
+            content_length,
+            correlation_id or 0,
+            int(time.time() * 1000),
         )
         
-        # Combine header and payload
-        return header.to_bytes() + payload_bytes
+        return bytes(self._frame)
     
     def encode_message(
         self,
@@ -114,6 +254,33 @@ class ProtocolEncoder:
             correlation_id=correlation_id,
         )
     
+    async def encode_message_async(
+        self,
+        message_type_str: str,
+        data: Any,
+        correlation_id: Optional[int] = None,
+    ) -> bytes:
+        """
+        Encode a regular message, compressing large payloads off the event loop.
+        
+        Args:
+            message_type_str: String message type (e.g., "hello", "chat")
+            data: Message data
+            correlation_id: Optional correlation ID
+            
+        Returns:
+            Encoded message bytes
+        """
+        payload = {
+            "type": message_type_str,
+            "data": data,
+        }
+        return await self.encode_async(
+            MessageType.MESSAGE,
+            payload,
+            correlation_id=correlation_id,
+        )
+    
     def encode_rpc_request(
         self,
         method: str,
@@ -255,19 +422,19 @@ class ProtocolEncoder:
     
     def encode_heartbeat_ping(self) -> bytes:
         """Encode a heartbeat ping."""
-        return self.encode(MessageType.HEARTBEAT_PING)
+        return _HEARTBEAT_PING_FRAME
     
     def encode_heartbeat_pong(self) -> bytes:
         """Encode a heartbeat pong."""
-        return self.encode(MessageType.HEARTBEAT_PONG)
+        return _HEARTBEAT_PONG_FRAME
     
     def encode_pause(self) -> bytes:
         """Encode a backpressure pause signal."""
-        return self.encode(MessageType.PAUSE)
+        return _PAUSE_FRAME
     
     def encode_resume(self) -> bytes:
         """Encode a backpressure resume signal."""
-        return self.encode(MessageType.RESUME)
+        return _RESUME_FRAME
     
     def encode_ack(self, correlation_id: int) -> bytes:
         """Encode a message acknowledgment."""
@@ -285,7 +452,7 @@ class ProtocolEncoder:
     
     def encode_close_ack(self) -> bytes:
         """Encode a connection close acknowledgment."""
-        return self.encode(MessageType.CLOSE_ACK)
+        return _CLOSE_ACK_FRAME
     
     def encode_rpc_list(self, methods: list[dict]) -> bytes:
         """
@@ -29,6 +29,7 @@ MAGIC = b'CNDT'
 MAGIC_INT = 0x434E4454  # 'CNDT' as big-endian int
 HEADER_SIZE = 32
 MAX_PAYLOAD_SIZE = 100 * 1024 * 1024  # 100MB max payload
+OFFLOAD_THRESHOLD = 64 * 1024  # (De)compress larger payloads in a worker thread
 PROTOCOL_VERSION = 0x0100  # Version 1.0
 
 
@@ -79,6 +80,7 @@ class MessageFlags(IntFlag):
     FRAGMENT = 0x0010          # Message is fragmented
     LAST_FRAGMENT = 0x0020     # Last fragment of fragmented message
     BINARY = 0x0040            # Payload is binary (not text/JSON)
+    ZSTD = 0x0080              # Compressed payload uses zstd instead of zlib
 
 
 @dataclass
@@ -138,11 +140,16 @@ class MessageHeader:
     
     @classmethod
     def from_bytes(cls, data: bytes) -> 'MessageHeader':
-        """Deserialize header from bytes."""
+        """
+        Deserialize header from the start of a buffer.
+        
+        Accepts bytes, bytearray or memoryview and reads in place, so a
+        receive buffer can be parsed without slicing a copy off it first.
+        """
         if len(data) < HEADER_SIZE:
             raise ValueError(f"Header too short: expected {HEADER_SIZE}, got {len(data)}")
         
-        unpacked = struct.unpack(cls.STRUCT_FORMAT, data[:HEADER_SIZE])
+        unpacked = struct.unpack_from(cls.STRUCT_FORMAT, data)
         
         magic = unpacked[0]
         if magic != MAGIC:
@@ -6,12 +6,23 @@ Client-side RPC interface for making remote procedure calls.
 
 import asyncio
 import time
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from functools import cache
+from typing import Any, Dict, Optional, Type, TypeVar, TYPE_CHECKING
+from pydantic import TypeAdapter, ValidationError
 
 if TYPE_CHECKING:
     from ..client import Client
 
 
+T = TypeVar('T')
+
+
+@cache
+def _type_adapter(response_type: type) -> TypeAdapter:
+    """Get a cached validator for a response type."""
+    return TypeAdapter(response_type)
+
+
 class RPCError(Exception):
     """Exception raised when an RPC call fails."""
     
@@ -36,6 +47,36 @@ class RPCTimeout(RPCError):
         self.timeout = timeout
 
 
+def _unwrap_response(response: Any) -> Any:
+    """
+    Unwrap one response envelope.
+    
+    Args:
+        response: Response payload
+        
+    Returns:
+        The envelope's data/result, or the response itself if it has neither
+        
+    Raises:
+        RPCError: If the envelope reports failure
+    """
+    if not isinstance(response, dict):
+        return response
+    
+    if not response.get("success", True):
+        raise RPCError(
+            response.get("error", "Unknown error"),
+            code=response.get("code"),
+            details=response.get("details"),
+        )
+    
+    if "data" in response:
+        return response["data"]
+    if "result" in response:
+        return response["result"]
+    return response
+
+
 class RPC:
     """
     RPC client interface.
@@ -53,6 +94,10 @@ class RPC:
         
         # With explicit timeout
         result = await rpc.call("slow_method", timeout=60.0)
+        
+        # With a typed response (Pydantic model, dataclass, ...)
+        info = await rpc.call("get_time", response_type=TimeInfo)
+        print(info.formatted)
     """
     
     def __init__(self, client: 'Client', default_timeout: float = 30.0):
@@ -72,6 +117,7 @@ class RPC:
         method: str,
         args: Optional[Dict[str, Any]] = None,
         timeout: Optional[float] = None,
+        response_type: Optional[Type[T]] = None,
         **kwargs: Any
     ) -> Any:
         """
@@ -81,13 +127,14 @@ class RPC:
             method: Method name to call
             args: Arguments as dictionary (use data() helper)
             timeout: Timeout in seconds (uses default if not specified)
+            response_type: Optional type to validate the result into
             **kwargs: Additional arguments (merged with args)
             
         Returns:
-            The result from the RPC method
+            The result from the RPC method, as response_type if given
             
         Raises:
-            RPCError: If the call fails
+            RPCError: If the call fails or the result doesn't match response_type
             RPCTimeout: If the call times out
         """
         # Merge args and kwargs
@@ -115,23 +162,22 @@ class RPC:
             
             elapsed_ms = (time.time() - start_time) * 1000
             
-            # Check if response indicates success
-            if isinstance(response, dict):
-                success = response.get("success", True)
-                
-                if not success:
-                    error_msg = response.get("error", "Unknown error")
-                    error_code = response.get("code")
-                    error_details = response.get("details")
-                    raise RPCError(error_msg, code=error_code, details=error_details)
-                
-                # Return the data/result
-                if "data" in response:
-                    return response["data"]
-                if "result" in response:
-                    return response["result"]
-                
-                return response
+            # A Server sends the dispatcher's {"success", "data"|"error"}
+            # envelope as the "result" of the transport's own envelope
+            nested = (
+                isinstance(response, dict)
+                and isinstance(response.get("result"), dict)
+                and "success" in response["result"]
+            )
+            response = _unwrap_response(response)
+            if nested:
+                response = _unwrap_response(response)
+            
+            if response_type is not None:
+                try:
+                    return _type_adapter(response_type).validate_python(response)
+                except ValidationError as e:
+                    raise RPCError(f"Invalid response from '{method}': {e}") from e
             
             return response
             
@@ -7,14 +7,14 @@ The main server class for accepting and handling client connections.
 import asyncio
 import hashlib
 from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional, Awaitable, Union
+from typing import Any, Callable, Collection, Dict, List, Optional, Awaitable, Union
 import logging
 
 from .data.descriptors import ServerDescriptor
 from .transport import TCPServer, TCPSocket, AuthHandler, TLSConfig, create_server_ssl_context
 from .protocol import ProtocolEncoder, ProtocolDecoder, MessageType, DecodedMessage
 from .connection import Connection, ConnectionPool
-from .messages import MessageRouter, Message
+from .messages import MessageRouter
 from .rpc import RPCRegistry, RPCDispatcher
 from .response import Response, Error
 from .ratelimit import RateLimiter, RateLimitConfig
@@ -66,17 +66,19 @@ class Server:
         """
         self._config = config
         
-        # Create TLS context if SSL enabled
+        # Create TLS context if SSL enabled (a prebuilt one is used as-is)
         ssl_context = None
         if config.ssl_enabled:
-            tls_config = TLSConfig(
-                enabled=True,
-                cert_file=config.ssl_cert_file,
-                key_file=config.ssl_key_file,
-                ca_file=config.ssl_ca_file,
-                verify_client=config.ssl_verify_client,
-            )
-            ssl_context = create_server_ssl_context(tls_config)
+            ssl_context = config.ssl_context
+            if ssl_context is None:
+                tls_config = TLSConfig(
+                    enabled=True,
+                    cert_file=config.ssl_cert_file,
+                    key_file=config.ssl_key_file,
+                    ca_file=config.ssl_ca_file,
+                    verify_client=config.ssl_verify_client,
+                )
+                ssl_context = create_server_ssl_context(tls_config)
             logger.info("TLS enabled for server")
         
         # TCP server
@@ -86,6 +88,7 @@ class Server:
             ipv6=config.ipv6,
             max_connections=config.max_connections,
             ssl_context=ssl_context,
+            reuse_port=config.reuse_port,
         )
         
         # Authentication
@@ -94,8 +97,17 @@ class Server:
             session_timeout=config.connection_timeout,
         )
         
-        # Connection pool
-        self._pool = ConnectionPool(max_connections=config.max_connections)
+        # Protocol
+        self._encoder = ProtocolEncoder(
+            enable_compression=config.enable_compression,
+            compression_algorithm=config.compression_algorithm,
+        )
+        
+        # Connection pool (broadcasts encode with the server's encoder)
+        self._pool = ConnectionPool(
+            max_connections=config.max_connections,
+            encoder=self._encoder,
+        )
         
         # Message routing
         self._message_router = MessageRouter()
@@ -104,9 +116,6 @@ class Server:
         self._rpc_registry = RPCRegistry()
         self._rpc_dispatcher = RPCDispatcher(self._rpc_registry)
         
-        # Protocol
-        self._encoder = ProtocolEncoder(enable_compression=config.enable_compression)
-        
         # Response helpers
         self._response = Response()
         self._error = Error()
@@ -287,7 +296,10 @@ class Server:
         logger.debug(f"New connection from {remote}")
         
         decoder = ProtocolDecoder()
-        encoder = ProtocolEncoder(enable_compression=self._config.enable_compression)
+        encoder = ProtocolEncoder(
+            enable_compression=self._config.enable_compression,
+            compression_algorithm=self._config.compression_algorithm,
+        )
         
         try:
             # Authenticate within timeout
@@ -310,6 +322,7 @@ class Server:
                 heartbeat_interval=self._config.heartbeat_interval,
                 heartbeat_timeout=self._config.heartbeat_timeout,
                 enable_backpressure=self._config.enable_backpressure,
+                adaptive_send_queue=self._config.adaptive_send_queue,
             )
             
             # Add to pool
@@ -477,14 +490,11 @@ class Server:
     ) -> None:
         """Handle regular message."""
         msg_type_str = message.get_message_type_str()
-        data = message.get_data()
         
-        # Create message object
-        msg = Message(type=msg_type_str, data=data)
-        
-        # Route to handler
-        response = await self._message_router.route(
-            message=msg,
+        # Route to handler (no Message object needed on this path)
+        response = await self._message_router.route_dict(
+            message_type=msg_type_str,
+            data=message.get_data(),
             context=connection,
             authenticated=connection.is_authenticated,
         )
@@ -499,11 +509,14 @@ class Server:
         self,
         message_type: str,
         data: Any,
-        exclude: Optional[set] = None
+        exclude: Optional[Collection[str]] = None
     ) -> int:
         """
         Broadcast message to all connected clients.
         
+        The message is encoded once and queued on each client without
+        waiting; clients whose send queue is full or paused are skipped.
+        
         Args:
             message_type: Message type
             data: Message data
@@ -140,9 +140,14 @@ class FileTransferHandler:
             return await self.start_receive(filename, size, checksum)
         
         @server.rpc
-        async def file_upload_chunk(transfer_id: str, chunk_index: int, data_b64: str) -> dict:
+        async def file_upload_chunk(
+            transfer_id: str,
+            chunk_index: int,
+            chunk: Optional[bytes] = None,
+            data_b64: Optional[str] = None,
+        ) -> dict:
             """Receive a file chunk from client."""
-            return await self.receive_chunk(transfer_id, chunk_index, data_b64)
+            return await self.receive_chunk(transfer_id, chunk_index, chunk, data_b64)
         
         @server.rpc
         async def file_upload_complete(transfer_id: str) -> dict:
@@ -204,9 +209,10 @@ class FileTransferHandler:
             """Receive a chunk from server."""
             transfer_id = msg.get("transfer_id")
             chunk_index = msg.get("chunk_index")
-            data_b64 = msg.get("data_b64")
             
-            result = await self.receive_chunk(transfer_id, chunk_index, data_b64)
+            result = await self.receive_chunk(
+                transfer_id, chunk_index, msg.get("chunk"), msg.get("data_b64")
+            )
             
             # Progress callback
             if self._on_transfer_progress:
@@ -285,12 +291,10 @@ class FileTransferHandler:
                 if not chunk:
                     break
                 
-                chunk_b64 = base64.b64encode(chunk).decode()
-                
                 result = await client.rpc.call("file_upload_chunk", args=data(
                     transfer_id=transfer_id,
                     chunk_index=chunk_index,
-                    data_b64=chunk_b64,
+                    chunk=chunk,
                 ))
                 
                 if not result.get("success"):
@@ -370,12 +374,10 @@ class FileTransferHandler:
                 if not chunk:
                     break
                 
-                chunk_b64 = base64.b64encode(chunk).decode()
-                
                 await connection.send_message("file_chunk", {
                     "transfer_id": transfer_id,
                     "chunk_index": chunk_index,
-                    "data_b64": chunk_b64,
+                    "chunk": chunk,
                 })
                 
                 progress.transferred += len(chunk)
@@ -452,8 +454,8 @@ class FileTransferHandler:
                 if not result.get("success"):
                     return result
                 
-                chunk_b64 = result.get("data", {}).get("data_b64", "")
-                chunk = base64.b64decode(chunk_b64)
+                info = result.get("data", {})
+                chunk = self._chunk_bytes(info.get("chunk"), info.get("data_b64"))
                 f.write(chunk)
                 
                 progress.transferred += len(chunk)
@@ -505,15 +507,15 @@ class FileTransferHandler:
         self,
         transfer_id: str,
         chunk_index: int,
-        data_b64: str,
+        chunk: Optional[bytes] = None,
+        data_b64: Optional[str] = None,
     ) -> dict:
-        """Receive a file chunk."""
+        """Receive a file chunk (raw bytes, or base64 from older peers)."""
         transfer = self._active_transfers.get(transfer_id)
         if not transfer:
             return {"error": "Transfer not found"}
         
-        chunk = base64.b64decode(data_b64)
-        transfer["file"].write(chunk)
+        transfer["file"].write(self._chunk_bytes(chunk, data_b64))
         transfer["received_chunks"] += 1
         
         return {
@@ -595,10 +597,17 @@ class FileTransferHandler:
         
         return {
             "chunk_index": chunk_index,
-            "data_b64": base64.b64encode(chunk).decode(),
+            "chunk": chunk,
             "size": len(chunk),
         }
     
+    @staticmethod
+    def _chunk_bytes(chunk: Optional[bytes], data_b64: Optional[str]) -> bytes:
+        """Return chunk bytes, decoding the legacy base64 field if needed."""
+        if chunk is not None:
+            return chunk
+        return base64.b64decode(data_b64 or "")
+    
     def _compute_checksum(self, filepath: str) -> str:
         """Compute SHA256 checksum of a file."""
         sha256 = hashlib.sha256()
@@ -158,6 +158,8 @@ class AuthHandler:
         """
         self._password = password
         self._password_hash, self._password_salt = hash_password(password)
+        # What verify_simple expects, hashed once rather than per auth request
+        self._simple_hash = hashlib.sha256(password.encode('utf-8')).hexdigest()
         self._session_timeout = session_timeout
         self._sessions: Dict[str, Session] = {}
         self._pending_challenges: Dict[str, bytes] = {}  # client_id -> challenge
@@ -224,8 +226,7 @@ class AuthHandler:
         Returns:
             True if password matches
         """
-        expected_hash = hashlib.sha256(self._password.encode('utf-8')).hexdigest()
-        return secrets.compare_digest(password_hash, expected_hash)
+        return secrets.compare_digest(password_hash, self._simple_hash)
     
     def create_session(
         self,
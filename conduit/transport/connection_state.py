@@ -26,6 +26,13 @@ class ConnectionState(Enum):
     FAILED = auto()
 
 
+# State groups for the checks hit on every send/read. Module-level tuples
+# avoid rebuilding them per call; tuple membership compares by identity,
+# which beats a set here since Enum hashing runs in Python.
+_CONNECTED_STATES = (ConnectionState.CONNECTED, ConnectionState.ACTIVE, ConnectionState.PAUSED)
+_RECEIVE_STATES = (ConnectionState.ACTIVE, ConnectionState.PAUSED)
+
+
 # Valid state transitions
 VALID_TRANSITIONS: Dict[ConnectionState, Set[ConnectionState]] = {
     ConnectionState.DISCONNECTED: {
@@ -253,11 +260,7 @@ class ConnectionStateMachine:
     @property
     def is_connected(self) -> bool:
         """Check if in any connected state."""
-        return self._state in (
-            ConnectionState.CONNECTED,
-            ConnectionState.ACTIVE,
-            ConnectionState.PAUSED,
-        )
+        return self._state in _CONNECTED_STATES
     
     @property
     def is_active(self) -> bool:
@@ -287,4 +290,4 @@ class ConnectionStateMachine:
     @property
     def can_receive(self) -> bool:
         """Check if can receive messages."""
-        return self._state in (ConnectionState.ACTIVE, ConnectionState.PAUSED)
+        return self._state in _RECEIVE_STATES
@@ -40,6 +40,11 @@ class TCPSocket:
         self._remote_address: Optional[Tuple[str, int]] = None
         self._local_address: Optional[Tuple[str, int]] = None
         
+        # Disable Nagle so small frames (RPC, heartbeats) go out immediately
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            self._set_low_latency(sock)
+        
         # Extract addresses
         try:
             peername = writer.get_extra_info('peername')
@@ -51,6 +56,18 @@ class TCPSocket:
         except Exception:
             pass
     
+    @staticmethod
+    def _set_low_latency(sock: socket.socket) -> None:
+        """Enable TCP_NODELAY (and TCP_QUICKACK where available) on a socket."""
+        if sock.family not in (socket.AF_INET, socket.AF_INET6):
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if hasattr(socket, 'TCP_QUICKACK'):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except OSError as e:
+            logger.debug(f"Could not set low-latency socket options: {e}")
+    
     @classmethod
     async def connect(
         cls,
@@ -60,6 +77,7 @@ class TCPSocket:
         use_ipv6: bool = False,
         buffer_size: int = 65536,
         ssl_context=None,  # Optional SSL context for TLS
+        socket_buffer_size: int = 0,
     ) -> 'TCPSocket':
         """
         Connect to a remote server.
@@ -71,6 +89,7 @@ class TCPSocket:
             use_ipv6: Use IPv6 family
             buffer_size: Socket buffer size
             ssl_context: Optional SSL context for TLS encryption
+            socket_buffer_size: Kernel send/receive buffer size (0 = OS default)
             
         Returns:
             Connected TCPSocket
@@ -88,7 +107,39 @@ class TCPSocket:
             timeout=timeout
         )
         
-        return cls(reader, writer, buffer_size)
+        conn = cls(reader, writer, buffer_size)
+        if socket_buffer_size:
+            conn.set_buffer_sizes(socket_buffer_size)
+        return conn
+    
+    def set_buffer_sizes(self, size: int) -> Tuple[int, int]:
+        """
+        Request kernel send/receive buffers of the given size.
+        
+        Linux clamps the request to net.core.wmem_max/rmem_max (about 208KB
+        by default); raise those, e.g. ``sysctl -w net.core.rmem_max=12582912``,
+        for multi-megabyte messages.
+        
+        Args:
+            size: Requested buffer size in bytes
+            
+        Returns:
+            Tuple of (actual send buffer, actual receive buffer) sizes
+        """
+        sock = self._writer.get_extra_info('socket')
+        if sock is None:
+            return (0, 0)
+        
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, size)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, size)
+        except OSError as e:
+            logger.debug(f"Could not set socket buffer sizes: {e}")
+        
+        sndbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+        rcvbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        logger.debug(f"Socket buffers requested {size}, got snd={sndbuf} rcv={rcvbuf}")
+        return (sndbuf, rcvbuf)
     
     async def read(self, n: int = -1) -> bytes:
         """
@@ -153,6 +204,28 @@ class TCPSocket:
             self._closed = True
             raise
     
+    async def write_many(self, chunks: list[bytes]) -> None:
+        """
+        Write several buffers with a single drain.
+        
+        Each chunk is a complete frame (header and payload in one buffer), and
+        the transport hands the whole batch to the kernel in one writev-style
+        call, so with TCP_NODELAY set a header is never flushed as its own
+        segment and no TCP_CORK toggling is needed.
+        
+        Args:
+            chunks: Byte strings to send, in order
+        """
+        if self._closed:
+            raise ConnectionResetError("Connection closed")
+        
+        try:
+            self._writer.writelines(chunks)
+            await self._writer.drain()
+        except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
+            self._closed = True
+            raise
+    
     async def close(self) -> None:
         """Close the socket."""
         if self._closed:
@@ -206,6 +279,7 @@ class TCPServer:
         buffer_size: int = 65536,
         max_connections: int = 100,
         ssl_context=None,  # Optional SSL context for TLS
+        reuse_port: bool = False,
     ):
         """
         Initialize TCP server.
@@ -218,6 +292,7 @@ class TCPServer:
             buffer_size: Socket buffer size
             max_connections: Maximum concurrent connections
             ssl_context: Optional SSL context for TLS encryption
+            reuse_port: Set SO_REUSEPORT on the listening socket
         """
         self._host = host
         self._port = port
@@ -226,6 +301,7 @@ class TCPServer:
         self._buffer_size = buffer_size
         self._max_connections = max_connections
         self._ssl_context = ssl_context
+        self._reuse_port = reuse_port
         
         self._server: Optional[asyncio.Server] = None
         self._running = False
@@ -256,6 +332,7 @@ class TCPServer:
             port=self._port,
             family=family,
             reuse_address=True,
+            reuse_port=self._reuse_port or None,
             start_serving=True,
             ssl=self._ssl_context,  # TLS support
         )
@@ -274,9 +351,9 @@ class TCPServer:
         # Stop accepting new connections
         if self._server:
             self._server.close()
-            await self._server.wait_closed()
         
-        # Cancel all active connections
+        # Cancel all active connections first: since Python 3.12 wait_closed()
+        # also waits for every open connection's handler to return
         for task in self._connections:
             task.cancel()
         
@@ -285,6 +362,9 @@ class TCPServer:
         
         self._connections.clear()
         
+        if self._server:
+            await self._server.wait_closed()
+        
         logger.info("Server stopped")
     
     async def _handle_connection(
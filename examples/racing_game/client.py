@@ -10,15 +10,19 @@ import asyncio
 import sys
 import os
 import math
+import struct
 import threading
+import time
+from collections import deque
 
 # Add parent to path for conduit import
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 try:
     import pygame
+    from pygame.locals import K_UP, K_DOWN, K_LEFT, K_RIGHT, K_w, K_s, K_a, K_d
 except ImportError:
-    print("Pygame not installed! Install with: pip install pygame")
+    print("Pygame not installed! Install with: pip install pygame-ce")
     sys.exit(1)
 
 from conduit import Client, ClientDescriptor
@@ -28,6 +32,14 @@ from conduit import Client, ClientDescriptor
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 600
 FPS = 60
+TEXT_CACHE_SIZE = 64  # Rendered UI strings kept before the cache is reset
+SEND_RATE = 20  # Position updates per second (rendering stays at FPS)
+SEND_HEARTBEAT = 1.0  # Seconds before the full state is re-sent even when idle
+MOVE_THRESHOLD = {"x": 0.5, "y": 0.5, "angle": 1.0, "speed": 0.1}  # Smallest change worth sending
+
+# Position updates travel as x, y, angle, speed packed into 16 bytes
+# (must match POS_FMT in server.py)
+POS_FMT = struct.Struct("<4f")
 
 # Colors
 BLACK = (0, 0, 0)
@@ -48,6 +60,77 @@ COLOR_MAP = {
     "magenta": (255, 0, 255),
 }
 
+# Per-degree direction table so Car.update skips trig calls every frame
+_COS_LUT = tuple(math.cos(math.radians(i)) for i in range(360))
+_SIN_LUT = tuple(math.sin(math.radians(i)) for i in range(360))
+
+# Building and rotating car surfaces is the costliest part of a frame, so
+# they are rendered once and reused; rotations are cached per ANGLE_STEP
+CAR_WIDTH = 40
+CAR_HEIGHT = 20
+ANGLE_STEP = 5  # Degrees
+_ROTATED_CACHE = {}  # (color, angle bucket) -> rotated surface
+_NAME_CACHE = {}  # name -> rendered name label
+_name_font = None
+
+# pygame-ce (same import name) has Surface.fblits, a batched blit that skips
+# building a result rect per item; classic pygame falls back to blits()
+FAST_BLITS = getattr(pygame, "IS_CE", False)
+
+
+def _blit_all(screen, sprites):
+    """Blit a list of (surface, rect) pairs in one call."""
+    if FAST_BLITS:
+        screen.fblits(sprites)
+    else:
+        screen.blits(sprites, doreturn=False)
+
+
+def _car_style(color):
+    """Build (body color, border color, unrotated surface) for a car color."""
+    border = (color[0] // 2, color[1] // 2, color[2] // 2)
+    surface = pygame.Surface((CAR_WIDTH, CAR_HEIGHT), pygame.SRCALPHA)
+    
+    # Draw car body
+    pygame.draw.rect(surface, color, (0, 2, CAR_WIDTH - 5, CAR_HEIGHT - 4))
+    pygame.draw.rect(surface, border, (0, 2, CAR_WIDTH - 5, CAR_HEIGHT - 4), 2)
+    
+    # Front (pointed)
+    pygame.draw.polygon(surface, color, [
+        (CAR_WIDTH - 5, 2),
+        (CAR_WIDTH, CAR_HEIGHT // 2),
+        (CAR_WIDTH - 5, CAR_HEIGHT - 2)
+    ])
+    return (color, border, surface)
+
+
+# Everything a car needs to be drawn, per color name, built once at startup
+CAR_STYLE = {name: _car_style(color) for name, color in COLOR_MAP.items()}
+DEFAULT_CAR_STYLE = _car_style((255, 0, 0))
+
+
+def _rotated_car_surface(color_name, style, angle):
+    """Get the car surface rotated to the nearest ANGLE_STEP."""
+    bucket = round(angle / ANGLE_STEP) * ANGLE_STEP % 360
+    key = (color_name, bucket)
+    surface = _ROTATED_CACHE.get(key)
+    if surface is None:
+        surface = pygame.transform.rotate(style[2], bucket)
+        _ROTATED_CACHE[key] = surface
+    return surface
+
+
+def _name_label(name):
+    """Get the rendered label for a player name."""
+    global _name_font
+    label = _NAME_CACHE.get(name)
+    if label is None:
+        if _name_font is None:
+            _name_font = pygame.font.Font(None, 20)
+        label = _name_font.render(name, True, WHITE)
+        _NAME_CACHE[name] = label
+    return label
+
 
 class Car:
     """Represents a racing car."""
@@ -58,20 +141,21 @@ class Car:
         self.angle = 0  # Degrees
         self.speed = 0
         self.color = color
+        self._style = CAR_STYLE.get(color, DEFAULT_CAR_STYLE)
         self.name = name
         self.max_speed = 8
         self.acceleration = 0.3
         self.deceleration = 0.15
         self.turn_speed = 4
-        self.width = 40
-        self.height = 20
+        self.width = CAR_WIDTH
+        self.height = CAR_HEIGHT
     
     def update(self, keys_pressed):
         """Update car based on input."""
         # Acceleration
-        if keys_pressed[pygame.K_UP] or keys_pressed[pygame.K_w]:
+        if keys_pressed[K_UP] or keys_pressed[K_w]:
             self.speed = min(self.speed + self.acceleration, self.max_speed)
-        elif keys_pressed[pygame.K_DOWN] or keys_pressed[pygame.K_s]:
+        elif keys_pressed[K_DOWN] or keys_pressed[K_s]:
             self.speed = max(self.speed - self.acceleration, -self.max_speed / 2)
         else:
             # Natural deceleration
@@ -83,61 +167,43 @@ class Car:
         # Turning (only when moving)
         if abs(self.speed) > 0.1:
             turn_factor = self.speed / self.max_speed
-            if keys_pressed[pygame.K_LEFT] or keys_pressed[pygame.K_a]:
+            if keys_pressed[K_LEFT] or keys_pressed[K_a]:
                 self.angle += self.turn_speed * turn_factor
-            if keys_pressed[pygame.K_RIGHT] or keys_pressed[pygame.K_d]:
+            if keys_pressed[K_RIGHT] or keys_pressed[K_d]:
                 self.angle -= self.turn_speed * turn_factor
         
-        # Move
-        rad = math.radians(self.angle)
-        self.x += math.cos(rad) * self.speed
-        self.y -= math.sin(rad) * self.speed
+        # Move (heading rounded to the nearest degree)
+        a = round(self.angle) % 360
+        self.x += _COS_LUT[a] * self.speed
+        self.y -= _SIN_LUT[a] * self.speed
         
         # Keep in bounds
         self.x = max(20, min(SCREEN_WIDTH - 20, self.x))
         self.y = max(20, min(SCREEN_HEIGHT - 20, self.y))
     
-    def draw(self, screen, is_local=False):
-        """Draw the car."""
-        color = COLOR_MAP.get(self.color, (255, 0, 0))
-        
-        # Create car surface
-        car_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        
-        # Draw car body
-        pygame.draw.rect(car_surface, color, (0, 2, self.width - 5, self.height - 4))
-        pygame.draw.rect(car_surface, (color[0]//2, color[1]//2, color[2]//2), 
-                         (0, 2, self.width - 5, self.height - 4), 2)
-        
-        # Front (pointed)
-        pygame.draw.polygon(car_surface, color, [
-            (self.width - 5, 2),
-            (self.width, self.height // 2),
-            (self.width - 5, self.height - 2)
-        ])
-        
-        # Rotate
-        rotated = pygame.transform.rotate(car_surface, self.angle)
+    def sprites(self):
+        """Return (surface, rect) pairs for the car body and its name label."""
+        # Rotate (cached per angle bucket)
+        rotated = _rotated_car_surface(self.color, self._style, self.angle)
         rect = rotated.get_rect(center=(self.x, self.y))
-        screen.blit(rotated, rect)
         
-        # Draw name above car
-        font = pygame.font.Font(None, 20)
-        name_surface = font.render(self.name, True, WHITE)
+        # Name above car
+        name_surface = _name_label(self.name)
         name_rect = name_surface.get_rect(center=(self.x, self.y - 25))
-        screen.blit(name_surface, name_rect)
         
-        # Local player indicator
-        if is_local:
-            pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y - 35)), 3)
+        return [(rotated, rect), (name_surface, name_rect)]
+    
+    def draw_indicator(self, screen):
+        """Draw the local player marker and return its rect."""
+        return pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y - 35)), 3)
     
     def to_dict(self):
-        """Export state to dict."""
+        """Export state to dict, rounded to the precision the screen can show."""
         return {
-            "x": self.x,
-            "y": self.y,
-            "angle": self.angle,
-            "speed": self.speed,
+            "x": round(self.x, 1),
+            "y": round(self.y, 1),
+            "angle": round(self.angle, 1),
+            "speed": round(self.speed, 2),
         }
 
 
@@ -164,9 +230,29 @@ class RacingGame:
         
         self.track = None
         
+        # Static track is rendered once; each frame only the rects cars and UI
+        # covered are restored from it and pushed to the display
+        self._track_base = None  # Grass and track, without checkpoints
+        self._track_bg = None
+        self._prev_rects = []
+        
+        # Position is sent at SEND_RATE, and only when it moved past
+        # MOVE_THRESHOLD or SEND_HEARTBEAT has passed since the last send
+        self._last_sent_state = None
+        self._last_sent_time = 0.0
+        self._send_accum = 0.0
+        
+        # Networking runs on its own thread and event loop. Outgoing updates
+        # go to _outbox on that loop; incoming messages come back through
+        # _inbox and are applied by the render thread, which owns game state
+        self._net_loop = None
+        self._outbox = None
+        self._inbox = deque()  # (apply function, data)
+        
         # Fonts
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
+        self._text_cache = {}  # (text, color) -> rendered small_font surface
     
     async def connect(self):
         """Connect to game server."""
@@ -177,143 +263,218 @@ class RacingGame:
             reconnect_enabled=True,
         ))
         
-        # Set up message handlers
-        @self.client.on("joined")
-        async def on_joined(data):
-            self.player_id = data["player_id"]
-            self.track = data.get("track")
-            
-            # Create local car
-            player_data = data["players"].get(self.player_id, {})
-            self.local_car = Car(
-                player_data.get("x", 100),
-                player_data.get("y", 300),
-                player_data.get("color", "red"),
-                player_data.get("name", "Player"),
-            )
-            
-            # Create other cars
-            for pid, pdata in data["players"].items():
-                if pid != self.player_id:
-                    self.other_cars[pid] = Car(
-                        pdata.get("x", 0),
-                        pdata.get("y", 0),
-                        pdata.get("color", "gray"),
-                        pdata.get("name", "Other"),
-                    )
-            
-            self.connected = True
-            print(f"Joined as {self.player_id}")
+        # Handlers run on the network thread, so they only queue the message
+        # for the render thread
+        for message_type, apply in (
+            ("joined", self._on_joined),
+            ("player_joined", self._on_player_joined),
+            ("player_left", self._on_player_left),
+            ("player_update", self._on_player_update),
+            ("game_state", self._on_game_state),
+        ):
+            self.client.on(message_type)(self._forward(apply))
         
-        @self.client.on("player_joined")
-        async def on_player_joined(data):
-            pid = data["player_id"]
-            pdata = data["data"]
-            self.other_cars[pid] = Car(
-                pdata.get("x", 0),
-                pdata.get("y", 0),
-                pdata.get("color", "gray"),
-                pdata.get("name", "Other"),
-            )
+        await self.client.connect()
+    
+    def _forward(self, apply):
+        """Make a client handler that hands its data to the render thread."""
+        async def handler(data):
+            self._inbox.append((apply, data))
+        return handler
+    
+    def _on_joined(self, data):
+        """Apply the join confirmation: our car, the track and existing players."""
+        self.player_id = data["player_id"]
+        self.track = data.get("track")
+        self._last_sent_state = None  # New player state on the server
+        self._track_bg = None  # Redraw with this track's checkpoints
         
-        @self.client.on("player_left")
-        async def on_player_left(data):
-            pid = data["player_id"]
-            if pid in self.other_cars:
-                del self.other_cars[pid]
+        # Create local car
+        player_data = data["players"].get(self.player_id, {})
+        self.local_car = Car(
+            player_data.get("x", 100),
+            player_data.get("y", 300),
+            player_data.get("color", "red"),
+            player_data.get("name", "Player"),
+        )
         
-        @self.client.on("player_update")
-        async def on_player_update(data):
-            pid = data["player_id"]
-            pdata = data["data"]
-            if pid in self.other_cars:
+        # Create other cars
+        for pid, pdata in data["players"].items():
+            if pid != self.player_id:
+                self.other_cars[pid] = Car(
+                    pdata.get("x", 0),
+                    pdata.get("y", 0),
+                    pdata.get("color", "gray"),
+                    pdata.get("name", "Other"),
+                )
+        
+        self.connected = True
+        print(f"Joined as {self.player_id}")
+    
+    def _on_player_joined(self, data):
+        """Add a car for a player who joined."""
+        pid = data["player_id"]
+        pdata = data["data"]
+        self.other_cars[pid] = Car(
+            pdata.get("x", 0),
+            pdata.get("y", 0),
+            pdata.get("color", "gray"),
+            pdata.get("name", "Other"),
+        )
+    
+    def _on_player_left(self, data):
+        """Remove the car of a player who left."""
+        pid = data["player_id"]
+        if pid in self.other_cars:
+            del self.other_cars[pid]
+    
+    def _on_player_update(self, data):
+        """Apply a packed position update for another player."""
+        car = self.other_cars.get(data["player_id"])
+        if car is not None:
+            car.x, car.y, car.angle, car.speed = POS_FMT.unpack(data["data"])
+    
+    def _on_game_state(self, data):
+        """Apply the periodic full-state sync."""
+        players = data.get("players", {})
+        for pid, pdata in players.items():
+            if pid == self.player_id:
+                continue
+            if pid not in self.other_cars:
+                self.other_cars[pid] = Car(
+                    pdata.get("x", 0),
+                    pdata.get("y", 0),
+                    pdata.get("color", "gray"),
+                    pdata.get("name", "Other"),
+                )
+            else:
                 car = self.other_cars[pid]
                 car.x = pdata.get("x", car.x)
                 car.y = pdata.get("y", car.y)
                 car.angle = pdata.get("angle", car.angle)
-                car.speed = pdata.get("speed", car.speed)
-        
-        @self.client.on("game_state")
-        async def on_game_state(data):
-            players = data.get("players", {})
-            for pid, pdata in players.items():
-                if pid == self.player_id:
-                    continue
-                if pid not in self.other_cars:
-                    self.other_cars[pid] = Car(
-                        pdata.get("x", 0),
-                        pdata.get("y", 0),
-                        pdata.get("color", "gray"),
-                        pdata.get("name", "Other"),
-                    )
-                else:
-                    car = self.other_cars[pid]
-                    car.x = pdata.get("x", car.x)
-                    car.y = pdata.get("y", car.y)
-                    car.angle = pdata.get("angle", car.angle)
-        
-        await self.client.connect()
     
-    def draw_track(self):
-        """Draw the race track."""
-        # Background (grass)
-        self.screen.fill(GRASS_GREEN)
-        
-        # Track (gray oval)
-        pygame.draw.ellipse(self.screen, GRAY, (50, 50, SCREEN_WIDTH - 100, SCREEN_HEIGHT - 100))
-        pygame.draw.ellipse(self.screen, GRASS_GREEN, (150, 150, SCREEN_WIDTH - 300, SCREEN_HEIGHT - 300))
-        
-        # Track border
-        pygame.draw.ellipse(self.screen, WHITE, (50, 50, SCREEN_WIDTH - 100, SCREEN_HEIGHT - 100), 3)
-        pygame.draw.ellipse(self.screen, WHITE, (150, 150, SCREEN_WIDTH - 300, SCREEN_HEIGHT - 300), 3)
+    def draw_track(self, surface):
+        """Draw the race track and its checkpoints onto a surface."""
+        # The grass and track never change; render them once and reuse them
+        # whenever a join brings new checkpoints
+        if self._track_base is None:
+            base = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            
+            # Background (grass)
+            base.fill(GRASS_GREEN)
+            
+            # Track (gray oval)
+            pygame.draw.ellipse(base, GRAY, (50, 50, SCREEN_WIDTH - 100, SCREEN_HEIGHT - 100))
+            pygame.draw.ellipse(base, GRASS_GREEN, (150, 150, SCREEN_WIDTH - 300, SCREEN_HEIGHT - 300))
+            
+            # Track border
+            pygame.draw.ellipse(base, WHITE, (50, 50, SCREEN_WIDTH - 100, SCREEN_HEIGHT - 100), 3)
+            pygame.draw.ellipse(base, WHITE, (150, 150, SCREEN_WIDTH - 300, SCREEN_HEIGHT - 300), 3)
+            
+            # Start/finish line
+            pygame.draw.rect(base, WHITE, (SCREEN_WIDTH - 150, SCREEN_HEIGHT // 2 - 50, 10, 100))
+            self._track_base = base
         
-        # Start/finish line
-        pygame.draw.rect(self.screen, WHITE, (SCREEN_WIDTH - 150, SCREEN_HEIGHT // 2 - 50, 10, 100))
+        surface.blit(self._track_base, (0, 0))
         
         # Checkpoints
         if self.track and "checkpoints" in self.track:
             for i, cp in enumerate(self.track["checkpoints"]):
-                pygame.draw.circle(self.screen, (255, 255, 0), (cp["x"], cp["y"]), 10)
-                text = self.small_font.render(str(i + 1), True, BLACK)
-                self.screen.blit(text, (cp["x"] - 5, cp["y"] - 8))
+                pygame.draw.circle(surface, (255, 255, 0), (cp["x"], cp["y"]), 10)
+                text = self.render_text(str(i + 1), BLACK)
+                surface.blit(text, (cp["x"] - 5, cp["y"] - 8))
+    
+    def render_text(self, text, color):
+        """Render text with small_font, reusing the surface while the text is unchanged."""
+        key = (text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = self.small_font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
     
     def draw_ui(self):
-        """Draw game UI."""
+        """Draw game UI and return the screen rects it touched."""
+        rects = []
+        
         # Connection status
         status = "CONNECTED" if self.connected else "CONNECTING..."
         color = GREEN if self.connected else (255, 255, 0)
-        text = self.small_font.render(status, True, color)
-        self.screen.blit(text, (10, 10))
+        text = self.render_text(status, color)
+        rects.append(self.screen.blit(text, (10, 10)))
         
         # Player count
         count = len(self.other_cars) + (1 if self.local_car else 0)
-        text = self.small_font.render(f"Players: {count}", True, WHITE)
-        self.screen.blit(text, (10, 35))
+        text = self.render_text(f"Players: {count}", WHITE)
+        rects.append(self.screen.blit(text, (10, 35)))
         
         # Speed indicator
         if self.local_car:
             speed_text = f"Speed: {abs(self.local_car.speed):.1f}"
-            text = self.small_font.render(speed_text, True, WHITE)
-            self.screen.blit(text, (SCREEN_WIDTH - 100, 10))
+            text = self.render_text(speed_text, WHITE)
+            rects.append(self.screen.blit(text, (SCREEN_WIDTH - 100, 10)))
         
         # Controls hint
         hint = "WASD/Arrows to drive | ESC to quit"
-        text = self.small_font.render(hint, True, (200, 200, 200))
-        self.screen.blit(text, (SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 25))
+        text = self.render_text(hint, (200, 200, 200))
+        rects.append(self.screen.blit(text, (SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 25)))
+        
+        return rects
     
-    async def send_position(self):
-        """Send local car position to server."""
+    def send_position(self):
+        """
+        Queue the packed position of the local car if it moved.
+        
+        Changes below MOVE_THRESHOLD are held back (other clients keep the
+        last value they saw), but the state is re-sent at least every
+        SEND_HEARTBEAT seconds.
+        """
         if self.connected and self.local_car:
+            state = self.local_car.to_dict()
+            now = time.monotonic()
+            last = self._last_sent_state
+            if (
+                last is not None
+                and now - self._last_sent_time <= SEND_HEARTBEAT
+                and all(abs(state[k] - last[k]) <= t for k, t in MOVE_THRESHOLD.items())
+            ):
+                return
+            self._last_sent_state = state
+            self._last_sent_time = now
+            payload = POS_FMT.pack(state["x"], state["y"], state["angle"], state["speed"])
+            self._net_loop.call_soon_threadsafe(self._outbox.put_nowait, payload)
+    
+    async def _net_main(self):
+        """Network thread: connect, then send queued updates until told to stop."""
+        self._net_loop = asyncio.get_running_loop()
+        self._outbox = asyncio.Queue()
+        try:
+            await self.connect()
+        except Exception as e:
+            print(f"Connection failed: {e}")
+            return
+        
+        while True:
+            payload = await self._outbox.get()
+            if payload is None:
+                break
             try:
-                await self.client.send("update_position", self.local_car.to_dict())
+                await self.client.send("update_position", payload)
             except:
                 pass
+        
+        await self.client.disconnect()
     
-    async def game_loop(self):
+    def game_loop(self):
         """Main game loop."""
-        send_timer = 0
-        
         while self.running:
+            # Apply messages received by the network thread
+            while self._inbox:
+                apply, data = self._inbox.popleft()
+                apply(data)
+            
             # Handle events
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -329,38 +490,63 @@ class RacingGame:
             if self.local_car:
                 self.local_car.update(keys)
             
-            # Send position every frame for smooth updates
-            await self.send_position()
+            # Send position at SEND_RATE instead of every frame
+            if self._send_accum >= 1 / SEND_RATE:
+                self._send_accum = 0.0
+                self.send_position()
             
-            # Draw
-            self.draw_track()
+            # Draw: rebuild the full frame only when the track changed
+            if self._track_bg is None:
+                self._track_bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+                self.draw_track(self._track_bg)
+                self.screen.blit(self._track_bg, (0, 0))
+                self._prev_rects = [self.screen.get_rect()]
+            
+            # Erase last frame's cars and UI
+            self.screen.blits(
+                [(self._track_bg, rect, rect) for rect in self._prev_rects],
+                doreturn=False,
+            )
             
-            # Draw other cars
+            # Draw all cars in one batched blit, local car last (on top)
+            sprites = []
             for pid, car in self.other_cars.items():
-                car.draw(self.screen, is_local=False)
+                sprites.extend(car.sprites())
+            if self.local_car:
+                sprites.extend(self.local_car.sprites())
+            _blit_all(self.screen, sprites)
+            drawn = [rect for _, rect in sprites]
             
-            # Draw local car (on top)
             if self.local_car:
-                self.local_car.draw(self.screen, is_local=True)
+                drawn.append(self.local_car.draw_indicator(self.screen))
             
             # Draw UI
-            self.draw_ui()
+            drawn.extend(self.draw_ui())
+            
+            pygame.display.update(self._prev_rects + drawn)
+            self._prev_rects = drawn
             
-            pygame.display.flip()
-            self.clock.tick(FPS)  # Standard blocking - heartbeat handled by library in separate thread
+            # Blocking is fine here: networking has its own thread
+            self._send_accum += self.clock.tick(FPS) / 1000
         
         pygame.quit()
     
-    async def run(self):
-        """Run the game."""
-        await self.connect()
-        await self.game_loop()
+    def run(self):
+        """Run networking on a background thread and the game on this one."""
+        net_thread = threading.Thread(
+            target=asyncio.run, args=(self._net_main(),), daemon=True
+        )
+        net_thread.start()
+        
+        self.game_loop()
         
-        if self.client:
-            await self.client.disconnect()
+        # Stop the send loop so the client disconnects cleanly
+        if self._net_loop is not None and self._net_loop.is_running():
+            self._net_loop.call_soon_threadsafe(self._outbox.put_nowait, None)
+        net_thread.join(timeout=2.0)
 
 
-async def main():
+def main():
     """Main entry point."""
     # Parse command line args
     host = sys.argv[1] if len(sys.argv) > 1 else "localhost"
@@ -370,8 +556,8 @@ async def main():
     print(f"Connecting to {host}:{port}...")
     
     game = RacingGame(host, port, password)
-    await game.run()
+    game.run()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
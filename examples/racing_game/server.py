@@ -7,6 +7,8 @@ Tracks player positions and broadcasts updates to all clients.
 """
 
 import asyncio
+import itertools
+import struct
 import sys
 import os
 
@@ -14,18 +16,51 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from conduit import Server, ServerDescriptor, data
+from conduit.protocol import ProtocolEncoder
 
+# Optional: uvloop's libuv event loop speeds up broadcast fan-out when installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-# Game state
-players = {}  # player_id -> {x, y, angle, speed, color, name}
-player_counter = 0
+
+class GameState:
+    """Players, their connections and the player ID counter."""
+    
+    __slots__ = ("players", "conns", "_ids")
+    
+    def __init__(self):
+        self.players = {}  # player_id -> {x, y, angle, speed, color, name}
+        self.conns = {}  # player_id -> connection, for broadcasts without scanning
+        self._ids = itertools.count(1)
+    
+    def new_player_id(self):
+        """Generate unique player ID."""
+        return f"player_{next(self._ids)}"
+
+
+state = GameState()
+
+# Position updates travel as x, y, angle, speed packed into 16 bytes
+# (must match POS_FMT in client.py)
+POS_FMT = struct.Struct("<4f")
+
+# Broadcasts are encoded once here and the same frame is queued per player
+encoder = ProtocolEncoder()
 
 
-def get_new_player_id():
-    """Generate unique player ID."""
-    global player_counter
-    player_counter += 1
-    return f"player_{player_counter}"
+async def send_to_players(message_type, data, exclude=None, _conns=state.conns):
+    """Send a message to every player except `exclude`, concurrently."""
+    frame = encoder.encode_message(message_type, data)
+    await asyncio.gather(
+        *(
+            conn.send_frame(frame)
+            for pid, conn in _conns.items()
+            if pid != exclude
+        ),
+        return_exceptions=True,
+    )
 
 
 # Create server
@@ -41,8 +76,10 @@ server = Server(ServerDescriptor(
 @server.on_client_connect
 async def on_connect(connection):
     """Handle new player connection."""
-    player_id = get_new_player_id()
+    player_id = state.new_player_id()
     connection.player_id = player_id
+    state.conns[player_id] = connection
+    players = state.players
     
     # Assign random starting position and color
     import random
@@ -76,66 +113,53 @@ async def on_connect(connection):
     })
     
     # Broadcast new player to others
-    for conn in server.connections:
-        if hasattr(conn, 'player_id') and conn.player_id != player_id:
-            await conn.send_message("player_joined", {
-                "player_id": player_id,
-                "data": players[player_id],
-            })
+    await send_to_players("player_joined", {
+        "player_id": player_id,
+        "data": players[player_id],
+    }, exclude=player_id)
 
 
 @server.on_client_disconnect
 async def on_disconnect(connection):
     """Handle player disconnect."""
-    if hasattr(connection, 'player_id'):
-        player_id = connection.player_id
-        if player_id in players:
-            del players[player_id]
-            print(f"[-] {player_id} left ({len(players)} players)")
-            
-            # Broadcast player left
-            for conn in server.connections:
-                if hasattr(conn, 'player_id') and conn.player_id != player_id:
-                    try:
-                        await conn.send_message("player_left", {"player_id": player_id})
-                    except:
-                        pass
+    player_id = getattr(connection, 'player_id', None)
+    state.conns.pop(player_id, None)
+    players = state.players
+    if player_id in players:
+        del players[player_id]
+        print(f"[-] {player_id} left ({len(players)} players)")
+        
+        # Broadcast player left
+        await send_to_players("player_left", {"player_id": player_id})
 
 
 @server.on("update_position")
-async def on_position_update(connection, data):
+async def on_position_update(connection, data, _players=state.players):
     """Handle player position update."""
     if not hasattr(connection, 'player_id'):
         return
     
     player_id = connection.player_id
-    if player_id not in players:
+    player = _players.get(player_id)
+    if player is None:
         return
     
-    # Update player state
-    players[player_id].update({
-        "x": data.get("x", players[player_id]["x"]),
-        "y": data.get("y", players[player_id]["y"]),
-        "angle": data.get("angle", players[player_id]["angle"]),
-        "speed": data.get("speed", players[player_id]["speed"]),
-    })
+    # Clients send POS_FMT-packed bytes
+    if not isinstance(data, bytes) or len(data) != POS_FMT.size:
+        return
+    player["x"], player["y"], player["angle"], player["speed"] = POS_FMT.unpack(data)
     
-    # Broadcast to all other players
-    for conn in server.connections:
-        if hasattr(conn, 'player_id') and conn.player_id != player_id:
-            try:
-                await conn.send_message("player_update", {
-                    "player_id": player_id,
-                    "data": players[player_id],
-                })
-            except:
-                pass
+    # Forward the packed position unchanged to all other players
+    await send_to_players("player_update", {
+        "player_id": player_id,
+        "data": data,
+    }, exclude=player_id)
 
 
 @server.rpc(name="get_players")
 async def get_players():
     """Get all current players."""
-    return players
+    return state.players
 
 
 @server.rpc(name="set_name")
@@ -144,8 +168,8 @@ async def set_name(request):
     player_id = request.player_id
     name = request.name
     
-    if player_id in players:
-        players[player_id]["name"] = name
+    if player_id in state.players:
+        state.players[player_id]["name"] = name
         return {"success": True}
     return {"success": False}
 
@@ -155,16 +179,11 @@ async def game_loop():
     while True:
         await asyncio.sleep(1.0)  # Just for late joiner sync
         
-        if not players:
+        if not state.players:
             continue
         
         # Sync full state occasionally (for late joiners)
-        for conn in server.connections:
-            if hasattr(conn, 'player_id'):
-                try:
-                    await conn.send_message("game_state", {"players": players})
-                except:
-                    pass
+        await send_to_players("game_state", {"players": state.players})
 
 
 async def main():
@@ -191,4 +210,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -1,10 +1,17 @@
 # server.py - Echo Server with Time Logging
 import asyncio
+import operator
 import time
+from array import array
 import logging
-from datetime import datetime
 from conduit import Server, ServerDescriptor
 
+# Optional: uvloop's libuv event loop speeds up socket I/O when installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Configure time-based logging
 logging.basicConfig(
     level=logging.DEBUG,
@@ -13,9 +20,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger("SERVER")
 
+# Reference point for the uptime in server_status
+_started = time.monotonic()
+
+# Whole second and its "HH:MM:SS" text; strftime runs at most once a second
+_second_cache = [0, ""]
+
 def timestamp():
-    """Get current timestamp string."""
-    return datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    """Get current timestamp string (HH:MM:SS.mmm)."""
+    now = time.time()
+    second = int(now)
+    if second != _second_cache[0]:
+        _second_cache[0] = second
+        _second_cache[1] = time.strftime("%H:%M:%S", time.localtime(second))
+    return f"{_second_cache[1]}.{int((now - second) * 1000):03d}"
 
 server = Server(ServerDescriptor(
     host="0.0.0.0",
@@ -24,37 +42,110 @@ server = Server(ServerDescriptor(
     name="EchoServer",
 ))
 
-users = {}
+class ClientTable:
+    """Connected clients as parallel arrays: IDs, short IDs and connect times."""
+    
+    def __init__(self):
+        self.ids = []
+        self.short_ids = []  # First 8 characters of each ID, as shown to clients
+        self.connected_at = array("d")
+        self._index = {}  # client id -> position in the arrays
+    
+    def __len__(self):
+        return len(self.ids)
+    
+    def add(self, client_id, short_id, when):
+        self._index[client_id] = len(self.ids)
+        self.ids.append(client_id)
+        self.short_ids.append(short_id)
+        self.connected_at.append(when)
+    
+    def remove(self, client_id):
+        """Remove a client and return its connect time, or None if unknown."""
+        i = self._index.pop(client_id, None)
+        if i is None:
+            return None
+        when = self.connected_at[i]
+        # Move the last entry into the hole so removal is O(1)
+        last_id = self.ids.pop()
+        last_short_id = self.short_ids.pop()
+        last_when = self.connected_at.pop()
+        if last_id != client_id:
+            self.ids[i] = last_id
+            self.short_ids[i] = last_short_id
+            self.connected_at[i] = last_when
+            self._index[last_id] = i
+        return when
+
+users = ClientTable()
 
 
 # === RPC Methods ===
 
 @server.rpc
 async def echo(message: str) -> str:
-    logger.info(f"[{timestamp()}] RPC echo: {message}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("RPC echo: %s", message)
     return message
 
 @server.rpc
 async def reverse(text: str) -> str:
-    logger.info(f"[{timestamp()}] RPC reverse: {text}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("RPC reverse: %s", text)
     return text[::-1]
 
+_OPS = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "div": lambda a, b: a / b if b else 0,
+}
+
+def _unknown_op(a, b):
+    return 0
+
+# One RPC per operation, each sharing calculate's implementation in _OPS
+@server.rpc
+async def add(a: float, b: float) -> float:
+    return _OPS["add"](a, b)
+
+@server.rpc
+async def sub(a: float, b: float) -> float:
+    return _OPS["sub"](a, b)
+
+@server.rpc
+async def mul(a: float, b: float) -> float:
+    return _OPS["mul"](a, b)
+
+@server.rpc
+async def div(a: float, b: float) -> float:
+    return _OPS["div"](a, b)
+
 @server.rpc
 async def calculate(a: float, b: float, op: str) -> float:
-    logger.info(f"[{timestamp()}] RPC calculate: {a} {op} {b}")
-    ops = {"add": a + b, "sub": a - b, "mul": a * b, "div": a / b if b else 0}
-    result = ops.get(op, 0)
-    logger.info(f"[{timestamp()}] Result: {result}")
+    result = _OPS.get(op, _unknown_op)(a, b)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("RPC calculate: %s %s %s = %s", a, op, b, result)
     return result
 
+# Whole second with its "formatted" and ISO texts, rebuilt at most once a second
+_time_cache = [0, "", ""]
+
 @server.rpc
 async def get_time() -> dict:
-    now = datetime.now()
-    logger.info(f"[{timestamp()}] RPC get_time")
+    now = time.time()
+    second = int(now)
+    if second != _time_cache[0]:
+        local = time.localtime(second)
+        _time_cache[0] = second
+        _time_cache[1] = time.strftime("%Y-%m-%d %H:%M:%S", local)
+        _time_cache[2] = time.strftime("%Y-%m-%dT%H:%M:%S", local)
+    logger.info("RPC get_time")
+    micros = int((now - second) * 1_000_000)
     return {
-        "timestamp": time.time(),
-        "formatted": now.strftime("%Y-%m-%d %H:%M:%S"),
-        "iso": now.isoformat(),
+        "timestamp": now,
+        "formatted": _time_cache[1],
+        "iso": f"{_time_cache[2]}.{micros:06d}" if micros else _time_cache[2],
     }
 
 @server.rpc
@@ -70,7 +161,7 @@ async def broadcast(message_type: str, data: dict, sender: str = "Anonymous") ->
     Returns:
         Number of recipients
     """
-    logger.info(f"[{timestamp()}] RPC broadcast: {message_type} from {sender}")
+    logger.info("RPC broadcast: %s from %s", message_type, sender)
     
     # Add metadata
     broadcast_data = {
@@ -81,14 +172,14 @@ async def broadcast(message_type: str, data: dict, sender: str = "Anonymous") ->
     }
     
     count = await server.broadcast(message_type, broadcast_data)
-    logger.info(f"[{timestamp()}] Broadcast '{message_type}' to {count} clients")
+    logger.info("Broadcast '%s' to %d clients", message_type, count)
     
     return {"sent": True, "recipients": count, "message_type": message_type}
 
 @server.rpc
 async def send_to_all(message: str, sender: str = "System") -> dict:
     """Quick broadcast a chat message to all clients."""
-    logger.info(f"[{timestamp()}] RPC send_to_all: {message}")
+    logger.info("RPC send_to_all: %s", message)
     
     count = await server.broadcast("chat", {
         "from": sender,
@@ -104,8 +195,8 @@ async def get_clients() -> dict:
     """Get list of connected clients."""
     return {
         "count": len(users),
-        "clients": [{"id": uid[:8], "connected_at": info.get("connected_at")} 
-                   for uid, info in users.items()]
+        "clients": [{"id": short_id, "connected_at": when}
+                   for short_id, when in zip(users.short_ids, users.connected_at, strict=True)]
     }
 
 @server.rpc
@@ -115,6 +206,10 @@ async def help() -> dict:
         "rpc_methods": {
             "echo": "Echo back a message. Args: message (str)",
             "reverse": "Reverse text. Args: text (str)",
+            "add": "Add. Args: a (float), b (float)",
+            "sub": "Subtract. Args: a (float), b (float)",
+            "mul": "Multiply. Args: a (float), b (float)",
+            "div": "Divide (0 if b is 0). Args: a (float), b (float)",
             "calculate": "Calculate math. Args: a (float), b (float), op (str: add/sub/mul/div)",
             "get_time": "Get server time. No args.",
             "broadcast": "Broadcast to all clients. Args: message_type (str), data (dict), sender (str)",
@@ -137,23 +232,26 @@ async def help() -> dict:
 async def handle_chat(client, data):
     sender = data.get("username", "Anonymous")
     message = data.get("message", "")
-    logger.info(f"[{timestamp()}] CHAT from {sender}: {message}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("CHAT from %s: %s", sender, message)
     
     count = await server.broadcast("chat", {
         "from": sender,
         "message": message,
         "time": time.time(),
         "timestamp": timestamp(),
-    }, exclude={client.id})
+    }, exclude=frozenset((client.id,)))
     
-    logger.info(f"[{timestamp()}] Broadcast to {count} clients")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Broadcast to %d clients", count)
     return {"sent": True, "recipients": count}
 
 @server.on("ping")
 async def handle_ping(client, data):
     send_time = data.get("client_time", 0)
     receive_time = time.time()
-    logger.info(f"[{timestamp()}] PING received, latency: {(receive_time - send_time)*1000:.2f}ms")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("PING received, latency: %.2fms", (receive_time - send_time) * 1000)
     return {"pong": True, "server_time": receive_time}
 
 
@@ -163,25 +261,27 @@ async def handle_ping(client, data):
 async def on_startup(srv):
     logger.info("=" * 60)
     logger.info(f"[{timestamp()}] Server starting on {srv.address}")
-    logger.info(f"[{timestamp()}] Available RPC: echo, reverse, calculate, get_time")
+    logger.info(f"[{timestamp()}] Available RPC: echo, reverse, add, sub, mul, div, calculate, get_time")
     logger.info("=" * 60)
 
 @server.on_client_connect
 async def on_client_connect(conn):
-    users[conn.id] = {"connected_at": time.time()}
-    logger.info(f"[{timestamp()}] [+] Client {conn.id[:8]} connected (Total: {len(users)})")
+    short_id = conn.id[:8]
+    users.add(conn.id, short_id, time.time())
+    logger.info(f"[{timestamp()}] [+] Client {short_id} connected (Total: {len(users)})")
     await server.broadcast("user_joined", {
-        "id": conn.id[:8],
+        "id": short_id,
         "time": timestamp(),
-    }, exclude={conn.id})
+    }, exclude=frozenset((conn.id,)))
 
 @server.on_client_disconnect
 async def on_client_disconnect(conn):
-    connect_time = users.get(conn.id, {}).get("connected_at", time.time())
-    duration = time.time() - connect_time
-    users.pop(conn.id, None)
-    logger.info(f"[{timestamp()}] [-] Client {conn.id[:8]} disconnected after {duration:.1f}s (Total: {len(users)})")
-    await server.broadcast("user_left", {"id": conn.id[:8], "time": timestamp()})
+    short_id = conn.id[:8]
+    now = time.time()
+    connect_time = users.remove(conn.id)
+    duration = now - connect_time if connect_time is not None else 0.0
+    logger.info(f"[{timestamp()}] [-] Client {short_id} disconnected after {duration:.1f}s (Total: {len(users)})")
+    await server.broadcast("user_left", {"id": short_id, "time": timestamp()})
 
 
 # === Background Tasks ===
@@ -190,10 +290,11 @@ async def send_server_updates():
     while True:
         await asyncio.sleep(30)
         if server.is_running and server.connection_count > 0:
-            logger.debug(f"[{timestamp()}] Broadcasting status to {server.connection_count} clients")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[%s] Broadcasting status to %d clients", timestamp(), server.connection_count)
             await server.broadcast("server_status", {
                 "clients": server.connection_count,
-                "uptime": time.time(),
+                "uptime": time.monotonic() - _started,
                 "time": timestamp(),
             })
 
@@ -204,4 +305,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
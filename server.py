@@ -4,9 +4,59 @@ Properly designed with ServerDescriptor configuration
 """
 
 import asyncio
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
 from conduit import Server, ServerDescriptor
 from conduit.response import Response, Error
 
+
+# Optional: uvloop's libuv event loop speeds up socket I/O when installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# Example output goes through a queue and is written to stdout by a
+# background thread, so handlers never block the event loop on print()
+log = logging.getLogger("example_server")
+
+
+def start_log_listener() -> logging.handlers.QueueListener:
+    """Route this example's log output to stdout via a QueueListener thread."""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
+def write_upload(filepath: str, content: bytes, append: bool = False) -> None:
+    """
+    Write uploaded bytes straight to the file descriptor.
+    
+    Unbuffered os.write calls on a memoryview skip the BufferedWriter layer
+    and never copy the content; run it in a thread so the disk write doesn't
+    stall the event loop.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if append else os.O_TRUNC)
+    fd = os.open(filepath, flags, 0o644)
+    try:
+        with memoryview(content) as view:
+            while view:
+                view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 r = Response()
 e = Error()
 
@@ -20,7 +70,7 @@ async def main():
         # Network configuration
         host="0.0.0.0",  # Listen on all interfaces (IPv4)
         port=8080,
-        ipv6=True,  # Also listen on IPv6
+        ipv6=False,  # Set host="::" and ipv6=True to listen on IPv6
         
         # Authentication
         password="kaede123",
@@ -47,6 +97,7 @@ async def main():
     
     # Create server instance
     server = Server(config)
+    started = time.monotonic()
     
     
     # ========================================================================
@@ -56,8 +107,8 @@ async def main():
     @server.on("hello")
     async def handle_hello(client, data):
         """Handle 'hello' message type"""
-        print(f"[{client.id}] Received hello: {data}")
-        await client.send("hello", f"Hi back! You said: {data}")
+        log.info(f"[{client.id}] Received hello: {data}")
+        await client.send_message("hello", f"Hi back! You said: {data}")
     
     
     @server.on("chat")
@@ -66,15 +117,34 @@ async def main():
         message = data.get("message")
         username = data.get("username", "Anonymous")
         
-        print(f"[{client.id}] {username}: {message}")
+        log.info(f"[{client.id}] {username}: {message}")
         
         # Echo back to sender
-        await client.send("chat", {
+        await client.send_message("chat", {
             "from": "server",
             "message": f"Echo: {message}"
         })
     
     
+    @server.on("file_chunk")
+    async def handle_file_chunk(client, data):
+        """Handle streamed file chunks (see Client.send_file)"""
+        os.makedirs("./uploads", exist_ok=True)
+        
+        filename = os.path.basename(data["filename"])
+        filepath = f"./uploads/{filename}"
+        await asyncio.to_thread(write_upload, filepath, data["data"], data["seq"] != 0)
+        
+        if data["last"]:
+            file_size = os.path.getsize(filepath)
+            log.info(f"[{client.id}] Saved file: {filename} ({file_size} bytes)")
+            await client.send_message("file_ack", {
+                "filename": filename,
+                "status": "saved",
+                "size": file_size
+            })
+    
+    
     @server.on("file")
     async def handle_file(client, data):
         """Handle file transfers"""
@@ -83,16 +153,14 @@ async def main():
         file_size = len(content)
         
         # Save file
-        import os
         os.makedirs("./uploads", exist_ok=True)
         
         filepath = f"./uploads/{filename}"
-        with open(filepath, "wb") as f:
-            f.write(content)
+        await asyncio.to_thread(write_upload, filepath, content)
         
-        print(f"[{client.id}] Saved file: {filename} ({file_size} bytes)")
+        log.info(f"[{client.id}] Saved file: {filename} ({file_size} bytes)")
         
-        await client.send("file_ack", {
+        await client.send_message("file_ack", {
             "filename": filename,
             "status": "saved",
             "size": file_size
@@ -104,7 +172,7 @@ async def main():
         """Broadcast message to all connected clients"""
         message = data.get("message")
         
-        print(f"[{client.id}] Broadcasting: {message}")
+        log.info(f"[{client.id}] Broadcasting: {message}")
         
         # Send to all clients except sender
         await server.broadcast("broadcast", {
@@ -126,11 +194,11 @@ async def main():
             "name": config.name,
             "version": config.version,
             "description": config.description,
-            "uptime": server.uptime(),
-            "active_connections": server.connection_count(),
+            "uptime": time.monotonic() - started,
+            "active_connections": server.connection_count,
             "max_connections": config.max_connections,
-            "total_bytes_sent": server.total_bytes_sent(),
-            "total_bytes_received": server.total_bytes_received(),
+            "total_bytes_sent": sum(c.stats.bytes_sent for c in server.connections),
+            "total_bytes_received": sum(c.stats.bytes_received for c in server.connections),
         }
     
     
@@ -140,35 +208,58 @@ async def main():
         return {"echo": message}
     
     
+    # One RPC per operation: the RPC registry's name lookup is the only
+    # dispatch, and each handler is just the arithmetic
+    @server.rpc
+    async def add(a, b):
+        """Add two numbers"""
+        return {"result": a + b}
+    
+    
+    @server.rpc
+    async def subtract(a, b):
+        """Subtract b from a"""
+        return {"result": a - b}
+    
+    
+    @server.rpc
+    async def multiply(a, b):
+        """Multiply two numbers"""
+        return {"result": a * b}
+    
+    
+    @server.rpc
+    async def divide(a, b):
+        """Divide a by b"""
+        if b == 0:
+            raise ValueError("Division by zero")
+        return {"result": a / b}
+    
+    
+    calc_operations = {"add": add, "subtract": subtract, "multiply": multiply, "divide": divide}
+    
     @server.rpc
     async def calculate(operation, a, b):
-        """Perform calculation"""
-        if operation == "add":
-            return {"result": a + b}
-        elif operation == "subtract":
-            return {"result": a - b}
-        elif operation == "multiply":
-            return {"result": a * b}
-        elif operation == "divide":
-            if b == 0:
-                raise ValueError("Division by zero")
-            return {"result": a / b}
-        else:
+        """Perform calculation (for callers that pass the operation by name)"""
+        handler = calc_operations.get(operation)
+        if handler is None:
             raise ValueError(f"Unknown operation: {operation}")
+        return await handler(a, b)
     
     
     @server.rpc
     async def list_clients():
         """Get list of connected clients"""
         clients = []
-        for client in server.get_clients():
+        for client in server.connections:
+            address, port = client.remote_address[:2]
             clients.append({
                 "id": client.id,
-                "address": client.address,
-                "port": client.port,
-                "connected_at": client.connected_at,
-                "bytes_sent": client.bytes_sent,
-                "bytes_received": client.bytes_received,
+                "address": address,
+                "port": port,
+                "connected_at": client.stats.connected_at,
+                "bytes_sent": client.stats.bytes_sent,
+                "bytes_received": client.stats.bytes_received,
             })
         return {"clients": clients}
     
@@ -177,63 +268,60 @@ async def main():
     # Lifecycle Hooks
     # ========================================================================
     
-    @server.on_connect
+    @server.on_client_connect
     async def on_client_connect(client):
         """Called when a client connects and authenticates"""
-        print(f"✓ Client connected: {client.id} from {client.address}:{client.port}")
+        address, port = client.remote_address[:2]
+        log.info(f"✓ Client connected: {client.id} from {address}:{port}")
         
         # Send welcome message
-        await client.send("welcome", {
+        await client.send_message("welcome", {
             "message": "Welcome to Conduit Server!",
             "server": config.name,
             "your_id": client.id
         })
     
     
-    @server.on_disconnect
-    async def on_client_disconnect(client, reason):
+    @server.on_client_disconnect
+    async def on_client_disconnect(client):
         """Called when a client disconnects"""
-        print(f"✗ Client disconnected: {client.id} (Reason: {reason})")
-    
-    
-    @server.on_heartbeat_timeout
-    async def on_heartbeat_timeout(client):
-        """Called when client fails to respond to heartbeat"""
-        print(f"⚠ Heartbeat timeout for client: {client.id}")
-        # Server will auto-disconnect the client
-    
-    
-    @server.on_error
-    async def on_error(client, error):
-        """Called when an error occurs with a client"""
-        print(f"✗ Error with client {client.id}: {error}")
+        log.info(f"✗ Client disconnected: {client.id}")
     
     
     # ========================================================================
     # Start Server
     # ========================================================================
     
-    print("=" * 60)
-    print(f"Starting {config.name} v{config.version}")
-    print(f"Listening on {config.host}:{config.port}")
-    print(f"Max connections: {config.max_connections}")
-    print(f"Heartbeat interval: {config.heartbeat_interval}s")
-    print("=" * 60)
+    log.info("=" * 60)
+    log.info(f"Starting {config.name} v{config.version}")
+    log.info(f"Listening on {config.host}:{config.port}")
+    log.info(f"Max connections: {config.max_connections}")
+    log.info(f"Heartbeat interval: {config.heartbeat_interval}s")
+    log.info("=" * 60)
     
-    # Start the server
-    await server.start()
+    @server.on_startup
+    async def on_startup(srv):
+        log.info("✓ Server started successfully")
+        log.info("Press Ctrl+C to stop")
     
-    print("✓ Server started successfully")
-    print("Press Ctrl+C to stop")
     
-    # Keep server running
-    try:
-        await server.wait_until_stopped()
-    except KeyboardInterrupt:
-        print("\n\nShutting down server...")
-        await server.stop()
-        print("✓ Server stopped")
+    @server.on_shutdown
+    async def on_shutdown(srv):
+        log.info("✓ Server stopped")
+    
+    
+    # Run until stopped; Ctrl+C cancels run(), which stops the server
+    await server.run()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    listener = start_log_listener()
+    try:
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.stop()
@@ -32,15 +32,17 @@ from conduit.transport import TCPSocket
 
 
 def log_raw_bytes(label: str, data: bytes, max_display: int = 100):
-    """Log raw bytes in readable format."""
-    hex_str = data[:max_display].hex()
-    display = ' '.join(hex_str[i:i+2] for i in range(0, len(hex_str), 2))
+    """Log raw bytes in readable format (DEBUG level only)."""
+    # Hex-dumping is O(n) per message; skip it entirely when DEBUG is off
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    display = data[:max_display].hex(' ')
     if len(data) > max_display:
         display += f" ... ({len(data)} total bytes)"
-    logger.info(f"[RAW {label}] {display}")
+    logger.debug("[RAW %s] %s", label, display)
 
 
-async def run_tests(host: str, port: int, password: str, ipv6: bool = False):
+async def run_tests(host: str, port: int, password_hash: str, ipv6: bool = False):
     """Run all client tests."""
     
     encoder = ProtocolEncoder()
@@ -53,6 +55,43 @@ async def run_tests(host: str, port: int, password: str, ipv6: bool = False):
     logger.info("=" * 60)
     
     socket = None
+    reader_task = None
+    
+    # One background task reads and decodes everything the server sends,
+    # however frames are split across reads. RPC responses resolve the
+    # future registered under their correlation ID; all other frames are
+    # queued in arrival order.
+    pending: dict[int, asyncio.Future] = {}
+    frames: asyncio.Queue = asyncio.Queue()
+    
+    async def reader_loop():
+        try:
+            while True:
+                data = await socket.read(65536)
+                if not data:
+                    break
+                log_raw_bytes("RECEIVED", data)
+                decoder.feed(data)
+                while (message := decoder.decode_one()) is not None:
+                    future = pending.pop(message.correlation_id, None)
+                    if future is not None and not future.done():
+                        future.set_result(message)
+                    else:
+                        frames.put_nowait(message)
+        finally:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Connection closed"))
+    
+    def expect(corr_id: int) -> asyncio.Future:
+        """Register for the RPC response with this correlation ID."""
+        future = asyncio.get_running_loop().create_future()
+        pending[corr_id] = future
+        return future
+    
+    async def next_frame():
+        """Wait for the next frame that isn't an RPC response."""
+        return await asyncio.wait_for(frames.get(), timeout=5.0)
     
     try:
         # Step 1: Connect
@@ -64,11 +103,11 @@ async def run_tests(host: str, port: int, password: str, ipv6: bool = False):
             use_ipv6=ipv6,
         )
         logger.info(f"✓ Connected! Local: {socket.local_address}, Remote: {socket.remote_address}")
+        reader_task = asyncio.create_task(reader_loop())
         logger.info("-" * 60)
         
         # Step 2: Send AUTH_REQUEST
         logger.info("Step 1: Sending AUTH_REQUEST...")
-        password_hash = hashlib.sha256(password.encode()).hexdigest()
         logger.info(f"[AUTH] Password hash: {password_hash[:16]}...")
         
         auth_msg = encoder.encode_auth_request(
@@ -80,15 +119,7 @@ async def run_tests(host: str, port: int, password: str, ipv6: bool = False):
         
         # Step 3: Wait for AUTH response
         logger.info("Waiting for auth response...")
-        raw_response = await asyncio.wait_for(socket.read(4096), timeout=5.0)
-        log_raw_bytes("RECEIVED", raw_response)
-        
-        decoder.feed(raw_response)
-        auth_response = decoder.decode_one()
-        
-        if auth_response is None:
-            logger.error("Failed to decode auth response")
-            return False
+        auth_response = await next_frame()
         
         logger.info(f"[DECODED] Type: {auth_response.message_type.name}")
         logger.info(f"[DECODED] Payload: {auth_response.payload}")
@@ -103,65 +134,49 @@ async def run_tests(host: str, port: int, password: str, ipv6: bool = False):
         logger.info(f"[AUTH] Server info: {server_info}")
         logger.info("-" * 60)
         
-        # Step 4: Test RPC - listall
-        logger.info("Step 2: Testing RPC 'listall'...")
-        rpc_msg, corr_id = encoder.encode_rpc_request(method="listall", params={})
-        logger.info(f"[RPC] Correlation ID: {corr_id}")
-        log_raw_bytes("SENDING RPC_REQUEST", rpc_msg)
-        await socket.write(rpc_msg)
-        
-        raw_response = await asyncio.wait_for(socket.read(4096), timeout=5.0)
-        log_raw_bytes("RECEIVED", raw_response)
-        
-        decoder.feed(raw_response)
-        rpc_response = decoder.decode_one()
-        
-        if rpc_response:
-            logger.info(f"[DECODED] Type: {rpc_response.message_type.name}")
-            logger.info(f"[DECODED] Correlation ID: {rpc_response.correlation_id}")
-            logger.info(f"[DECODED] Payload: {rpc_response.payload}")
+        # Steps 2-4: RPCs are pipelined - all requests go out in one write
+        # and the responses are matched back up by correlation ID
+        logger.info("Steps 2-4: Sending RPCs 'listall', 'add(a=10, b=20)', 'multiply(x=3.5, y=2.0)'...")
+        requests = [
+            encoder.encode_rpc_request(method="listall", params={}),
+            encoder.encode_rpc_request(method="add", params={"a": 10, "b": 20}),
+            encoder.encode_rpc_request(method="multiply", params={"x": 3.5, "y": 2.0}),
+        ]
+        futures = []
+        for rpc_msg, corr_id in requests:
+            logger.info(f"[RPC] Correlation ID: {corr_id}")
+            log_raw_bytes("SENDING RPC_REQUEST", rpc_msg)
+            futures.append(expect(corr_id))
+        await socket.write(b"".join(rpc_msg for rpc_msg, _ in requests))
+        listall_response, add_response, multiply_response = await asyncio.wait_for(
+            asyncio.gather(*futures), timeout=5.0
+        )
         logger.info("-" * 60)
         
-        # Step 5: Test RPC - add
-        logger.info("Step 3: Testing RPC 'add(a=10, b=20)'...")
-        rpc_msg, corr_id = encoder.encode_rpc_request(method="add", params={"a": 10, "b": 20})
-        logger.info(f"[RPC] Correlation ID: {corr_id}")
-        log_raw_bytes("SENDING RPC_REQUEST", rpc_msg)
-        await socket.write(rpc_msg)
-        
-        raw_response = await asyncio.wait_for(socket.read(4096), timeout=5.0)
-        log_raw_bytes("RECEIVED", raw_response)
-        
-        decoder.feed(raw_response)
-        rpc_response = decoder.decode_one()
-        
-        if rpc_response:
-            logger.info(f"[DECODED] Type: {rpc_response.message_type.name}")
-            logger.info(f"[DECODED] Payload: {rpc_response.payload}")
-            
-            result = rpc_response.payload.get("result")
-            expected = 30
-            if result == expected:
-                logger.info(f"[RESULT] ✓ add(10, 20) = {result} (CORRECT)")
-            else:
-                logger.error(f"[RESULT] ❌ add(10, 20) = {result} (expected {expected})")
+        # Step 2: listall
+        logger.info("Step 2: RPC 'listall'")
+        logger.info(f"[DECODED] Type: {listall_response.message_type.name}")
+        logger.info(f"[DECODED] Correlation ID: {listall_response.correlation_id}")
+        logger.info(f"[DECODED] Payload: {listall_response.payload}")
         logger.info("-" * 60)
         
-        # Step 6: Test RPC - multiply
-        logger.info("Step 4: Testing RPC 'multiply(x=3.5, y=2.0)'...")
-        rpc_msg, corr_id = encoder.encode_rpc_request(method="multiply", params={"x": 3.5, "y": 2.0})
-        log_raw_bytes("SENDING RPC_REQUEST", rpc_msg)
-        await socket.write(rpc_msg)
-        
-        raw_response = await asyncio.wait_for(socket.read(4096), timeout=5.0)
-        log_raw_bytes("RECEIVED", raw_response)
+        # Step 3: add
+        logger.info("Step 3: RPC 'add(a=10, b=20)'")
+        logger.info(f"[DECODED] Type: {add_response.message_type.name}")
+        logger.info(f"[DECODED] Payload: {add_response.payload}")
         
-        decoder.feed(raw_response)
-        rpc_response = decoder.decode_one()
+        result = add_response.payload.get("result")
+        expected = 30
+        if result == expected:
+            logger.info(f"[RESULT] ✓ add(10, 20) = {result} (CORRECT)")
+        else:
+            logger.error(f"[RESULT] ❌ add(10, 20) = {result} (expected {expected})")
+        logger.info("-" * 60)
         
-        if rpc_response:
-            result = rpc_response.payload.get("result")
-            logger.info(f"[RESULT] multiply(3.5, 2.0) = {result}")
+        # Step 4: multiply
+        logger.info("Step 4: RPC 'multiply(x=3.5, y=2.0)'")
+        result = multiply_response.payload.get("result")
+        logger.info(f"[RESULT] multiply(3.5, 2.0) = {result}")
         logger.info("-" * 60)
         
         # Step 7: Test regular message
@@ -170,11 +185,7 @@ async def run_tests(host: str, port: int, password: str, ipv6: bool = False):
         log_raw_bytes("SENDING MESSAGE", msg)
         await socket.write(msg)
         
-        raw_response = await asyncio.wait_for(socket.read(4096), timeout=5.0)
-        log_raw_bytes("RECEIVED", raw_response)
-        
-        decoder.feed(raw_response)
-        msg_response = decoder.decode_one()
+        msg_response = await next_frame()
         
         if msg_response:
             logger.info(f"[DECODED] Type: {msg_response.message_type.name}")
@@ -187,11 +198,7 @@ async def run_tests(host: str, port: int, password: str, ipv6: bool = False):
         log_raw_bytes("SENDING PING", ping)
         await socket.write(ping)
         
-        raw_response = await asyncio.wait_for(socket.read(4096), timeout=5.0)
-        log_raw_bytes("RECEIVED PONG", raw_response)
-        
-        decoder.feed(raw_response)
-        pong = decoder.decode_one()
+        pong = await next_frame()
         
         if pong:
             logger.info(f"[DECODED] Type: {pong.message_type.name}")
@@ -215,6 +222,8 @@ async def run_tests(host: str, port: int, password: str, ipv6: bool = False):
         logger.error(f"❌ Error: {e}", exc_info=True)
         return False
     finally:
+        if reader_task:
+            reader_task.cancel()
         if socket:
             await socket.close()
             logger.info("Connection closed.")
@@ -232,7 +241,8 @@ async def main():
     else:
         host = "127.0.0.1"
     
-    success = await run_tests(host, args.port, args.password, args.ipv6)
+    password_hash = hashlib.sha256(args.password.encode()).hexdigest()
+    success = await run_tests(host, args.port, password_hash, args.ipv6)
     
     if success:
         print("\n✓ All tests passed!")
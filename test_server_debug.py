@@ -14,6 +14,10 @@ import asyncio
 import logging
 import sys
 import hashlib
+import hmac
+import secrets
+import struct
+import time
 import argparse
 
 # Setup detailed logging
@@ -32,18 +36,88 @@ from conduit.transport import TCPServer, TCPSocket
 
 
 def log_raw_bytes(label: str, data: bytes, max_display: int = 100):
-    """Log raw bytes in readable format."""
-    hex_str = data[:max_display].hex()
-    display = ' '.join(hex_str[i:i+2] for i in range(0, len(hex_str), 2))
+    """Log raw bytes in readable format (DEBUG level only)."""
+    # Hex-dumping is O(n) per message; skip it entirely when DEBUG is off
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    display = data[:max_display].hex(' ')
     if len(data) > max_display:
         display += f" ... ({len(data)} total bytes)"
-    logger.info(f"[RAW {label}] {display}")
+    logger.debug("[RAW %s] %s", label, display)
+
+
+LISTALL_RESULT = {
+    "methods": [
+        {"name": "add", "description": "Add two numbers"},
+        {"name": "echo", "description": "Echo back message"},
+        {"name": "multiply", "description": "Multiply two numbers"},
+    ],
+    "count": 3
+}
+
+
+def rpc_listall(params: dict):
+    """List the available RPC methods."""
+    return LISTALL_RESULT
+
+
+def rpc_add(params: dict):
+    """Add two numbers."""
+    a = params.get("a", 0)
+    b = params.get("b", 0)
+    result = a + b
+    logger.info("[RPC] add(%s, %s) = %s", a, b, result)
+    return result
+
+
+def rpc_multiply(params: dict):
+    """Multiply two numbers."""
+    x = params.get("x", 0)
+    y = params.get("y", 0)
+    result = x * y
+    logger.info("[RPC] multiply(%s, %s) = %s", x, y, result)
+    return result
+
+
+def rpc_echo(params: dict):
+    """Echo back the message."""
+    result = params.get("message", "")
+    logger.info("[RPC] echo('%s')", result)
+    return result
+
+
+# Correlation ID and timestamp are the last two header fields
+_STAMP = struct.Struct(">QQ")
+_STAMP_OFFSET = HEADER_SIZE - _STAMP.size
+
+
+def restamp(template: bytes, correlation_id: int) -> bytearray:
+    """Copy a pre-encoded frame with a new correlation ID and timestamp."""
+    frame = bytearray(template)
+    _STAMP.pack_into(frame, _STAMP_OFFSET, correlation_id, int(time.time() * 1000))
+    return frame
+
+
+# Method name -> handler, looked up once per request instead of an if/elif chain
+RPC_HANDLERS = {
+    "listall": rpc_listall,
+    "add": rpc_add,
+    "multiply": rpc_multiply,
+    "echo": rpc_echo,
+}
 
 
 def create_server(host: str, port: int, password: str, ipv6: bool = False):
     """Create a test server."""
     
     encoder = ProtocolEncoder()
+    # The password is fixed for the server's lifetime, so hash it once
+    expected_digest = hashlib.sha256(password.encode()).digest()
+    # Responses for constant results, encoded once and restamped per request
+    response_templates = {
+        "listall": encoder.encode_rpc_response(LISTALL_RESULT, 0),
+    }
+    auth_failure_template = encoder.encode_auth_failure("Invalid password")
     
     async def handle_client(socket: TCPSocket):
         """Handle a single client connection."""
@@ -59,23 +133,21 @@ def create_server(host: str, port: int, password: str, ipv6: bool = False):
             # Step 1: Wait for auth request
             logger.info("Waiting for AUTH_REQUEST...")
             
-            raw_data = await asyncio.wait_for(socket.read(4096), timeout=30.0)
-            if not raw_data:
-                logger.error("No data received, client disconnected")
-                return
-            
-            log_raw_bytes("RECEIVED", raw_data)
-            
-            # Decode
-            decoder.feed(raw_data)
+            # The request may arrive split across reads; keep feeding the
+            # decoder's buffer until a whole frame is in it
             message = decoder.decode_one()
+            while message is None:
+                raw_data = await asyncio.wait_for(socket.read(65536), timeout=30.0)
+                if not raw_data:
+                    logger.error("No data received, client disconnected")
+                    return
+                
+                log_raw_bytes("RECEIVED", raw_data)
+                decoder.feed(raw_data)
+                message = decoder.decode_one()
             
-            if message is None:
-                logger.error("Failed to decode message")
-                return
-            
-            logger.info(f"[DECODED] Type: {message.message_type.name}")
-            logger.info(f"[DECODED] Payload: {message.payload}")
+            logger.info("[DECODED] Type: %s", message.message_type.name)
+            logger.info("[DECODED] Payload: %s", message.payload)
             
             if message.message_type != MessageType.AUTH_REQUEST:
                 logger.error(f"Expected AUTH_REQUEST, got {message.message_type.name}")
@@ -83,14 +155,19 @@ def create_server(host: str, port: int, password: str, ipv6: bool = False):
             
             # Verify password
             received_hash = message.payload.get("password_hash", "")
-            expected_hash = hashlib.sha256(password.encode()).hexdigest()
             
-            logger.info(f"[AUTH] Received hash: {received_hash[:16]}...")
-            logger.info(f"[AUTH] Expected hash: {expected_hash[:16]}...")
+            logger.info(f"[AUTH] Received hash: {str(received_hash)[:16]}...")
+            logger.info(f"[AUTH] Expected hash: {expected_digest[:8].hex()}...")
             
-            if received_hash != expected_hash:
+            # The wire carries hex; decode it once and compare the raw 32-byte digests
+            try:
+                received_digest = bytes.fromhex(received_hash)
+            except (TypeError, ValueError):
+                received_digest = b""
+            
+            if not hmac.compare_digest(received_digest, expected_digest):
                 logger.error("[AUTH] ❌ Password mismatch!")
-                fail_msg = encoder.encode_auth_failure("Invalid password")
+                fail_msg = restamp(auth_failure_template, 0)
                 log_raw_bytes("SENDING AUTH_FAILURE", fail_msg)
                 await socket.write(fail_msg)
                 return
@@ -98,7 +175,7 @@ def create_server(host: str, port: int, password: str, ipv6: bool = False):
             # Send auth success
             logger.info("[AUTH] ✓ Password verified! Sending success...")
             success_msg = encoder.encode_auth_success(
-                session_token="session_" + hashlib.md5(str(remote).encode()).hexdigest()[:16],
+                session_token="session_" + secrets.token_hex(8),
                 server_info={"name": "TestServer", "version": "1.0.0", "protocol": "IPv6" if ipv6 else "IPv4"}
             )
             log_raw_bytes("SENDING AUTH_SUCCESS", success_msg)
@@ -112,7 +189,7 @@ def create_server(host: str, port: int, password: str, ipv6: bool = False):
             while True:
                 logger.info("Waiting for messages... (30s timeout)")
                 
-                raw_data = await asyncio.wait_for(socket.read(4096), timeout=30.0)
+                raw_data = await asyncio.wait_for(socket.read(65536), timeout=30.0)
                 if not raw_data:
                     logger.info("Client disconnected (no data)")
                     break
@@ -121,62 +198,48 @@ def create_server(host: str, port: int, password: str, ipv6: bool = False):
                 
                 decoder.feed(raw_data)
                 
+                # Replies to everything in this read go out in one write
+                responses = []
                 for msg in decoder.decode_all():
-                    logger.info(f"[DECODED] Type: {msg.message_type.name}")
-                    logger.info(f"[DECODED] Correlation ID: {msg.correlation_id}")
-                    logger.info(f"[DECODED] Payload: {msg.payload}")
+                    logger.info("[DECODED] Type: %s", msg.message_type.name)
+                    logger.info("[DECODED] Correlation ID: %s", msg.correlation_id)
+                    logger.info("[DECODED] Payload: %s", msg.payload)
                     
                     # Handle different message types
                     if msg.message_type == MessageType.HEARTBEAT_PING:
                         logger.info("[HEARTBEAT] Received PING, sending PONG")
                         pong = encoder.encode_heartbeat_pong()
                         log_raw_bytes("SENDING PONG", pong)
-                        await socket.write(pong)
+                        responses.append(pong)
                     
                     elif msg.message_type == MessageType.RPC_REQUEST:
                         method = msg.payload.get("method", "")
                         params = msg.payload.get("params", {})
-                        logger.info(f"[RPC] Method: {method}, Params: {params}")
+                        logger.info("[RPC] Method: %s, Params: %s", method, params)
                         
                         # Handle RPC methods
-                        if method == "listall":
-                            result = {
-                                "methods": [
-                                    {"name": "add", "description": "Add two numbers"},
-                                    {"name": "echo", "description": "Echo back message"},
-                                    {"name": "multiply", "description": "Multiply two numbers"},
-                                ],
-                                "count": 3
-                            }
-                        elif method == "add":
-                            a = params.get("a", 0)
-                            b = params.get("b", 0)
-                            result = a + b
-                            logger.info(f"[RPC] add({a}, {b}) = {result}")
-                        elif method == "multiply":
-                            x = params.get("x", 0)
-                            y = params.get("y", 0)
-                            result = x * y
-                            logger.info(f"[RPC] multiply({x}, {y}) = {result}")
-                        elif method == "echo":
-                            result = params.get("message", "")
-                            logger.info(f"[RPC] echo('{result}')")
-                        else:
+                        handler = RPC_HANDLERS.get(method)
+                        if handler is None:
                             logger.warning(f"[RPC] Unknown method: {method}")
                             error_resp = encoder.encode_rpc_error(f"Unknown method: {method}", msg.correlation_id)
                             log_raw_bytes("SENDING RPC_ERROR", error_resp)
-                            await socket.write(error_resp)
+                            responses.append(error_resp)
                             continue
                         
-                        logger.info(f"[RPC] Result: {result}")
-                        response = encoder.encode_rpc_response(result, msg.correlation_id)
+                        result = handler(params)
+                        logger.info("[RPC] Result: %s", result)
+                        template = response_templates.get(method)
+                        if template is not None:
+                            response = restamp(template, msg.correlation_id)
+                        else:
+                            response = encoder.encode_rpc_response(result, msg.correlation_id)
                         log_raw_bytes("SENDING RPC_RESPONSE", response)
-                        await socket.write(response)
+                        responses.append(response)
                     
                     elif msg.message_type == MessageType.MESSAGE:
                         msg_type = msg.payload.get("type", "")
                         data = msg.payload.get("data", {})
-                        logger.info(f"[MESSAGE] Type: '{msg_type}', Data: {data}")
+                        logger.info("[MESSAGE] Type: '%s', Data: %s", msg_type, data)
                         
                         # Echo back with response
                         response = encoder.encode_message(
@@ -184,15 +247,21 @@ def create_server(host: str, port: int, password: str, ipv6: bool = False):
                             {"received": True, "original": data, "server": "TestServer"}
                         )
                         log_raw_bytes("SENDING MESSAGE RESPONSE", response)
-                        await socket.write(response)
+                        responses.append(response)
                     
                     else:
                         logger.warning(f"[UNHANDLED] Message type: {msg.message_type.name}")
+                
+                if responses:
+                    await socket.write_many(responses)
                     
         except asyncio.TimeoutError:
             logger.warning("Timeout waiting for data")
+        except (ConnectionResetError, BrokenPipeError):
+            logger.debug("Peer reset the connection")
         except Exception as e:
-            logger.error(f"Error handling client: {e}", exc_info=True)
+            # Only pay for traceback formatting when debugging
+            logger.error(f"Error handling client: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
         finally:
             logger.info(f"Connection closed: {remote}")
             await socket.close()
@@ -200,13 +269,16 @@ def create_server(host: str, port: int, password: str, ipv6: bool = False):
     return TCPServer(host=host, port=port, handler=handle_client, ipv6=ipv6)
 
 
-async def main():
+def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Test Server with Raw Data Logging")
     parser.add_argument("--ipv6", action="store_true", help="Use IPv6 (::1)")
     parser.add_argument("--port", type=int, default=9999, help="Port number")
     parser.add_argument("--password", default="test_secret_123", help="Password")
-    args = parser.parse_args()
-    
+    parser.add_argument("--uvloop", action="store_true", help="Run on uvloop if it is installed")
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace):
     if args.ipv6:
         host = "::1"
     else:
@@ -239,7 +311,18 @@ async def main():
 
 
 if __name__ == "__main__":
+    args = parse_args()
+    
+    # Opt-in so default runs stay on the stock loop and reproducible
+    run = asyncio.run
+    if args.uvloop:
+        try:
+            import uvloop
+            run = uvloop.run
+        except ImportError:
+            logger.warning("uvloop is not installed, using the default event loop")
+    
     try:
-        asyncio.run(main())
+        run(main(args))
     except KeyboardInterrupt:
         print("\nShutdown requested...")
@@ -0,0 +1,109 @@
+"""
+Tests for Client
+
+Tests for client-side message dispatch that don't need a server.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from pydantic import ValidationError
+
+from conduit import Client, ClientDescriptor
+from conduit.protocol import ProtocolEncoder, ProtocolDecoder
+
+
+def make_client() -> Client:
+    return Client(ClientDescriptor(
+        server_host="127.0.0.1",
+        server_port=8080,
+        password="secret",
+        reconnect_enabled=False,
+    ))
+
+
+def decoded(message_type: str, data):
+    """Encode and decode a message the way it arrives from the server."""
+    decoder = ProtocolDecoder()
+    decoder.feed(ProtocolEncoder().encode_message(message_type, data))
+    return decoder.decode_one()
+
+
+class TestClientEvents:
+    """Tests for expect() / wait_for_event()."""
+    
+    @pytest.mark.asyncio
+    async def test_expect_resolves_and_handler_runs(self):
+        """Test that a waiter gets the data and handlers still run."""
+        client = make_client()
+        seen = []
+        
+        @client.on("welcome")
+        async def handle(data):
+            seen.append(data)
+        
+        future = client.expect("welcome")
+        await client._handle_message(None, decoded("welcome", {"id": 1}))
+        
+        assert await future == {"id": 1}
+        assert seen == [{"id": 1}]
+    
+    @pytest.mark.asyncio
+    async def test_wait_for_event_timeout_removes_waiter(self):
+        """Test that a timed-out waiter is discarded."""
+        client = make_client()
+        
+        with pytest.raises(asyncio.TimeoutError):
+            await client.wait_for_event("never", timeout=0.01)
+        
+        assert client._event_waiters == {}
+    
+    @pytest.mark.asyncio
+    async def test_waiter_only_resolves_once(self):
+        """Test that a waiter only sees the next message of its type."""
+        client = make_client()
+        
+        future = client.expect("tick")
+        await client._handle_message(None, decoded("tick", 1))
+        await client._handle_message(None, decoded("tick", 2))
+        
+        assert await future == 1
+        assert client._event_waiters == {}
+
+
+class TestClientHealth:
+    """Tests for get_health()."""
+    
+    def test_health_snapshot_when_disconnected(self):
+        """Test that a disconnected client reports an empty, frozen snapshot."""
+        client = make_client()
+        
+        health = client.get_health()
+        
+        assert health.connected is False
+        assert health.state == "disconnected"
+        assert health.messages_sent == 0
+        with pytest.raises(ValidationError, match="frozen"):
+            health.messages_sent = 1
+
+
+class TestClientConnect:
+    """Tests for connect() socket setup."""
+    
+    @pytest.mark.asyncio
+    async def test_socket_buffer_size_defaults_to_max_message_size(self):
+        """Test that socket_buffer_size=None sizes buffers from max_message_size."""
+        client = Client(ClientDescriptor(
+            server_host="127.0.0.1",
+            server_port=8080,
+            password="secret",
+            reconnect_enabled=False,
+            max_message_size=4 * 1024 * 1024,
+            socket_buffer_size=None,
+        ))
+        
+        connect = AsyncMock(side_effect=asyncio.TimeoutError)
+        with patch("conduit.client.TCPSocket.connect", connect):
+            assert await client.connect() is False
+        
+        assert connect.await_args.kwargs["socket_buffer_size"] == 4 * 1024 * 1024
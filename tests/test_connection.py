@@ -0,0 +1,143 @@
+"""
+Tests for Connection
+
+Tests for connection send paths that don't need a socket.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+from conduit.backpressure import AdaptiveDepth
+from conduit.connection import Connection
+from conduit.connection.pool import ConnectionPool
+from conduit.protocol import ProtocolEncoder, ProtocolDecoder
+
+
+class TestConnectionSend:
+    """Tests for queueing outgoing frames."""
+    
+    @pytest.mark.asyncio
+    async def test_send_frame_queues_bytes_unchanged(self):
+        """Test that a pre-encoded frame is queued as-is."""
+        conn = Connection(MagicMock())
+        frame = ProtocolEncoder().encode_message("state", {"players": {}})
+        
+        await conn.send_frame(frame)
+        
+        queued = conn._send_queue.get_nowait()
+        assert queued is frame
+        decoder = ProtocolDecoder()
+        decoder.feed(queued)
+        assert decoder.decode_one().get_data() == {"players": {}}
+    
+    def test_send_frame_nowait_drops_when_full(self):
+        """Test that a full send queue drops the frame instead of waiting."""
+        conn = Connection(MagicMock(), send_queue_size=1)
+        
+        assert conn.send_frame_nowait(b"first") is True
+        assert conn.send_frame_nowait(b"second") is False
+        assert conn._send_queue.size == 1
+    
+    def test_send_frame_nowait_respects_adaptive_limit(self):
+        """Test that the adaptive limit caps queued broadcast frames."""
+        conn = Connection(MagicMock(), send_queue_size=100, adaptive_send_queue=True)
+        conn._send_depth._depth = 2
+        
+        assert conn.send_frame_nowait(b"a") is True
+        assert conn.send_frame_nowait(b"b") is True
+        assert conn.send_frame_nowait(b"c") is False
+
+
+class TestAdaptiveDepth:
+    """Tests for the AIMD send queue limit."""
+    
+    def test_shrinks_on_slow_writes_and_recovers(self):
+        """Test multiplicative decrease, the floor, and additive increase."""
+        depth = AdaptiveDepth(100, min_depth=10, target_latency=0.002, alpha=1.0)
+        
+        assert depth.record(0.01) == 80
+        assert depth.record(0.01) == 64
+        for _ in range(20):
+            depth.record(0.01)
+        assert depth.depth == 10
+        
+        assert depth.record(0.0) == 11
+        for _ in range(200):
+            depth.record(0.0)
+        assert depth.depth == 100
+
+
+class StubConnection:
+    """Connection stand-in that records queued frames."""
+    
+    def __init__(self, authenticated: bool = True, full: bool = False):
+        self.is_authenticated = authenticated
+        self.full = full
+        self.frames = []
+    
+    def send_frame_nowait(self, frame):
+        if self.full:
+            return False
+        self.frames.append(frame)
+        return True
+
+
+class ClosingConnection:
+    """Connection stand-in whose stop() runs its disconnect handler, as the read loop does."""
+    
+    def __init__(self, connection_id: str):
+        self.id = connection_id
+        self._on_disconnect = None
+        self.stopped = False
+    
+    def set_disconnect_handler(self, handler):
+        self._on_disconnect = handler
+    
+    async def stop(self):
+        self.stopped = True
+        await self._on_disconnect(self)
+
+
+class TestConnectionPoolBroadcast:
+    """Tests for ConnectionPool.broadcast."""
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_encodes_once(self):
+        """Test that every recipient gets the same frame and skips are honoured."""
+        pool = ConnectionPool()
+        conns = {
+            "a": StubConnection(),
+            "b": StubConnection(),
+            "excluded": StubConnection(),
+            "anonymous": StubConnection(authenticated=False),
+            "slow": StubConnection(full=True),
+        }
+        pool._connections = dict(conns)
+        
+        count = await pool.broadcast("news", {"n": 1}, exclude=frozenset(("excluded",)))
+        
+        assert count == 2
+        assert conns["a"].frames[0] is conns["b"].frames[0]
+        assert conns["excluded"].frames == []
+        assert conns["anonymous"].frames == []
+        decoder = ProtocolDecoder()
+        decoder.feed(conns["a"].frames[0])
+        assert decoder.decode_one().get_data() == {"n": 1}
+
+
+class TestConnectionPoolClose:
+    """Tests for ConnectionPool.close_all."""
+    
+    @pytest.mark.asyncio
+    async def test_close_all_lets_disconnect_handlers_remove(self):
+        """Test that stopping connections doesn't deadlock on the pool lock."""
+        pool = ConnectionPool()
+        conns = [ClosingConnection("a"), ClosingConnection("b")]
+        for conn in conns:
+            await pool.add(conn)
+        
+        await asyncio.wait_for(pool.close_all(), timeout=1.0)
+        
+        assert all(conn.stopped for conn in conns)
+        assert pool.count == 0
@@ -4,6 +4,7 @@ Tests for Data Models
 Tests for Pydantic data models including descriptors, messages, and RPC.
 """
 
+import ssl
 import pytest
 from pydantic import ValidationError
 
@@ -84,6 +85,14 @@ class TestServerDescriptor:
         """Test that extra fields raise error."""
         with pytest.raises(ValidationError):
             ServerDescriptor(password="secret", unknown_field="value")
+    
+    def test_prebuilt_ssl_context(self):
+        """Test that a shared SSL context is kept as-is and left out of dumps."""
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        config = ServerDescriptor(password="secret", ssl_enabled=True, ssl_context=context)
+        
+        assert config.ssl_context is context
+        assert "ssl_context" not in config.model_dump()
 
 
 class TestClientDescriptor:
@@ -117,6 +126,7 @@ class TestClientDescriptor:
         assert config.reconnect_attempts == 10
         assert config.reconnect_delay == 5.0
         assert config.reconnect_delay_max == 120.0
+        assert config.reconnect_jitter is True
     
     def test_missing_required(self):
         """Test that missing required fields raise error."""
@@ -291,6 +291,42 @@ class TestRPC:
             await client.disconnect()
             await server.stop()
     
+    @pytest.mark.asyncio
+    async def test_rpc_response_type(self):
+        """Test validating a real server's result into a Pydantic model."""
+        port = get_free_port()
+        
+        server = Server(ServerDescriptor(
+            host="127.0.0.1",
+            port=port,
+            password="typed_test",
+        ))
+        
+        @server.rpc
+        async def get_user(user_id: int) -> dict:
+            """Get user by ID."""
+            return {"name": f"User_{user_id}", "age": 30}
+        
+        client = Client(ClientDescriptor(
+            server_host="127.0.0.1",
+            server_port=port,
+            password="typed_test",
+            reconnect_enabled=False,
+        ))
+        
+        await server.start()
+        
+        try:
+            await client.connect()
+            
+            result = await client.rpc.call("get_user", args=data(user_id=7), response_type=UserInfo)
+            
+            assert result == UserInfo(name="User_7", age=30)
+            
+        finally:
+            await client.disconnect()
+            await server.stop()
+    
     @pytest.mark.asyncio
     async def test_rpc_with_response_wrapper(self):
         """Test RPC with Response wrapper."""
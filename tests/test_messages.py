@@ -0,0 +1,90 @@
+"""
+Tests for Message Routing
+
+Tests for MessageRouter dispatch.
+"""
+
+import pytest
+
+from conduit.messages import MessageRouter, Message
+
+
+class TestMessageRouter:
+    """Tests for MessageRouter."""
+    
+    @pytest.mark.asyncio
+    async def test_routes_async_handler(self):
+        """Test that an async handler receives context and data."""
+        router = MessageRouter()
+        
+        @router.on("hello")
+        async def handle(ctx, data):
+            return (ctx, data)
+        
+        result = await router.route(Message(type="hello", data=1), "ctx", authenticated=True)
+        
+        assert result == ("ctx", 1)
+    
+    @pytest.mark.asyncio
+    async def test_routes_sync_handler(self):
+        """Test that plain functions are called without awaiting."""
+        router = MessageRouter()
+        router.register("hello", lambda ctx, data: data * 2, requires_auth=False)
+        
+        assert await router.route(Message(type="hello", data=2), None) == 4
+    
+    @pytest.mark.asyncio
+    async def test_priority_order(self):
+        """Test that higher priority handlers run first."""
+        router = MessageRouter()
+        calls = []
+        
+        @router.on("hello", requires_auth=False, priority=0)
+        async def low(ctx, data):
+            calls.append("low")
+        
+        @router.on("hello", requires_auth=False, priority=10)
+        async def high(ctx, data):
+            calls.append("high")
+        
+        await router.route(Message(type="hello", data=None), None)
+        
+        assert calls == ["high", "low"]
+    
+    @pytest.mark.asyncio
+    async def test_default_handler(self):
+        """Test that unknown types go to the default handler."""
+        router = MessageRouter()
+        
+        async def fallback(ctx, data):
+            return "default"
+        
+        router.set_default_handler(fallback)
+        
+        assert await router.route(Message(type="unknown", data=None), None) == "default"
+    
+    @pytest.mark.asyncio
+    async def test_requires_auth(self):
+        """Test that auth-only handlers are skipped for unauthenticated senders."""
+        router = MessageRouter()
+        
+        @router.on("secret")
+        async def handle(ctx, data):
+            return "ok"
+        
+        assert await router.route(Message(type="secret", data=None), None) is None
+    
+    @pytest.mark.asyncio
+    async def test_route_dict_error_handler_gets_message(self):
+        """Test that route_dict still hands the error handler a Message."""
+        router = MessageRouter()
+        errors = []
+        
+        @router.on("boom", requires_auth=False)
+        async def handle(ctx, data):
+            raise RuntimeError("boom")
+        
+        router.set_error_handler(lambda e, msg, ctx: errors.append((msg.type, msg.data)))
+        
+        assert await router.route_dict("boom", 42, None) is None
+        assert errors == [("boom", 42)]
@@ -0,0 +1,62 @@
+"""
+Tests for ClientPool
+
+Tests for pool fan-out using stub clients.
+"""
+
+import asyncio
+import pytest
+
+from conduit.pool import ClientPool
+
+
+class StubClient:
+    """Client stand-in that records sends and can be made to fail."""
+    
+    def __init__(self, fail: bool = False, connected: bool = True):
+        self.fail = fail
+        self.is_connected = connected
+        self.sent = []
+        self.disconnected = False
+    
+    async def send(self, message_type, data):
+        await asyncio.sleep(0)
+        if self.fail:
+            raise ConnectionError("send failed")
+        self.sent.append((message_type, data))
+    
+    async def disconnect(self):
+        if self.fail:
+            raise ConnectionError("disconnect failed")
+        self.disconnected = True
+
+
+def make_pool(clients) -> ClientPool:
+    pool = ClientPool(servers=[("127.0.0.1", 8080)], password="secret")
+    pool._clients = list(clients)
+    return pool
+
+
+class TestClientPool:
+    """Tests for ClientPool fan-out."""
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_counts_successful_sends(self):
+        """Test that failing and disconnected clients are not counted."""
+        ok, failing, offline = StubClient(), StubClient(fail=True), StubClient(connected=False)
+        pool = make_pool([ok, failing, offline])
+        
+        assert await pool.broadcast("news", {"n": 1}) == 1
+        assert ok.sent == [("news", {"n": 1})]
+        assert offline.sent == []
+    
+    @pytest.mark.asyncio
+    async def test_disconnect_all_ignores_errors(self):
+        """Test that one failing disconnect does not stop the rest."""
+        failing, ok = StubClient(fail=True), StubClient()
+        pool = make_pool([failing, ok])
+        
+        await pool.disconnect_all()
+        
+        assert ok.disconnected
+        assert pool._clients == []
@@ -91,6 +91,17 @@ class TestMessageHeader:
         with pytest.raises(ValueError, match="Invalid magic"):
             MessageHeader.from_bytes(bad_data)
     
+    def test_from_bytes_reads_buffer_in_place(self):
+        """Test parsing the header at the start of a longer bytearray."""
+        original = MessageHeader.create(message_type=MessageType.MESSAGE, content_length=3)
+        buffer = bytearray(original.to_bytes() + b"abc")
+        
+        restored = MessageHeader.from_bytes(buffer)
+        
+        assert restored.magic == original.magic
+        assert restored.content_length == 3
+        assert len(buffer) == HEADER_SIZE + 3
+    
     def test_short_data_raises_error(self):
         """Test that short data raises error."""
         with pytest.raises(ValueError, match="Header too short"):
@@ -190,6 +201,18 @@ class TestProtocolEncoder:
         assert len(close) == HEADER_SIZE
         assert len(close_ack) == HEADER_SIZE
     
+    def test_control_frames_are_prebuilt(self):
+        """Test that heartbeat frames are reused and still decode."""
+        encoder = ProtocolEncoder()
+        decoder = ProtocolDecoder()
+        
+        ping = encoder.encode_heartbeat_ping()
+        
+        assert ping is ProtocolEncoder().encode_heartbeat_ping()
+        decoder.feed(ping + encoder.encode_heartbeat_pong())
+        assert decoder.decode_one().message_type == MessageType.HEARTBEAT_PING
+        assert decoder.decode_one().message_type == MessageType.HEARTBEAT_PONG
+    
     def test_encode_auth_messages(self):
         """Test encoding auth messages."""
         encoder = ProtocolEncoder()
@@ -407,6 +430,41 @@ class TestRoundTrip:
         assert resp_msg.correlation_id == corr_id
         assert resp_msg.is_success()
         assert resp_msg.get_rpc_result() == {"sum": 30}
+    
+    def test_raw_bytes_round_trip(self):
+        """Test that bytes payloads survive without hex/base64 encoding."""
+        encoder = ProtocolEncoder()
+        decoder = ProtocolDecoder()
+        
+        data = {"filename": "a.bin", "content": bytes(range(256))}
+        decoder.feed(encoder.encode_message("file", data))
+        
+        assert decoder.decode_one().get_data() == data
+    
+    def test_encoder_reusable_after_error(self):
+        """Test that a failed encode does not corrupt the next one."""
+        encoder = ProtocolEncoder()
+        decoder = ProtocolDecoder()
+        
+        with pytest.raises(TypeError):
+            encoder.encode_message("bad", {"ok": 1, "obj": object()})
+        
+        decoder.feed(encoder.encode_message("good", {"ok": 1}))
+        
+        assert decoder.decode_one().get_data() == {"ok": 1}
+    
+    def test_reused_frame_buffer_shrinks(self):
+        """Test that a small frame after a large one carries no leftover bytes."""
+        encoder = ProtocolEncoder()
+        decoder = ProtocolDecoder()
+        
+        large = encoder.encode_message("big", "x" * 10000)
+        small = encoder.encode_message("small", 1)
+        
+        assert len(small) < 100
+        decoder.feed(large + small)
+        assert decoder.decode_one().get_data() == "x" * 10000
+        assert decoder.decode_one().get_data() == 1
 
 
 class TestCompression:
@@ -444,6 +502,52 @@ class TestCompression:
         
         assert message is not None
         assert not message.is_compressed()
+    
+    def test_below_threshold_not_compressed(self):
+        """Test that payloads under one MTU are sent uncompressed."""
+        encoder = ProtocolEncoder(enable_compression=True)
+        decoder = ProtocolDecoder()
+        
+        decoder.feed(encoder.encode_message("medium", {"data": "x" * 1200}))
+        
+        assert not decoder.decode_one().is_compressed()
+    
+    def test_unknown_algorithm_rejected(self):
+        """Test that an unknown compression algorithm raises."""
+        with pytest.raises(ValueError):
+            ProtocolEncoder(enable_compression=True, compression_algorithm="lz4")
+    
+    def test_zstd_round_trip(self):
+        """Test zstd compression when the zstandard package is installed."""
+        pytest.importorskip("zstandard")
+        encoder = ProtocolEncoder(enable_compression=True, compression_algorithm="zstd")
+        decoder = ProtocolDecoder()
+        
+        large_data = {"data": "x" * 10000}
+        decoder.feed(encoder.encode_message("large", large_data))
+        message = decoder.decode_one()
+        
+        assert message.flags & MessageFlags.ZSTD
+        assert message.get_data() == large_data
+    
+    @pytest.mark.asyncio
+    async def test_async_round_trip_offloads_large_payloads(self):
+        """Test that async encode/decode match the sync path around the offload threshold."""
+        encoder = ProtocolEncoder(enable_compression=True)
+        decoder = ProtocolDecoder()
+        
+        small = {"data": "y" * 2000}
+        large = {"data": "x" * 200000}
+        decoder.feed(await encoder.encode_message_async("small", small))
+        decoder.feed(await encoder.encode_message_async("large", large))
+        decoder.feed(await encoder.encode_message_async("tail", 1))
+        
+        messages = await decoder.decode_all_async()
+        
+        assert [m.get_message_type_str() for m in messages] == ["small", "large", "tail"]
+        assert messages[1].is_compressed()
+        assert messages[1].get_data() == large
+        assert messages[2].get_data() == 1
 
 
 if __name__ == "__main__":
@@ -0,0 +1,173 @@
+"""
+Tests for the RPC Client Interface
+
+Tests for RPC.call result handling using a stub client.
+"""
+
+import asyncio
+import pytest
+from dataclasses import dataclass
+from pydantic import BaseModel
+
+from conduit.connection.pending import PendingRPCTable
+from conduit.rpc import RPC
+from conduit.rpc.rpc_class import RPCError
+
+
+class TimeInfo(BaseModel):
+    """Sample typed response."""
+    timestamp: float
+    formatted: str
+
+
+@dataclass
+class Point:
+    """Sample dataclass response."""
+    x: int
+    y: int
+
+
+class StubClient:
+    """Minimal client that answers every RPC with a canned response."""
+    
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+    
+    async def _send_rpc_request(self, method, params):
+        self.requests.append((method, params))
+        return len(self.requests)
+    
+    async def _wait_for_rpc_response(self, correlation_id):
+        return self.response
+
+
+class TestRPCCall:
+    """Tests for RPC.call."""
+    
+    @pytest.mark.asyncio
+    async def test_returns_data(self):
+        """Test that wrapped data is unwrapped."""
+        rpc = RPC(StubClient({"success": True, "data": {"a": 1}}))
+        
+        assert await rpc.call("method") == {"a": 1}
+    
+    @pytest.mark.asyncio
+    async def test_merges_args_and_kwargs(self):
+        """Test that args and kwargs are merged into params."""
+        client = StubClient({"success": True, "data": None})
+        rpc = RPC(client)
+        
+        await rpc.call("method", args={"a": 1}, b=2)
+        
+        assert client.requests == [("method", {"a": 1, "b": 2})]
+    
+    @pytest.mark.asyncio
+    async def test_error_response_raises(self):
+        """Test that an error response raises RPCError."""
+        rpc = RPC(StubClient({"success": False, "error": "boom", "code": 5000}))
+        
+        with pytest.raises(RPCError) as exc_info:
+            await rpc.call("method")
+        
+        assert exc_info.value.code == 5000
+    
+    @pytest.mark.asyncio
+    async def test_response_type_model(self):
+        """Test validating the result into a Pydantic model."""
+        rpc = RPC(StubClient({
+            "success": True,
+            "data": {"timestamp": 1.5, "formatted": "12:00:00"},
+        }))
+        
+        result = await rpc.call("get_time", response_type=TimeInfo)
+        
+        assert isinstance(result, TimeInfo)
+        assert result.formatted == "12:00:00"
+    
+    @pytest.mark.asyncio
+    async def test_response_type_dataclass(self):
+        """Test validating the result into a dataclass."""
+        rpc = RPC(StubClient({"success": True, "result": {"x": 1, "y": 2}}))
+        
+        result = await rpc.call("point", response_type=Point)
+        
+        assert result == Point(x=1, y=2)
+    
+    @pytest.mark.asyncio
+    async def test_server_envelope_unwrapped(self):
+        """Test that the dispatcher envelope nested in "result" is unwrapped."""
+        rpc = RPC(StubClient({
+            "success": True,
+            "result": {"success": True, "data": {"timestamp": 1.5, "formatted": "12:00:00"}},
+        }))
+        
+        result = await rpc.call("get_time", response_type=TimeInfo)
+        
+        assert result == TimeInfo(timestamp=1.5, formatted="12:00:00")
+    
+    @pytest.mark.asyncio
+    async def test_server_error_envelope_raises(self):
+        """Test that a nested error envelope raises RPCError."""
+        rpc = RPC(StubClient({
+            "success": True,
+            "result": {"success": False, "error": "boom", "code": 404},
+        }))
+        
+        with pytest.raises(RPCError) as exc_info:
+            await rpc.call("method")
+        
+        assert exc_info.value.code == 404
+    
+    @pytest.mark.asyncio
+    async def test_response_type_mismatch_raises(self):
+        """Test that a result not matching response_type raises RPCError."""
+        rpc = RPC(StubClient({"success": True, "data": {"formatted": "x"}}))
+        
+        with pytest.raises(RPCError):
+            await rpc.call("get_time", response_type=TimeInfo)
+
+
+class TestPendingRPCTable:
+    """Tests for PendingRPCTable."""
+    
+    @pytest.mark.asyncio
+    async def test_add_get_pop(self):
+        """Test basic tracking of a future."""
+        table = PendingRPCTable(8)
+        future = asyncio.get_running_loop().create_future()
+        
+        table.add(1, future)
+        
+        assert table.get(1) is future
+        assert len(table) == 1
+        assert table.pop(1) is future
+        assert table.get(1) is None
+        assert len(table) == 0
+    
+    @pytest.mark.asyncio
+    async def test_slot_collision_uses_overflow(self):
+        """Test that IDs sharing a slot are both tracked."""
+        table = PendingRPCTable(8)
+        loop = asyncio.get_running_loop()
+        first, second = loop.create_future(), loop.create_future()
+        
+        table.add(3, first)
+        table.add(11, second)  # same slot as 3
+        
+        assert table.get(3) is first
+        assert table.get(11) is second
+        assert table.pop(11) is second
+        assert table.get(3) is first
+    
+    @pytest.mark.asyncio
+    async def test_stale_id_does_not_match(self):
+        """Test that an old ID does not resolve a newer request in its slot."""
+        table = PendingRPCTable(8)
+        future = asyncio.get_running_loop().create_future()
+        
+        table.add(11, future)
+        
+        assert table.get(3) is None
+        assert table.pop(3) is None
+        assert table.get(11) is future
@@ -6,9 +6,11 @@ Tests for TCP socket, connection state machine, and authentication.
 
 import pytest
 import asyncio
+import socket
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from conduit.transport import ConnectionState, ConnectionStateMachine, AuthHandler
+from conduit.transport.tcp_socket import TCPSocket, TCPServer
 from conduit.transport.connection_state import InvalidStateTransition
 from conduit.transport.auth import (
     hash_password,
@@ -265,5 +267,86 @@ class TestAuthHandler:
         assert handler.get_session(token) is None
 
 
+class TestTCPSocket:
+    """Tests for TCPSocket."""
+    
+    @pytest.mark.asyncio
+    async def test_connect_sets_nodelay(self):
+        """Test that connected sockets have Nagle disabled."""
+        server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        
+        async with server:
+            conn = await TCPSocket.connect("127.0.0.1", port)
+            sock = conn._writer.get_extra_info('socket')
+            
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) != 0
+            
+            await conn.close()
+    
+    @pytest.mark.asyncio
+    async def test_connect_sets_buffer_sizes(self):
+        """Test that connect() applies socket_buffer_size to the socket."""
+        size = 40960  # Unlike any default, so an ignored option shows up
+        
+        # The kernel may round or double the request; read back what it
+        # reports for the same request on a fresh socket
+        with socket.socket() as probe:
+            probe.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, size)
+            probe.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, size)
+            expected_snd = probe.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+            expected_rcv = probe.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        
+        server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        
+        async with server:
+            conn = await TCPSocket.connect("127.0.0.1", port, socket_buffer_size=size)
+            sock = conn._writer.get_extra_info('socket')
+            
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF) == expected_snd
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) == expected_rcv
+            
+            await conn.close()
+    
+    @pytest.mark.asyncio
+    async def test_write_many_single_writelines(self):
+        """Test that a batch is handed to the transport in one call."""
+        writer = MagicMock()
+        writer.get_extra_info.return_value = None
+        writer.drain = AsyncMock()
+        conn = TCPSocket(MagicMock(), writer)
+        
+        await conn.write_many([b"frame1", b"frame2", b"frame3"])
+        
+        writer.writelines.assert_called_once_with([b"frame1", b"frame2", b"frame3"])
+        writer.write.assert_not_called()
+        writer.drain.assert_awaited_once()
+
+
+class TestTCPServer:
+    """Tests for TCPServer."""
+    
+    @pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="SO_REUSEPORT not available")
+    @pytest.mark.asyncio
+    async def test_reuse_port(self):
+        """Test that two servers can share a port with reuse_port."""
+        async def handler(conn):
+            pass
+        
+        first = TCPServer("127.0.0.1", 0, handler, reuse_port=True)
+        await first.start()
+        port = first._server.sockets[0].getsockname()[1]
+        second = TCPServer("127.0.0.1", port, handler, reuse_port=True)
+        
+        try:
+            await second.start()
+            sock = second._server.sockets[0]
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT) != 0
+        finally:
+            await second.stop()
+            await first.stop()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
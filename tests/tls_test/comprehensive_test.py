@@ -23,6 +23,7 @@ logging.basicConfig(
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from conduit import Server, ServerDescriptor, Client, ClientDescriptor
+from conduit.transport import TLSConfig, create_server_ssl_context
 
 # Test results
 results = {}
@@ -73,13 +74,19 @@ async def test_tls_connection():
         results['tls'] = 'skipped'
         return
     
+    # Parse the certificate once; the context can be shared by any number of servers
+    ssl_context = create_server_ssl_context(TLSConfig(
+        enabled=True,
+        cert_file=cert_file,
+        key_file=key_file,
+    ))
+    
     server = Server(ServerDescriptor(
         host="0.0.0.0",
         port=9996,
         password="tlstest",
         ssl_enabled=True,
-        ssl_cert_file=cert_file,
-        ssl_key_file=key_file,
+        ssl_context=ssl_context,
     ))
     
     received_ping = asyncio.Event()
@@ -150,6 +157,12 @@ async def test_rate_limiting():
         nonlocal message_count
         message_count += 1
     
+    done = asyncio.Event()
+    
+    @server.on("done")
+    async def on_done(conn, data):
+        done.set()
+    
     await server.start()
     print(f"✓ Server started with rate limit: 5 msg/s")
     
@@ -163,11 +176,19 @@ async def test_rate_limiting():
     assert connected, "Failed to connect"
     print("✓ Client connected")
     
-    # Send 20 messages rapidly (should trigger rate limiting)
-    for i in range(20):
-        await client.send("spam", {"n": i})
-    
-    await asyncio.sleep(0.5)  # Wait for processing
+    # Send 20 messages at once (should trigger rate limiting)
+    await asyncio.gather(*(client.send("spam", {"n": i}) for i in range(20)))
+    
+    # Messages are handled in order, so once "done" gets through every spam
+    # message has been counted. It is rate limited too, so resend it until a
+    # token frees up (one every 0.2s at 5 msg/s).
+    for _ in range(10):
+        await client.send("done", {})
+        try:
+            await asyncio.wait_for(done.wait(), timeout=0.25)
+            break
+        except asyncio.TimeoutError:
+            pass
     
     print(f"  Sent 20 messages, server received: {message_count}")
     